@@ -0,0 +1,189 @@
+# benchmarks/ranking_server.py
+# 랭킹 서버 로컬 대역: Supabase(PostgREST)의 rankings 테이블 API 중 게임이 쓰는 부분만 흉내 냅니다.
+#   GET  /rest/v1/rankings?select=a,b&order=col.desc.nullslast&limit=10&offset=0
+#   POST /rest/v1/rankings?on_conflict=submission_id  (행 하나 또는 행 리스트, Prefer: resolution=ignore-duplicates)
+# 사용 예 (저장소 루트에서):
+#   python -m benchmarks.ranking_server --rows 50000   # 가짜 기록 5만 개로 시작
+#   SUPABASE_URL=http://127.0.0.1:8765 python main.py  # 게임이 이 서버를 쓰게 함
+#   python -m benchmarks.ranking_server --fail-rate 0.5 --latency 3000  # 불안정한 연결 흉내 (점수 대기열 재시도 확인용)
+#   python -m benchmarks.ranking_server --no-dedup-column  # submission_id 컬럼이 없는 예전 테이블 흉내 (400으로 거절)
+# 요청마다 걸린 시간과 응답 크기를 출력하므로 테이블 크기에 따른 차이를 바로 볼 수 있습니다.
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+TABLE_PATH = '/rest/v1/rankings'
+COLUMNS = ("id", "name", "levels", "kills", "bosses", "difficulty_score", "survival_time", "submission_id")
+NUMERIC_COLUMNS = ("levels", "kills", "bosses", "difficulty_score", "survival_time")
+
+def validate(row, dedup_column=True):
+    """PostgREST가 400으로 거절할 행이면 그 이유 (요청 전체가 거절됨)"""
+    for col in row:
+        if col not in COLUMNS or (col == "submission_id" and not dedup_column):
+            return f"Could not find the '{col}' column of 'rankings'"
+    for col in NUMERIC_COLUMNS:
+        value = row.get(col)
+        if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+            return f"invalid input syntax for type numeric: {value!r}"
+    return None
+
+class RankingTable:
+    def __init__(self):
+        self.rows = []
+        self.unique = {} # submission_id -> 행 (unique 제약 흉내)
+        self.lock = threading.Lock()
+
+    def seed(self, count, rng=None):
+        rng = rng or random.Random(0)
+        for _ in range(count):
+            levels = rng.randint(1, 80)
+            self.insert({
+                "name": f"player{rng.randrange(100000)}",
+                "levels": levels,
+                "kills": rng.randint(0, levels * 150),
+                "bosses": rng.randint(0, levels // 10),
+                "difficulty_score": round(rng.uniform(0, levels * 12.5), 2),
+                "survival_time": round(rng.uniform(10, levels * 30), 2),
+            })
+
+    def insert(self, row, ignore_duplicates=False):
+        """넣은 행을 반환합니다. submission_id가 겹치면 ignore_duplicates일 때 None, 아니면 ValueError"""
+        with self.lock:
+            row = {col: row.get(col) for col in COLUMNS if col != "id"}
+            key = row.get("submission_id")
+            if key is not None and key in self.unique:
+                if ignore_duplicates: return None
+                raise ValueError(f"duplicate key value violates unique constraint: {key}")
+            row["id"] = len(self.rows) + 1
+            self.rows.append(row)
+            if key is not None: self.unique[key] = row
+            return row
+
+    def select(self, columns, order, limit, offset):
+        with self.lock:
+            rows = list(self.rows)
+        # order=a.desc.nullslast,b.asc -> 뒤쪽 키부터 안정 정렬
+        for term in reversed(order):
+            col, _, mods = term.partition('.')
+            mods = mods.split('.')
+            desc = 'desc' in mods
+            nulls_last = 'nullslast' in mods if desc else 'nullsfirst' not in mods # PostgreSQL 기본: desc면 NULL이 앞
+            present = [r for r in rows if r.get(col) is not None]
+            missing = [r for r in rows if r.get(col) is None]
+            present.sort(key=lambda r: r[col], reverse=desc)
+            rows = present + missing if nulls_last else missing + present
+        rows = rows[offset:offset + limit if limit is not None else None]
+        if columns != ['*']:
+            rows = [{col: r.get(col) for col in columns} for r in rows]
+        return rows
+
+class RankingHandler(BaseHTTPRequestHandler):
+    table = None
+    fail_rate = 0.0 # 이 확률로 요청을 500으로 실패시킴
+    latency = 0.0   # 응답 전에 기다릴 초
+    dedup_column = True # False면 submission_id 컬럼/unique 제약이 없는 테이블처럼 동작
+
+    def _flaky(self):
+        if self.latency: time.sleep(self.latency)
+        if random.random() < self.fail_rate:
+            self._send(500, {"message": "simulated failure"})
+            print(f"{self.command:<4} 실패 흉내 (500)")
+            return True
+        return False
+
+    def _send(self, status, body):
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.send_header('Access-Control-Allow-Origin', '*') # 웹 빌드(브라우저 fetch)에서도 쓸 수 있게
+        self.end_headers()
+        self.wfile.write(data)
+        return len(data)
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
+        self.send_header('Access-Control-Allow-Headers', 'apikey, Authorization, Content-Type, Prefer')
+        self.end_headers()
+
+    def do_GET(self):
+        started = time.perf_counter()
+        url = urlsplit(self.path)
+        if url.path != TABLE_PATH: return self._send(404, {"message": "not found"})
+        if self._flaky(): return
+        query = parse_qs(url.query)
+        try:
+            columns = query.get('select', ['*'])[0].split(',')
+            order = query['order'][0].split(',') if 'order' in query else []
+            limit = int(query['limit'][0]) if 'limit' in query else None
+            offset = int(query.get('offset', ['0'])[0])
+        except ValueError as e:
+            return self._send(400, {"message": str(e)})
+        rows = self.table.select(columns, order, limit, offset)
+        nbytes = self._send(200, rows)
+        print(f"GET  {len(rows):>6}행 {nbytes / 1024:>8.1f}KB {(time.perf_counter() - started) * 1000:>7.1f}ms  {url.query}")
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != TABLE_PATH: return self._send(404, {"message": "not found"})
+        try:
+            body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'null')
+        except ValueError as e:
+            return self._send(400, {"message": str(e)})
+        if self._flaky(): return
+        rows = body if isinstance(body, list) else [body]
+        if not self.dedup_column and 'on_conflict' in parse_qs(url.query):
+            return self._send(400, {"message": "there is no unique or exclusion constraint matching the ON CONFLICT specification"})
+        for r in rows:
+            reason = validate(r, self.dedup_column) if isinstance(r, dict) else "row must be an object"
+            if reason:
+                print(f"POST 거절 (400): {reason}")
+                return self._send(400, {"message": reason})
+        ignore = 'resolution=ignore-duplicates' in self.headers.get('Prefer', '')
+        try:
+            inserted = [r for r in (self.table.insert(r, ignore) for r in rows if isinstance(r, dict)) if r is not None]
+        except ValueError as e:
+            return self._send(409, {"message": str(e)})
+        if 'return=minimal' in self.headers.get('Prefer', ''):
+            self.send_response(201)
+            self.send_header('Content-Length', '0')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.end_headers()
+        else:
+            self._send(201, inserted)
+        print(f"POST {len(inserted):>6}/{len(rows)}행 (전체 {len(self.table.rows)}행)")
+
+    def log_message(self, format, *args):
+        pass # 요청 로그는 위에서 직접 출력
+
+def serve(port=8765, rows=0, fail_rate=0.0, latency_ms=0, dedup_column=True):
+    table = RankingTable()
+    table.seed(rows)
+    handler = type('Handler', (RankingHandler,), {'table': table, 'fail_rate': fail_rate, 'latency': latency_ms / 1000.0,
+                                                  'dedup_column': dedup_column})
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    return server, table
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="로컬 랭킹 서버 (Supabase rankings 테이블 대역)")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--rows', type=int, default=1000, help="시작할 때 채워 둘 가짜 기록 수")
+    parser.add_argument('--fail-rate', type=float, default=0.0, help="요청을 500으로 실패시킬 확률 (0~1)")
+    parser.add_argument('--latency', type=int, default=0, help="응답마다 기다릴 ms")
+    parser.add_argument('--no-dedup-column', action='store_true', help="submission_id 컬럼이 없는 테이블처럼 동작")
+    args = parser.parse_args(argv)
+    server, table = serve(args.port, args.rows, args.fail_rate, args.latency, not args.no_dedup_column)
+    print(f"랭킹 대역 서버: http://127.0.0.1:{args.port} ({len(table.rows)}행) - SUPABASE_URL로 지정하세요")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == '__main__':
+    main()
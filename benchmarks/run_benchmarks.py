@@ -0,0 +1,219 @@
+# benchmarks/run_benchmarks.py
+# 시나리오별로 게임 로직을 헤드리스로 돌리며 구간별 틱 시간(p50/p95/p99)을 측정해 JSON으로 저장합니다.
+# 사용 예 (저장소 루트에서):
+#   python -m benchmarks.run_benchmarks                       # 모든 시나리오
+#   python -m benchmarks.run_benchmarks -s dense_horde --draw # 특정 시나리오 + 그리기까지 측정
+#   python -m benchmarks.run_benchmarks --replay replays/last_run.json # 실제로 플레이한 판을 그대로 재생
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+SCENARIO_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scenarios.json')
+
+def load_scenarios(path=SCENARIO_FILE):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+# ----------------------------------------------------
+# 시나리오 적용
+# ----------------------------------------------------
+def _slime_factories():
+    import config
+    from enemies.slime import Slime
+    from enemies.mint_slime import MintSlime
+    from enemies.shooter_slime import ShooterSlime
+    from enemies.boss_minion_slime import BossMinionSlime
+    from enemies.boss_gunner_slime import BossGunnerSlime
+    return {
+        'Slime': lambda x, y, hp: Slime(x, y, config.SLIME_RADIUS, config.SLIME_GREEN, config.SLIME_SPEED, hp),
+        'MintSlime': MintSlime,
+        'ShooterSlime': ShooterSlime,
+        'BossMinionSlime': BossMinionSlime,
+        'BossGunnerSlime': BossGunnerSlime,
+    }
+
+def _upgrade_to(item, level):
+    """선택지를 돌아가며 골라 level까지 올립니다. (시나리오마다 같은 결과)"""
+    i = 0
+    while item.level < level:
+        options = item.get_level_up_options() if hasattr(item, 'get_level_up_options') else item.generate_upgrade_options()
+        if not options: break
+        item.apply_upgrade(options[i % len(options)])
+        i += 1
+
+def setup_scenario(game_state, scenario):
+    import config
+    from weapons.dagger_launcher import DaggerLauncher
+    from weapons.flail_weapon import FlailWeapon
+    from weapons.whip_weapon import WhipWeapon
+    from weapons.bat_controller import BatController
+    from skills.storm_skill import StormSkill
+    from enemies.boss_slime import BossSlime
+
+    player = game_state.player
+    if scenario.get('invincible', True):
+        player.hp = player.max_hp = 10**9
+    game_state.current_slime_max_hp = scenario.get('slime_hp', config.SLIME_INITIAL_BASE_HP)
+    if not scenario.get('spawning', True):
+        game_state.slime_spawn_timer = -10**9 # 자연 스폰 끄기
+
+    weapons = {'DaggerLauncher': DaggerLauncher, 'FlailWeapon': FlailWeapon, 'WhipWeapon': WhipWeapon, 'BatController': BatController}
+    for name, level in scenario.get('loadout', {}).items():
+        if name == 'StormSkill':
+            player.special_skill = StormSkill(player)
+            _upgrade_to(player.special_skill, level)
+            continue
+        player.acquire_new_weapon(weapons[name])
+        weapon = next(w for w in player.active_weapons if isinstance(w, weapons[name]))
+        _upgrade_to(weapon, level)
+
+    factories = _slime_factories()
+    r_min, r_max = scenario.get('spawn_radius', [300, 2000])
+    for name, count in scenario.get('slimes', {}).items():
+        for _ in range(count):
+            angle = random.uniform(0, 2 * math.pi)
+            dist = random.uniform(r_min, r_max)
+            x = (player.world_x + math.cos(angle) * dist) % config.MAP_WIDTH
+            y = (player.world_y + math.sin(angle) * dist) % config.MAP_HEIGHT
+            game_state.slimes.append(factories[name](x, y, game_state.current_slime_max_hp))
+
+    boss = scenario.get('boss')
+    if boss:
+        b = BossSlime((player.world_x + 300) % config.MAP_WIDTH, (player.world_y + 300) % config.MAP_HEIGHT,
+                      game_state.current_slime_max_hp, boss.get('index', 0))
+        if boss.get('phase2'):
+            b.is_phase2 = True
+            b.speed *= config.BOSS_PHASE2_SPEED_MULT
+        game_state.boss_slimes.append(b)
+        game_state.boss_active = True
+
+# ----------------------------------------------------
+# 실행
+# ----------------------------------------------------
+def run_scenario(scenario, draw=False):
+    import core.state as state
+    import core.engine as engine
+    from core.input import KiteAI, ScriptedInput
+    from core.profiler import TickProfiler
+
+    seed = scenario.get('seed', 0)
+    source = KiteAI(seed=seed) if scenario.get('input') == 'kite' else ScriptedInput([])
+    engine.start_headless_game(source, seed, load_assets=draw)
+    setup_scenario(state, scenario)
+
+    screen = None
+    if draw:
+        import pygame
+        import core.render as render
+        screen = pygame.display.get_surface()
+
+    profiler = TickProfiler()
+    warmup = scenario.get('warmup', 60)
+    ticks = scenario.get('ticks', 600)
+    alive = True
+    for tick in range(warmup + ticks):
+        engine.apply_input(state, source)
+        profiler.start()
+        alive = engine.step(state, profiler)
+        if screen is not None:
+            for wpn in state.player.active_weapons: wpn.draw(screen, state.camera_obj.world_x, state.camera_obj.world_y)
+            render.draw_entities(screen, state, 1.0, state.camera_obj.world_x, state.camera_obj.world_y)
+            profiler.lap('draw')
+        if tick < warmup: profiler.discard_tick() # 워밍업 틱은 버림
+        else: profiler.end_tick()
+        if not alive: break
+
+    return {
+        'description': scenario.get('description', ''),
+        'ticks_measured': len(profiler.samples.get('total', [])),
+        'alive': alive,
+        'sections_ms': profiler.summary(),
+        'entities_end': {name: len(pool) for name, pool in state.get_entities_dict().items()},
+    }
+
+def run_replay(path):
+    import core.state as state
+    from core.replay import load_replay, play
+    from core.profiler import TickProfiler
+
+    profiler = TickProfiler()
+    result = play(load_replay(path), profiler)
+    return {
+        'description': f"리플레이 {os.path.basename(path)}",
+        'ticks_measured': result['ticks'],
+        'alive': result['alive'],
+        'matches_recording': result['matches_recording'], # False면 로직이 바뀐 것 (시간 비교도 의미가 약해짐)
+        'sections_ms': profiler.summary(),
+        'entities_end': {name: len(pool) for name, pool in state.get_entities_dict().items()},
+    }
+
+def _meta(draw):
+    import config
+    import core.horde as horde
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, timeout=5).stdout.strip()
+    except Exception:
+        commit = ''
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': commit,
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'numpy_horde': horde.slime_horde is not None,
+        'draw': draw,
+        'fps': config.FPS,
+    }
+
+def print_table(name, result):
+    print(f"\n[{name}] {result['description']} ({result['ticks_measured']}틱)")
+    print(f"  {'구간':<12}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}  (ms/틱)")
+    sections = sorted(result['sections_ms'].items(), key=lambda kv: (kv[0] == 'total', -kv[1]['p50']))
+    for section, s in sections:
+        print(f"  {section:<12}{s['p50']:>9.3f}{s['p95']:>9.3f}{s['p99']:>9.3f}{s['max']:>9.3f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="시나리오 기반 틱 벤치마크")
+    parser.add_argument('-s', '--scenario', action='append', help="실행할 시나리오 이름 (여러 번 지정 가능, 생략 시 전부)")
+    parser.add_argument('--file', default=SCENARIO_FILE, help="시나리오 JSON 파일")
+    parser.add_argument('--out', default='bench_results.json', help="결과 JSON 경로")
+    parser.add_argument('--draw', action='store_true', help="더미 디스플레이에 그리기까지 포함해 측정")
+    parser.add_argument('--replay', action='append', default=[], help="core.replay로 기록한 판 파일 (여러 번 지정 가능, -s 없이 주면 시나리오는 건너뜀)")
+    args = parser.parse_args(argv)
+
+    if args.draw:
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        import pygame
+        import config
+        pygame.init()
+        pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+
+    scenarios = load_scenarios(args.file)
+    if args.scenario:
+        scenarios = [s for s in scenarios if s['name'] in args.scenario]
+    elif args.replay:
+        scenarios = []
+
+    results = {'meta': _meta(args.draw), 'scenarios': {}}
+    for scenario in scenarios:
+        result = run_scenario(scenario, draw=args.draw)
+        results['scenarios'][scenario['name']] = result
+        print_table(scenario['name'], result)
+    for path in args.replay:
+        name = 'replay:' + os.path.basename(path)
+        result = run_replay(path)
+        results['scenarios'][name] = result
+        print_table(name, result)
+        if not result['matches_recording']: print("  ⚠️ 재생 결과가 기록과 다릅니다 (게임 로직이 바뀌었거나 numpy 사용 여부가 다름)")
+
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {args.out}")
+
+if __name__ == '__main__':
+    main()
@@ -1,9 +1,22 @@
 # config.py
+import os
 import pygame
 import math
 
 # --- FPS 정의 ---
-FPS = 60
+FPS = 60                     # 시뮬레이션 틱 속도 (모든 타이머/수명은 이 틱 수 기준)
+RENDER_FPS = 60              # 화면 그리기 상한 (약한 기기는 30으로 낮춰도 게임 속도는 그대로)
+MAX_SIM_STEPS_PER_FRAME = 5  # 한 프레임에 따라잡을 최대 틱 수 (넘치면 버려서 느려진 기기가 더 밀리지 않게)
+RENDER_INTERPOLATION = True  # 틱 사이 위치를 보간해서 그리기
+HEADLESS = False             # 화면 없이 시뮬레이션만 돌리는 중인지 (core.engine.run_headless가 켬)
+STARTUP_REPORT = False       # 켜면 워밍업이 끝날 때 시작 타임라인(단계/모듈별 import 시간)을 출력
+STARTUP_WARMUP_BUDGET_MS = 8 # 메뉴 화면에서 프레임마다 미리 읽기에 쓸 시간
+REPLAY_RECORDING = True      # 판마다 시드+입력을 기록 (python -m core.replay 로 재생)
+REPLAY_PATH = 'replays/last_run.json'
+ASSET_BUNDLE_PATH = 'image/sprites.bundle' # python -m core.bundle 로 만듦 (없으면 PNG를 직접 읽음)
+RANKING_TOP_N = 10           # 랭킹 화면에 보여 줄 카테고리별 상위 기록 수 (서버에서 이만큼만 받음)
+RANKING_CACHE_SECONDS = 60   # 받아 둔 카테고리 랭킹을 다시 요청하지 않고 쓰는 시간
+TEXT_CACHE_MAX_BYTES = 4 * 1024 * 1024 # 렌더링해 둔 글자 서피스 캐시 한도 (넘으면 오래 안 쓴 것부터 버림)
 
 # --- 상수 정의 ---
 # 화면 크기
@@ -75,6 +88,7 @@ SLIME_HP_BAR_HEIGHT = 7
 SLIME_DAMAGE_TO_PLAYER = 25
 SLIME_LIFESPAN_SECONDS = 15
 SLIME_HP_INCREASE_INTERVAL_SECONDS = 3
+USE_NUMPY_HORDE = True # numpy가 있으면 슬라임 이동을 배열로 한 번에 계산 (core/horde.py)
 
 # 민트 슬라임 설정
 MINT_SLIME_RADIUS_FACTOR = 0.75
@@ -150,5 +164,22 @@ STORM_SKILL_COOLDOWN_DECREASE_SECONDS = 5       # 강화 시 쿨타임 감소량
 STORM_SKILL_MIN_COOLDOWN_SECONDS = 10   
 STORM_SKILL_MAX_NUM = 5        # 최소 쿨타임 제한
 
-SUPABASE_URL = "https://tkivnaupoklyxaomkaun.supabase.co"
-SUPABASE_KEY = "sb_publishable_tikT725RvG9Q83sKmpr-IA_7PyNq6FK"
\ No newline at end of file
+# 오브젝트 풀 크기 (재사용을 위해 보관할 최대 객체 수)
+SLIME_BULLET_POOL_SIZE = 512
+DAGGER_POOL_SIZE = 128
+EXP_ORB_POOL_SIZE = 1024
+STORM_PROJECTILE_POOL_SIZE = 16
+STORM_ROTATION_FRAMES = 12 # 폭풍 회전 스프라이트 개수 (삼각형이라 120도를 이만큼 나눔, 틱당 회전량 8.6도와 비슷한 10도 간격)
+
+# 환경 변수 SUPABASE_URL로 바꿀 수 있음 (python -m benchmarks.ranking_server 로 띄운 로컬 대역 서버 등)
+SUPABASE_URL = os.environ.get("SUPABASE_URL", "https://tkivnaupoklyxaomkaun.supabase.co")
+SUPABASE_KEY = "sb_publishable_tikT725RvG9Q83sKmpr-IA_7PyNq6FK"
+NETWORK_TIMEOUT_SECONDS = 5
+
+# 점수 전송 대기열 (core.outbox): 웹 빌드는 파일 대신 브라우저 localStorage에 저장
+SCORE_OUTBOX_PATH = 'saves/score_outbox.json'
+SCORE_OUTBOX_MAX_ROWS = 100             # 보내지 못한 점수를 이만큼까지 보관 (넘으면 오래된 것부터 버림)
+SCORE_OUTBOX_BATCH = 20                 # POST 한 번에 보낼 최대 행 수
+SCORE_OUTBOX_RETRY_SECONDS = 2          # 첫 재시도 간격 (실패할 때마다 두 배)
+SCORE_OUTBOX_RETRY_MAX_SECONDS = 300    # 재시도 간격 상한
+SCORE_DEDUP_COLUMN = "submission_id"    # 중복 방지 키 컬럼 (서버 테이블에 unique로 있어야 함)
@@ -0,0 +1,150 @@
+# core/assets.py
+# 이미지 에셋 관리: 시작할 때(메뉴 전에) 모든 스프라이트 세트를 읽고 크기별로 변환해 둡니다.
+# 게임 중 처음 나온 슬라임 종류(보스 300x300 등) 때문에 PNG 디코딩 + 스케일링으로 끊기던 문제를 없앱니다.
+# 크기별 변형은 (접두어, 크기, 플래그, 틴트) 키로 캐시하므로, 같은 이미지를 다른 반지름으로 쓰는 종류도 섞이지 않습니다.
+import os
+import time
+import pygame
+import config
+
+SLIME_IMAGE_DIR = os.path.join('image', 'slimes')
+SLIME_FRAME_COUNT = 5
+BACKGROUND_PATH = os.path.join('image', 'background', 'background.png')
+
+# 투명 픽셀이 많은 스프라이트는 RLE로 인코딩하면 blit이 몇 배 빨라지고, 원본 픽셀도 버려져 메모리가 줄어듭니다.
+# (RLE된 서피스는 get_at/copy 등으로 잠글 때마다 풀렸다 다시 인코딩되므로 읽기 전용으로만 씀)
+SPRITE_FLAGS = pygame.RLEACCEL
+
+def asset_name(path):
+    """파일 경로를 묶음 파일 항목 이름으로 (OS와 상관없이 '/'로 구분한 상대 경로: Windows에서 만든 묶음도 웹에서 찾을 수 있게)"""
+    return os.path.normpath(path).replace(os.sep, '/')
+
+def slime_sprite_sets():
+    """미리 읽어 둘 (접두어, 반지름) 목록. 반지름은 각 슬라임 클래스 __init__과 같은 식"""
+    mint_radius = config.SLIME_RADIUS * config.MINT_SLIME_RADIUS_FACTOR
+    return [
+        ('slime', config.SLIME_RADIUS),
+        ('mintslime', mint_radius),
+        ('shooterslime', config.SLIME_RADIUS),
+        ('minislime', mint_radius),                # BossMinionSlime
+        ('minislime', config.SLIME_RADIUS),        # BossGunnerSlime (같은 이미지, 다른 크기)
+        ('slimeboss', config.SLIME_RADIUS * config.BOSS_SLIME_RADIUS_MULTIPLIER),
+    ]
+
+def surface_bytes(surf):
+    return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+class AssetManager:
+    def __init__(self):
+        self._sources = {}  # 파일 경로 -> 디코딩한 원본 (스케일 전)
+        self._variants = {} # (접두어, 크기, 플래그, 틴트) -> 프레임 목록
+        self._images = {}   # (경로, 알파 여부) -> 서피스
+        self.records = {}   # 에셋 이름 -> {'ms': 걸린 시간, 'bytes': 픽셀 메모리, 'late': 미리 안 읽어서 게임 중에 읽었는지}
+        self.preloaded = False
+        self.bundle = None  # core.bundle.AssetBundle (있으면 PNG 대신 여기서 읽음)
+
+    def open_bundle(self, path=config.ASSET_BUNDLE_PATH):
+        """미리 스케일해 둔 에셋 묶음 파일을 엽니다. 없거나 오래됐으면 그냥 PNG를 읽습니다."""
+        from core.bundle import open_bundle
+        started = time.perf_counter()
+        self.bundle = open_bundle(path)
+        if self.bundle is not None:
+            self.records[os.path.basename(path)] = {'ms': (time.perf_counter() - started) * 1000.0, 'bytes': 0, 'late': self.preloaded}
+        return self.bundle
+
+    def _source(self, path):
+        surf = self._sources.get(path)
+        if surf is None:
+            surf = self._sources[path] = pygame.image.load(path).convert_alpha()
+        return surf
+
+    def _record(self, name, started, surfaces):
+        self.records[name] = {
+            'ms': (time.perf_counter() - started) * 1000.0,
+            'bytes': sum(surface_bytes(s) for s in surfaces),
+            'late': self.preloaded,
+        }
+
+    def slime_frames(self, prefix, radius, tint=None, flags=SPRITE_FLAGS):
+        """슬라임 애니메이션 프레임 (지름 크기로 스케일). tint를 주면 그 색을 곱한 피격용 프레임.
+        이미지가 없으면 빈 목록 (그리는 쪽이 원으로 대신 그림)"""
+        if config.HEADLESS: return [] # 디스플레이 없이 돌 때는 이미지를 읽지 않음
+        size = int(radius * 2)
+        key = (prefix, size, flags, tint)
+        frames = self._variants.get(key)
+        if frames is not None: return frames
+
+        started = time.perf_counter()
+        try:
+            if tint is None and self.bundle is not None and f"{prefix}@{size}/1" in self.bundle:
+                frames = [self.bundle.surface(f"{prefix}@{size}/{i}") for i in range(1, SLIME_FRAME_COUNT + 1)]
+            elif tint is None:
+                frames = [pygame.transform.scale(self._source(os.path.join(SLIME_IMAGE_DIR, f"{prefix}{i}.png")), (size, size))
+                          for i in range(1, SLIME_FRAME_COUNT + 1)]
+            else:
+                # 틴트는 RLE 인코딩 전의 원래 프레임에서 만들어야 함
+                frames = []
+                for image in self.slime_frames(prefix, radius, None, 0):
+                    tinted = image.copy()
+                    tinted.fill(tint, special_flags=pygame.BLEND_RGBA_MULT)
+                    frames.append(tinted)
+        except (pygame.error, FileNotFoundError):
+            frames = []
+        if flags and frames:
+            # 원본(flags=0) 목록은 틴트용으로 따로 두고, 그리기용은 복사본에 플래그를 겁니다.
+            frames = [f.copy() for f in frames]
+            for f in frames: f.set_alpha(255, flags)
+        self._variants[key] = frames
+        if flags: self._record(f"{prefix}@{size}" + ("+tint" if tint else ""), started, frames)
+        return frames
+
+    def image(self, path, alpha=True):
+        """한 장짜리 이미지 (배경 등). 알파가 없으면 화면 포맷으로만 변환합니다."""
+        key = (path, alpha)
+        surf = self._images.get(key)
+        if surf is None:
+            started = time.perf_counter()
+            if self.bundle is not None and asset_name(path) in self.bundle:
+                surf = self._images[key] = self.bundle.surface(asset_name(path))
+            else:
+                surf = pygame.image.load(path)
+                surf = self._images[key] = surf.convert_alpha() if alpha else surf.convert()
+            self._record(os.path.basename(path), started, [surf])
+        return surf
+
+    def preload_set(self, prefix, radius, flash_tint):
+        """스프라이트 세트 하나(+피격 틴트)를 읽고 변환합니다. (메뉴 중 워밍업에서 프레임마다 하나씩)"""
+        self.slime_frames(prefix, radius)
+        self.slime_frames(prefix, radius, flash_tint)
+
+    def end_preload(self):
+        # 원본 500x500 디코딩 결과와 틴트용 플래그 없는 프레임은 다 만들고 나면 필요 없음
+        self._sources.clear()
+        for key in [k for k in self._variants if not k[2]]:
+            del self._variants[key]
+        # 묶음 파일에 든 것은 전부 서피스로 만들었으니 버퍼도 놓아 줌 (웹에서는 파일 전체를 메모리에 읽어 둔 상태)
+        if self.bundle is not None:
+            self.bundle.close()
+            self.bundle = None
+        self.preloaded = True
+
+    def preload(self, flash_tint):
+        """모든 슬라임 스프라이트 세트(+피격 틴트)를 한 번에 읽고 변환합니다. 디스플레이가 생긴 뒤 게임 시작 전에 부릅니다."""
+        started = time.perf_counter()
+        for prefix, radius in slime_sprite_sets():
+            self.preload_set(prefix, radius, flash_tint)
+        self.end_preload()
+        return (time.perf_counter() - started) * 1000.0
+
+    def total_bytes(self):
+        return sum(r['bytes'] for r in self.records.values())
+
+    def print_report(self):
+        print("=== 에셋 리포트 ===")
+        print(f"{'에셋':<24}{'ms':>8}{'KB':>10}")
+        for name, r in self.records.items():
+            print(f"{name:<24}{r['ms']:>8.1f}{r['bytes'] / 1024:>10.1f}" + ("  (게임 중 로드)" if r['late'] else ""))
+        print(f"{'합계':<24}{sum(r['ms'] for r in self.records.values()):>8.1f}{self.total_bytes() / 1024:>10.1f}")
+        print("(KB는 변환된 픽셀 기준. RLE 스프라이트는 첫 blit 뒤 실제로는 이보다 작음)")
+
+assets = AssetManager()
@@ -0,0 +1,169 @@
+# core/bundle.py
+# 에셋 묶음 파일: 게임이 쓰는 크기로 미리 스케일한 스프라이트를 디코딩된 픽셀 그대로 파일 하나에 담습니다.
+# 실행 중에는 파일을 한 번에 mmap(안 되면 통째로 read)해서 버퍼에서 바로 서피스를 만듭니다. (파일별 open + PNG 디코딩 없음)
+# 웹 빌드도 PNG 수십 개 대신 이 파일 하나만 받으면 됩니다.
+# 빌드: python -m core.bundle                 (deploy.bat은 --pygbag-ini를 붙여 pygbag 빌드 전에 실행)
+#   --pygbag-ini: 묶음에 다 들어간 이미지 폴더를 웹 패키지에서 빼도록 pygbag.ini를 씀 (PNG를 같이 받지 않게)
+#
+# 파일 구조: 매직(4) + 인덱스 길이(u32) + 인덱스 JSON + 0 채움(4바이트 정렬) + 픽셀 데이터
+#   인덱스 = {"version", "sources": {PNG 이름: [크기, 수정 시각(ns), sha1]}, "entries": {이름: {"offset", "length", "size", "format"}}}
+#   이름은 전부 core.assets.asset_name 형식('/' 구분 상대 경로)이라 Windows에서 만든 묶음도 웹에서 그대로 찾습니다.
+#   실행할 때는 원본의 크기와 수정 시각만 봅니다. (파일을 열지 않음)
+#   내용 해시는 배포할 때(--pygbag-ini) 씁니다: 원본과 내용이 같은 폴더만 웹 패키지에서 뺌.
+#   웹 빌드는 배포할 때 만든 묶음이 같이 들어가므로 실행할 때 확인하지 않습니다. (zip으로 묶이면 수정 시각도 바뀜)
+import hashlib
+import json
+import os
+import struct
+import pygame
+import config
+import utils
+from core.assets import SLIME_IMAGE_DIR, SLIME_FRAME_COUNT, BACKGROUND_PATH, asset_name, slime_sprite_sets
+
+BUNDLE_MAGIC = b'VSAB'
+BUNDLE_VERSION = 3
+PYGBAG_INI_PATH = 'pygbag.ini'
+_HEADER = struct.Struct('<4sI')
+
+def frame_name(prefix, size, index):
+    """슬라임 프레임 항목 이름 (index는 1부터)"""
+    return f"{prefix}@{size}/{index}"
+
+def _source_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def _source_stamp(path):
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns, _source_digest(path)]
+
+def build_bundle(path=config.ASSET_BUNDLE_PATH):
+    """slime_sprite_sets()의 모든 크기와 배경 타일을 묶음 파일로 씁니다. 항목 수와 파일 크기를 반환합니다."""
+    images = {} # 이름 -> (서피스, 포맷)
+    sources = {}
+    for prefix, radius in slime_sprite_sets():
+        size = int(radius * 2)
+        for i in range(1, SLIME_FRAME_COUNT + 1):
+            src = os.path.join(SLIME_IMAGE_DIR, f"{prefix}{i}.png")
+            images[frame_name(prefix, size, i)] = (pygame.transform.scale(pygame.image.load(src), (size, size)), 'RGBA')
+            sources[asset_name(src)] = _source_stamp(src)
+    images[asset_name(BACKGROUND_PATH)] = (pygame.image.load(BACKGROUND_PATH), 'RGB') # 배경은 불투명
+    sources[asset_name(BACKGROUND_PATH)] = _source_stamp(BACKGROUND_PATH)
+
+    entries = {}
+    blobs = []
+    offset = 0
+    for name, (surf, fmt) in images.items():
+        raw = pygame.image.tobytes(surf, fmt)
+        entries[name] = {"offset": offset, "length": len(raw), "size": list(surf.get_size()), "format": fmt}
+        blobs.append(raw)
+        offset += len(raw)
+    index = json.dumps({"version": BUNDLE_VERSION, "sources": sources, "entries": entries},
+                       ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    index += b'\0' * (-(_HEADER.size + len(index)) % 4)
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(BUNDLE_MAGIC, len(index)))
+        f.write(index)
+        for raw in blobs: f.write(raw)
+    return len(entries), os.path.getsize(path)
+
+class AssetBundle:
+    """묶음 파일을 열어 둔 것. surface(이름)은 버퍼 위에 서피스를 얹은 뒤 화면 포맷으로 변환한 복사본을 돌려줍니다."""
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            try:
+                import mmap
+                self._buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ImportError, OSError, ValueError): # mmap이 없는 환경(웹 등)은 통째로 읽기
+                self._buf = f.read()
+        self._view = memoryview(self._buf)
+        magic, index_len = _HEADER.unpack_from(self._view, 0)
+        if magic != BUNDLE_MAGIC:
+            self.close()
+            raise ValueError(f"에셋 묶음 파일이 아닙니다: {path}")
+        index = json.loads(bytes(self._view[_HEADER.size:_HEADER.size + index_len]).rstrip(b'\0'))
+        if index.get("version") != BUNDLE_VERSION:
+            self.close()
+            raise ValueError(f"지원하지 않는 에셋 묶음 버전: {index.get('version')}")
+        self.sources = index["sources"]
+        self.entries = index["entries"]
+        self._data_start = _HEADER.size + index_len
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def is_stale(self, check_content=False):
+        """원본 PNG가 묶은 뒤에 바뀌었는지 (원본이 없으면 확인하지 않음: 웹 빌드에서 PNG를 빼도 되게)
+        기본은 크기와 수정 시각만 봅니다. check_content면 수정 시각 대신 내용 해시를 비교합니다. (배포할 때용)"""
+        for name, (size, mtime_ns, digest) in self.sources.items():
+            try:
+                st = os.stat(name)
+            except OSError:
+                continue
+            if st.st_size != size: return True
+            if check_content:
+                if _source_digest(name) != digest: return True
+            elif st.st_mtime_ns != mtime_ns:
+                return True
+        return False
+
+    def surface(self, name):
+        e = self.entries[name]
+        start = self._data_start + e["offset"]
+        raw = pygame.image.frombuffer(self._view[start:start + e["length"]], tuple(e["size"]), e["format"])
+        return raw.convert_alpha() if e["format"] == 'RGBA' else raw.convert()
+
+    def nbytes(self):
+        return len(self._buf)
+
+    def close(self):
+        self._view.release()
+        if hasattr(self._buf, 'close'): self._buf.close()
+
+def open_bundle(path=config.ASSET_BUNDLE_PATH):
+    """묶음 파일을 엽니다. 없거나, 깨졌거나, 원본보다 오래됐으면 None (그러면 PNG를 직접 읽음)"""
+    if not os.path.exists(path): return None
+    try:
+        bundle = AssetBundle(path)
+    except (ValueError, OSError, struct.error) as e:
+        print(f"에셋 묶음 파일을 쓰지 않음: {e}")
+        return None
+    if not utils.IS_WEB and bundle.is_stale():
+        print(f"에셋 묶음 파일이 원본 이미지보다 오래됨 - PNG를 직접 읽습니다 (python -m core.bundle 로 다시 만드세요)")
+        bundle.close()
+        return None
+    return bundle
+
+def write_pygbag_ini(bundle_path=config.ASSET_BUNDLE_PATH, path=PYGBAG_INI_PATH):
+    """묶음 파일에 PNG가 전부 (지금 내용 그대로) 들어간 폴더만 골라 pygbag 패키지에서 빼는 설정을 씁니다.
+    뺀 폴더 목록을 반환합니다."""
+    bundle = AssetBundle(bundle_path)
+    try:
+        packed = {} if bundle.is_stale(check_content=True) else bundle.sources
+    finally:
+        bundle.close()
+    excluded = []
+    for folder in (SLIME_IMAGE_DIR, os.path.dirname(BACKGROUND_PATH)):
+        pngs = [asset_name(os.path.join(folder, n)) for n in os.listdir(folder) if n.lower().endswith('.png')]
+        if pngs and all(p in packed for p in pngs):
+            excluded.append('/' + asset_name(folder)) # pygbag은 프로젝트 루트 기준 '/폴더' 형식
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("; python -m core.bundle --pygbag-ini 가 만든 파일 (이미지 폴더는 sprites.bundle에 들어 있음)\n")
+        f.write("[DEPENDENCIES]\n")
+        f.write(f"ignoredirs = {json.dumps(excluded)}\n")
+        f.write("ignorefiles = []\n")
+    return excluded
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="스프라이트를 게임이 쓰는 크기로 스케일해 묶음 파일 하나로 만듭니다.")
+    parser.add_argument("--out", default=config.ASSET_BUNDLE_PATH)
+    parser.add_argument("--pygbag-ini", action="store_true", help="묶음에 들어간 이미지 폴더를 웹 패키지에서 빼도록 pygbag.ini 작성")
+    args = parser.parse_args()
+    count, nbytes = build_bundle(args.out)
+    print(f"{args.out}: {count}개, {nbytes / 1024:.0f}KB")
+    if args.pygbag_ini:
+        print(f"{PYGBAG_INI_PATH}: 웹 패키지에서 뺄 폴더 {write_pygbag_ini(args.out) or '없음'}")
@@ -0,0 +1,139 @@
+# core/engine.py
+# 화면과 무관한 시뮬레이션 1틱 진행 + 헤드리스 실행 진입점
+# 사용 예: python -m core.engine --ticks 36000 --seed 1 --ai kite
+import json
+import random
+import time
+import config
+import core.state as state
+import core.physics as physics
+import core.logic as logic
+import core.horde as horde
+import core.timestep as timestep
+from core.grid import world_grid
+from enemies.boss_minion_slime import BossMinionSlime
+from entities.exp_orb import exp_orb_pool
+from entities.bat_minion import BatMinion
+
+def build_score(game_state):
+    """랭킹 서버에 올리는 점수 딕셔너리"""
+    return {
+        "levels": game_state.player.level, "kills": game_state.player.total_enemies_killed,
+        "bosses": game_state.player.total_bosses_killed,
+        "difficulty_score": game_state.current_slime_max_hp / config.SLIME_INITIAL_BASE_HP,
+        "survival_time": game_state.slime_hp_increase_timer / config.FPS
+    }
+
+def apply_upgrade_choice(game_state, choice):
+    """레벨업 선택지를 적용합니다. 무기가 빠지면 그 무기가 부른 박쥐도 정리합니다."""
+    removed = game_state.player.apply_chosen_upgrade(choice)
+    if removed:
+        for b in game_state.bats:
+            if isinstance(b, BatMinion) and b.controller == removed:
+                world_grid.remove('player_projectiles', b)
+                game_state.bats.remove(b)
+
+def step(game_state, profiler=None):
+    """시뮬레이션을 1틱 진행합니다. 플레이어가 이번 틱에 죽으면 False를 반환합니다.
+    profiler(TickProfiler)를 주면 구간별 시간을 기록합니다. (start/end_tick은 호출하는 쪽 담당)"""
+    if config.RENDER_INTERPOLATION and not config.HEADLESS:
+        timestep.snapshot_positions(game_state.get_entities_dict().values())
+        if profiler: profiler.lap('snapshot')
+
+    game_state.player.update(game_state.slimes, game_state.get_entities_dict())
+    if profiler: profiler.lap('weapons') # 플레이어 이동 + 무기/스킬 업데이트
+    if game_state.player.hp <= 0: return False
+
+    game_state.camera_obj.update(game_state.player)
+    logic.update_game_logic(game_state)
+    if profiler: profiler.lap('spawn')
+    logic.handle_boss_logic(game_state)
+    if profiler: profiler.lap('boss')
+
+    slimes_to_rem = horde.update_slimes(game_state.slimes, game_state.player.world_x, game_state.player.world_y, game_state.get_entities_dict())
+    for s in slimes_to_rem:
+        world_grid.remove_enemy(s)
+        horde.remove_slime(s)
+        game_state.slimes.remove(s)
+        if s.hp <= 0 and not isinstance(s, BossMinionSlime):
+            game_state.player.total_enemies_killed += 1
+            game_state.exp_orbs.append(exp_orb_pool.acquire(s.world_x, s.world_y))
+    if profiler: profiler.lap('slimes') # 그리드 청크 갱신 포함
+
+    physics.handle_collisions(game_state, profiler)
+    for d in game_state.daggers:
+        if not d.update(game_state.get_entities_dict()):
+            world_grid.remove('player_projectiles', d)
+            game_state.daggers.remove(d)
+    if profiler: profiler.lap('daggers')
+    return True
+
+# ----------------------------------------------------
+# 헤드리스 실행
+# ----------------------------------------------------
+def start_headless_game(input_source, seed=None, player_name="headless", load_assets=False):
+    """디스플레이/이미지 없이 새 게임을 시작합니다. (load_assets=True면 이미지는 읽음: 그리기 벤치마크용)"""
+    config.HEADLESS = not load_assets
+    if seed is not None: random.seed(seed)
+    state.input_box = None
+    state.reset_game_state()
+    state.player.name = player_name
+    state.player.input_source = input_source
+    state.game_state = state.GAME_STATE_PLAYING
+
+def apply_input(game_state, input_source):
+    """틱 직전에 입력 소스가 정한 업그레이드/보스 보상 선택과 스킬 사용을 적용합니다."""
+    player = game_state.player
+    if player.is_selecting_upgrade:
+        choice = input_source.choose_upgrade(player, player.upgrade_options_to_display)
+        apply_upgrade_choice(game_state, choice if choice is not None else 0)
+    if player.is_selecting_boss_reward:
+        choice = input_source.choose_upgrade(player, player.boss_reward_options_to_display)
+        player.apply_chosen_boss_reward(choice if choice is not None else 0)
+    if player.special_skill and input_source.wants_skill(player):
+        player.special_skill.activate(game_state.get_entities_dict())
+
+def run_headless(max_ticks, input_source, seed=None, on_tick=None):
+    """CPU가 허락하는 만큼 빠르게 max_ticks 틱을 돌리고 통계 딕셔너리를 반환합니다.
+    업그레이드/보스 보상 선택과 스킬 사용은 input_source가 결정합니다.
+    on_tick(tick, 걸린 초)을 주면 매 틱 뒤에 호출합니다."""
+    start_headless_game(input_source, seed)
+    player = state.player
+    peak = {name: 0 for name in state.get_entities_dict()}
+    ticks = 0
+    alive = True
+    started = time.perf_counter()
+    while ticks < max_ticks:
+        apply_input(state, input_source)
+        tick_started = time.perf_counter()
+        alive = step(state)
+        ticks += 1
+        if on_tick is not None: on_tick(ticks, time.perf_counter() - tick_started)
+        for name, pool in state.get_entities_dict().items():
+            if len(pool) > peak[name]: peak[name] = len(pool)
+        if not alive: break
+    wall = time.perf_counter() - started
+
+    stats = build_score(state)
+    stats.update({
+        "ticks": ticks,
+        "sim_seconds": ticks / config.FPS,
+        "wall_seconds": wall,
+        "ticks_per_second": ticks / wall if wall > 0 else 0.0,
+        "alive": alive,
+        "player_hp": player.hp,
+        "entities": {name: len(pool) for name, pool in state.get_entities_dict().items()},
+        "peak_entities": peak,
+    })
+    return stats
+
+if __name__ == "__main__":
+    import argparse
+    from core.input import KiteAI, ScriptedInput
+    parser = argparse.ArgumentParser(description="화면 없이 게임 로직만 돌립니다.")
+    parser.add_argument("--ticks", type=int, default=config.FPS * 60)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--ai", choices=["kite", "idle"], default="kite")
+    args = parser.parse_args()
+    source = KiteAI(seed=args.seed) if args.ai == "kite" else ScriptedInput([])
+    print(json.dumps(run_headless(args.ticks, source, args.seed), ensure_ascii=False, indent=2))
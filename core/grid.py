@@ -1,48 +1,196 @@
 # core/grid.py
+import math
 import config
 import utils
 
-class GridSystem:
-    def __init__(self, cell_size=250): # 청크 크기 (픽셀 단위)
+# 레이어 이름 -> (청크 크기(픽셀), 엔티티 반지름으로 쓸 속성 이름)
+LAYER_SETTINGS = {
+    'enemies': (250, 'radius'),          # 슬라임, 보스
+    'enemy_bullets': (100, 'size'),      # 슬라임 총알 (작고 많음)
+    'player_projectiles': (100, 'size'), # 단검, 박쥐
+    'pickups': (100, 'radius'),          # 경험치 구슬
+}
+
+class GridLayer:
+    """청크 크기 하나를 쓰는 공간 해시 한 장. 엔티티는 자기 청크(grid_cell)를 기억합니다."""
+    def __init__(self, cell_size, extent_attr='radius'):
         self.cell_size = cell_size
+        self.extent_attr = extent_attr
+        self.max_extent = 0 # 등록된 엔티티 중 가장 큰 반지름 (청크 밖으로 삐져나온 만큼 더 봐야 함)
+        self.grid_width_cells = config.MAP_WIDTH // cell_size
+        self.grid_height_cells = config.MAP_HEIGHT // cell_size
+        # 청크 키 -> {엔티티: None} (삽입 순서를 유지하는 집합처럼 사용, 삭제 O(1))
         self.grid = {}
 
     def clear(self):
-        """매 프레임마다 그리드를 비웁니다."""
+        for cell in self.grid.values():
+            for obj in cell:
+                obj.grid_cell = None
         self.grid.clear()
 
-    def register_enemy(self, enemy):
-        """적의 현재 월드 좌표를 계산해 해당 청크에 등록합니다."""
+    def _get_cell_key(self, world_x, world_y):
         # 5000x5000 무한 루프 맵 대응
-        cell_x = int((enemy.world_x % config.MAP_WIDTH) // self.cell_size)
-        cell_y = int((enemy.world_y % config.MAP_HEIGHT) // self.cell_size)
-        
-        cell_key = (cell_x, cell_y)
+        cell_x = int((world_x % config.MAP_WIDTH) // self.cell_size)
+        cell_y = int((world_y % config.MAP_HEIGHT) // self.cell_size)
+        return (cell_x, cell_y)
+
+    def register(self, obj):
+        cell_key = self._get_cell_key(obj.world_x, obj.world_y)
         if cell_key not in self.grid:
-            self.grid[cell_key] = []
-        self.grid[cell_key].append(enemy)
-
-    def get_nearby_enemies(self, world_x, world_y, search_radius_cells=2):
-        """특정 좌표 주변 n칸 청크 내의 적들만 반환합니다."""
-        center_x = int((world_x % config.MAP_WIDTH) // self.cell_size)
-        center_y = int((world_y % config.MAP_HEIGHT) // self.cell_size)
-        
-        nearby_enemies = []
-        # 그리드 개수 계산
-        grid_width_cells = config.MAP_WIDTH // self.cell_size
-        grid_height_cells = config.MAP_HEIGHT // self.cell_size
-
-        for dx in range(-search_radius_cells, search_radius_cells + 1):
-            for dy in range(-search_radius_cells, search_radius_cells + 1):
-                # 맵 끝과 끝이 연결된 무한 루프 대응
-                target_x = (center_x + dx) % grid_width_cells
-                target_y = (center_y + dy) % grid_height_cells
-                
-                cell_key = (target_x, target_y)
-                if cell_key in self.grid:
-                    nearby_enemies.extend(self.grid[cell_key])
-        
-        return nearby_enemies
+            self.grid[cell_key] = {}
+        self.grid[cell_key][obj] = None
+        obj.grid_cell = cell_key
+        extent = getattr(obj, self.extent_attr, 0)
+        if extent > self.max_extent: self.max_extent = extent
+
+    def update(self, obj):
+        old_key = obj.grid_cell
+        if old_key is None:
+            self.register(obj)
+            return
+        cell_key = self._get_cell_key(obj.world_x, obj.world_y)
+        if cell_key == old_key: return
+
+        self._discard(obj, old_key)
+        if cell_key not in self.grid:
+            self.grid[cell_key] = {}
+        self.grid[cell_key][obj] = None
+        obj.grid_cell = cell_key
+
+    def remove(self, obj):
+        if obj.grid_cell is None: return
+        self._discard(obj, obj.grid_cell)
+        obj.grid_cell = None
+
+    def _discard(self, obj, cell_key):
+        cell = self.grid.get(cell_key)
+        if cell is None: return
+        cell.pop(obj, None)
+        if not cell:
+            del self.grid[cell_key] # 빈 청크는 바로 정리
+
+    def _iter_cells(self, world_x, world_y, search_radius_cells):
+        """주변 청크를 한 번씩만 돌려줍니다. (탐색 범위가 맵보다 넓어도 중복 없음)"""
+        center_x, center_y = self._get_cell_key(world_x, world_y)
+        span = 2 * search_radius_cells + 1
+
+        # 맵 끝과 끝이 연결된 무한 루프 대응
+        if span >= self.grid_width_cells: xs = range(self.grid_width_cells)
+        else: xs = [(center_x + d) % self.grid_width_cells for d in range(-search_radius_cells, search_radius_cells + 1)]
+        if span >= self.grid_height_cells: ys = range(self.grid_height_cells)
+        else: ys = [(center_y + d) % self.grid_height_cells for d in range(-search_radius_cells, search_radius_cells + 1)]
+
+        grid = self.grid
+        for target_x in xs:
+            for target_y in ys:
+                cell = grid.get((target_x, target_y))
+                if cell: yield cell
+
+    def get_nearby(self, world_x, world_y, search_radius_cells=2):
+        nearby = []
+        for cell in self._iter_cells(world_x, world_y, search_radius_cells):
+            nearby.extend(cell)
+        return nearby
+
+    def iter_radius(self, world_x, world_y, radius, use_extent=True):
+        """반경 안에 실제로 걸치는 엔티티만 하나씩 돌려줍니다.
+        use_extent=True면 엔티티 반지름까지 포함한 원-원 겹침, False면 중심점만 검사합니다.
+        ⚠️ 순회 도중 엔티티를 움직여 청크가 바뀌면 안 됩니다. (그럴 땐 query_radius 사용)"""
+        map_w, map_h = config.MAP_WIDTH, config.MAP_HEIGHT
+        half_w, half_h = map_w / 2, map_h / 2
+        world_x %= map_w
+        world_y %= map_h
+        reach = radius + (self.max_extent if use_extent else 0)
+        search_radius_cells = math.ceil(reach / self.cell_size)
+        extent_attr = self.extent_attr
+        radius_sq = radius * radius
+
+        for cell in self._iter_cells(world_x, world_y, search_radius_cells):
+            for obj in cell:
+                dx = obj.world_x - world_x
+                if dx > half_w: dx -= map_w
+                elif dx < -half_w: dx += map_w
+                dy = obj.world_y - world_y
+                if dy > half_h: dy -= map_h
+                elif dy < -half_h: dy += map_h
+                if use_extent:
+                    r = radius + getattr(obj, extent_attr)
+                    if dx*dx + dy*dy < r*r: yield obj
+                elif dx*dx + dy*dy < radius_sq:
+                    yield obj
+
+    def query_radius(self, world_x, world_y, radius, use_extent=True):
+        return list(self.iter_radius(world_x, world_y, radius, use_extent))
+
+    def iter_rects(self, rects):
+        """맵 안쪽 사각형들 (x, y, w, h)에 걸치는 청크의 엔티티를 돌려줍니다. (화면 컬링용, 청크 단위로만 거름)
+        사각형은 맵 경계에서 미리 잘라서 주고(core.render.Viewport), 서로 겹치지 않아야 합니다."""
+        cs = self.cell_size
+        grid = self.grid
+        for x, y, w, h in rects:
+            x0, x1 = int(x // cs), min(int((x + w - 1) // cs), self.grid_width_cells - 1)
+            y0, y1 = int(y // cs), min(int((y + h - 1) // cs), self.grid_height_cells - 1)
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    cell = grid.get((cx, cy))
+                    if cell: yield from cell
+
+
+class GridSystem:
+    """이름 붙은 레이어들을 묶어 관리합니다. 모든 레이어가 같은 래핑 쿼리 코드를 씁니다."""
+    def __init__(self, layer_settings=None):
+        self.layers = {}
+        for name, (cell_size, extent_attr) in (layer_settings or LAYER_SETTINGS).items():
+            self.layers[name] = GridLayer(cell_size, extent_attr)
+
+    def clear(self):
+        """모든 레이어를 비웁니다. (게임 리셋 시 사용)"""
+        for layer in self.layers.values():
+            layer.clear()
+
+    def register(self, layer_name, obj):
+        self.layers[layer_name].register(obj)
+
+    def update(self, layer_name, obj):
+        """🚩 엔티티가 움직인 뒤 호출합니다. 청크가 바뀐 경우에만 옮겨 담습니다."""
+        self.layers[layer_name].update(obj)
+
+    def remove(self, layer_name, obj):
+        """죽거나 사라진 엔티티를 레이어에서 뺍니다."""
+        self.layers[layer_name].remove(obj)
+
+    def get_nearby(self, layer_name, world_x, world_y, search_radius_cells=1):
+        """특정 레이어에서 좌표 주변 n칸 청크 내의 엔티티만 반환합니다."""
+        return self.layers[layer_name].get_nearby(world_x, world_y, search_radius_cells)
+
+    def query_radius(self, layer_name, world_x, world_y, radius, use_extent=True):
+        """특정 레이어에서 월드 좌표 반경 안에 걸치는 엔티티 리스트를 반환합니다."""
+        return self.layers[layer_name].query_radius(world_x, world_y, radius, use_extent)
+
+    def iter_radius(self, layer_name, world_x, world_y, radius, use_extent=True):
+        """query_radius의 제너레이터 버전 (리스트 할당 없음)"""
+        return self.layers[layer_name].iter_radius(world_x, world_y, radius, use_extent)
+
+    def iter_rects(self, layer_name, rects):
+        return self.layers[layer_name].iter_rects(rects)
+
+    # --- 적 레이어 단축 메서드 ---
+    def register_enemy(self, enemy):
+        """적의 현재 월드 좌표를 계산해 해당 청크에 등록합니다."""
+        self.layers['enemies'].register(enemy)
+
+    def update_enemy(self, enemy):
+        self.layers['enemies'].update(enemy)
+
+    def remove_enemy(self, enemy):
+        self.layers['enemies'].remove(enemy)
+
+    def get_enemies_in_radius(self, world_x, world_y, radius, use_extent=True):
+        """월드 좌표 반경(px) 안에 몸이 걸치는 적들만 반환합니다."""
+        return self.layers['enemies'].query_radius(world_x, world_y, radius, use_extent)
+
+    def iter_enemies_in_radius(self, world_x, world_y, radius, use_extent=True):
+        return self.layers['enemies'].iter_radius(world_x, world_y, radius, use_extent)
 
 # 전역 객체 생성
-enemy_grid = GridSystem(cell_size=250)
\ No newline at end of file
+world_grid = GridSystem()
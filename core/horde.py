@@ -0,0 +1,166 @@
+# core/horde.py
+# 슬라임 무리를 구조체 배열(SoA)로 들고 이동/수명/애니메이션을 한 번에 계산합니다.
+# numpy가 없으면(웹 빌드 등) 기존처럼 슬라임마다 update()를 부릅니다.
+import config
+from core.grid import world_grid
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class SlimeHorde:
+    """슬라임 전용 SoA 저장소. 수명/애니메이션 타이머는 멤버인 동안 이 배열이 원본입니다."""
+    def __init__(self, capacity=256):
+        self.members = [] # 슬롯 -> 슬라임
+        self.capacity = 0
+        self._grow(capacity)
+
+    def _grow(self, capacity):
+        def resized(old, dtype):
+            arr = np.zeros(capacity, dtype=dtype)
+            if old is not None: arr[:len(old)] = old
+            return arr
+        n = self.capacity
+        get = lambda name: getattr(self, name)[:n] if n else None
+        self.speed = resized(get('speed'), np.float64)
+        self.stop_distance = resized(get('stop_distance'), np.float64)
+        self.lifespan = resized(get('lifespan'), np.int64)
+        self.animation_timer = resized(get('animation_timer'), np.int64)
+        self.animation_period = resized(get('animation_period'), np.float64)
+        self.frame_index = resized(get('frame_index'), np.int64)
+        self.sequence_length = resized(get('sequence_length'), np.int64)
+        self.has_behavior = resized(get('has_behavior'), np.bool_)
+        self.capacity = capacity
+
+    def add(self, slime):
+        slot = len(self.members)
+        if slot >= self.capacity: self._grow(self.capacity * 2)
+        self.members.append(slime)
+        self.speed[slot] = slime.speed
+        self.stop_distance[slot] = config.PLAYER_SIZE / 2 + slime.radius
+        self.lifespan[slot] = slime.lifespan
+        self.animation_timer[slot] = slime.animation_timer
+        self.animation_period[slot] = slime.animation_speed * config.FPS
+        self.frame_index[slot] = slime.current_frame_index
+        self.sequence_length[slot] = len(slime.animation_sequence)
+        self.has_behavior[slot] = slime.has_behavior
+        slime.horde_slot = slot
+        return slot
+
+    def remove(self, slime):
+        """스왑 삭제. 빠지는 슬라임에는 배열 값을 다시 써 줍니다."""
+        slot = slime.horde_slot
+        if slot is None: return
+        slime.lifespan = int(self.lifespan[slot])
+        slime.animation_timer = int(self.animation_timer[slot])
+        slime.horde_slot = None
+
+        last = len(self.members) - 1
+        if slot != last:
+            moved = self.members[last]
+            self.members[slot] = moved
+            moved.horde_slot = slot
+            for arr in (self.speed, self.stop_distance, self.lifespan, self.animation_timer,
+                        self.animation_period, self.frame_index, self.sequence_length, self.has_behavior):
+                arr[slot] = arr[last]
+        self.members.pop()
+
+    def clear(self):
+        for slime in self.members:
+            slime.horde_slot = None
+        self.members.clear()
+
+    def update(self, slimes, target_player_world_x, target_player_world_y, game_entities_lists):
+        """Slime.update와 같은 결과를 배열 연산으로 계산합니다. 제거할 슬라임 리스트를 반환합니다."""
+        to_remove = []
+        new_slots = []
+        for s in slimes:
+            if s.horde_slot is None:
+                if s.horde_compatible: new_slots.append(self.add(s))
+                elif not s.update(target_player_world_x, target_player_world_y, game_entities_lists):
+                    to_remove.append(s)
+
+        members = self.members
+        n = len(members)
+        if n == 0: return to_remove
+
+        map_w, map_h = config.MAP_WIDTH, config.MAP_HEIGHT
+        cell_size = world_grid.layers['enemies'].cell_size
+
+        # 1. 객체가 원본인 값만 모으기 (다른 코드가 위치/HP/피격 타이머를 바꿀 수 있음)
+        x = np.array([s.world_x for s in members], dtype=np.float64)
+        y = np.array([s.world_y for s in members], dtype=np.float64)
+        hp = np.array([s.hp for s in members], dtype=np.float64)
+        flash = np.array([s.hit_flash_timer for s in members], dtype=np.int64)
+
+        # 2. 수명
+        alive = hp > 0
+        lifespan = self.lifespan[:n]
+        lifespan -= alive
+        expired = alive & (lifespan <= 0)
+        active = alive & ~expired
+
+        # 3. 플레이어 추적 이동 (래핑 맵 대응, Slime.update와 같은 연산 순서)
+        dx = target_player_world_x - x
+        dx[dx > map_w / 2] -= map_w
+        dx[dx < -map_w / 2] += map_w
+        dy = target_player_world_y - y
+        dy[dy > map_h / 2] -= map_h
+        dy[dy < -map_h / 2] += map_h
+        dist = np.sqrt(dx*dx + dy*dy)
+        move = active & (dist > self.stop_distance[:n])
+        ux = np.divide(dx, dist, out=np.zeros(n), where=move)
+        uy = np.divide(dy, dist, out=np.zeros(n), where=move)
+        speed = self.speed[:n]
+        new_x = np.where(move, (x + ux * speed) % map_w, x)
+        new_y = np.where(move, (y + uy * speed) % map_h, y)
+
+        # 4. 애니메이션
+        timer = self.animation_timer[:n]
+        timer += active
+        advance = active & (timer >= self.animation_period[:n])
+        timer[advance] = 0
+        frame = self.frame_index[:n]
+        frame[advance] = (frame[advance] + 1) % self.sequence_length[:n][advance]
+
+        # 5. 청크가 바뀐 슬라임만 그리드 갱신 대상
+        cell_changed = move & ((x // cell_size != new_x // cell_size) | (y // cell_size != new_y // cell_size))
+        if new_slots: cell_changed[new_slots] = True
+
+        # 6. 바뀐 값만 객체에 다시 쓰기 (rect는 읽는 곳이 없어 배열 경로에서는 갱신하지 않음)
+        move_idx = np.flatnonzero(move).tolist()
+        for i, wx, wy in zip(move_idx, new_x[move].tolist(), new_y[move].tolist()):
+            s = members[i]
+            s.world_x = wx
+            s.world_y = wy
+        for i in np.flatnonzero(alive & (flash > 0)).tolist():
+            members[i].hit_flash_timer -= 1
+        for i, f in zip(np.flatnonzero(advance).tolist(), frame[advance].tolist()):
+            members[i].current_frame_index = f
+        for i in np.flatnonzero(expired).tolist():
+            members[i].hp = 0
+        for i in np.flatnonzero(cell_changed).tolist():
+            world_grid.update_enemy(members[i])
+
+        # 7. 역할별 개별 행동 (사격 등)
+        for i in np.flatnonzero(active & self.has_behavior[:n]).tolist():
+            members[i].update_behavior(target_player_world_x, target_player_world_y, game_entities_lists)
+
+        to_remove.extend(members[i] for i in np.flatnonzero(~active).tolist())
+        return to_remove
+
+# 전역 객체 생성 (numpy가 없거나 꺼져 있으면 None)
+slime_horde = SlimeHorde() if (np is not None and config.USE_NUMPY_HORDE) else None
+
+def update_slimes(slimes, target_player_world_x, target_player_world_y, game_entities_lists):
+    """모든 일반 슬라임을 한 틱 진행시키고, 제거할 슬라임 리스트를 반환합니다."""
+    if slime_horde is None:
+        return [s for s in slimes if not s.update(target_player_world_x, target_player_world_y, game_entities_lists)]
+    return slime_horde.update(slimes, target_player_world_x, target_player_world_y, game_entities_lists)
+
+def remove_slime(slime):
+    if slime_horde is not None: slime_horde.remove(slime)
+
+def clear():
+    if slime_horde is not None: slime_horde.clear()
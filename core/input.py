@@ -0,0 +1,86 @@
+# core/input.py
+# 플레이어 입력 소스. Player.update는 키보드를 직접 읽지 않고 input_source에게 이동 방향을 묻습니다.
+# (헤드리스 시뮬레이션/벤치마크에서는 스크립트나 간단한 AI로 바꿔 끼움)
+import math
+import random
+import pygame
+import config
+from core.grid import world_grid
+
+class KeyboardInput:
+    """기본 입력: 방향키. 스킬(Z)과 업그레이드 선택(1~3)은 main.py의 이벤트 처리에서 다룹니다."""
+    def get_move(self, player):
+        keys = pygame.key.get_pressed()
+        move_x, move_y = 0, 0
+        if keys[pygame.K_LEFT]: move_x = -1
+        if keys[pygame.K_RIGHT]: move_x = 1
+        if keys[pygame.K_UP]: move_y = -1
+        if keys[pygame.K_DOWN]: move_y = 1
+        return move_x, move_y
+
+    def wants_skill(self, player): return False
+    def choose_upgrade(self, player, options): return None
+
+
+class ScriptedInput:
+    """(시작 틱, 이동 x, 이동 y) 목록을 순서대로 재생합니다. 마지막 항목은 끝까지 유지됩니다.
+    skill_ticks에 든 틱에는 스킬을 쓰고, 업그레이드는 upgrade_choices를 차례로 고릅니다(없으면 0번)."""
+    def __init__(self, script, skill_ticks=(), upgrade_choices=()):
+        self.script = sorted(script)
+        self.skill_ticks = set(skill_ticks)
+        self.upgrade_choices = list(upgrade_choices)
+        self.tick = 0 # 다음에 실행될 틱 번호
+        self._cursor = 0
+        self._current = (0, 0)
+        self._upgrade_cursor = 0
+
+    def get_move(self, player):
+        while self._cursor < len(self.script) and self.script[self._cursor][0] <= self.tick:
+            self._current = tuple(self.script[self._cursor][1:])
+            self._cursor += 1
+        self.tick += 1
+        return self._current
+
+    def wants_skill(self, player):
+        return self.tick in self.skill_ticks
+
+    def choose_upgrade(self, player, options):
+        if self._upgrade_cursor >= len(self.upgrade_choices): return 0
+        choice = self.upgrade_choices[self._upgrade_cursor]
+        self._upgrade_cursor += 1
+        return min(choice, len(options) - 1)
+
+
+class KiteAI:
+    """간단한 AI: 주변 적들의 반대 방향으로 도망치고, 스킬은 쿨타임이 차면 바로 씁니다.
+    업그레이드는 rng로 무작위 선택 (시드를 주면 재현 가능)."""
+    def __init__(self, flee_radius=300, seed=None):
+        self.flee_radius = flee_radius
+        self.rng = random.Random(seed)
+
+    def get_move(self, player):
+        push_x, push_y = 0.0, 0.0
+        for s in world_grid.iter_enemies_in_radius(player.world_x, player.world_y, self.flee_radius, use_extent=False):
+            dx = player.world_x - s.world_x
+            dy = player.world_y - s.world_y
+            if dx > config.MAP_WIDTH / 2: dx -= config.MAP_WIDTH
+            elif dx < -config.MAP_WIDTH / 2: dx += config.MAP_WIDTH
+            if dy > config.MAP_HEIGHT / 2: dy -= config.MAP_HEIGHT
+            elif dy < -config.MAP_HEIGHT / 2: dy += config.MAP_HEIGHT
+            d2 = dx*dx + dy*dy
+            if d2 > 0:
+                push_x += dx / d2
+                push_y += dy / d2
+        if push_x == 0 and push_y == 0: return 0, 0
+        angle = math.atan2(push_y, push_x)
+        # 8방향 입력으로 변환 (키보드와 같은 조건)
+        move_x = round(math.cos(angle))
+        move_y = round(math.sin(angle))
+        return move_x, move_y
+
+    def wants_skill(self, player):
+        skill = player.special_skill
+        return skill is not None and skill.cooldown_timer >= skill.cooldown
+
+    def choose_upgrade(self, player, options):
+        return self.rng.randrange(len(options)) if options else 0
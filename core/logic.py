@@ -6,7 +6,8 @@ from enemies.mint_slime import MintSlime
 from enemies.shooter_slime import ShooterSlime
 from enemies.boss_slime import BossSlime
 from enemies.boss_minion_slime import BossMinionSlime
-from entities.exp_orb import ExpOrb
+from entities.exp_orb import exp_orb_pool
+from core.grid import world_grid
 
 def update_game_logic(state):
     """스폰 및 시간 흐름에 따른 난이도 상승을 처리합니다."""
@@ -70,12 +71,12 @@ def handle_boss_logic(state):
     bosses_to_remove = [b for b in state.boss_slimes if not b.update(state.player.world_x, state.player.world_y, state.get_entities_dict())]
     
     for boss in bosses_to_remove:
+        world_grid.remove_enemy(boss)
+        state.boss_slimes.remove(boss)
         state.boss_active = False # 보스 죽으면 다시 일반몹 스폰되게끔 해제
         state.player.total_bosses_killed += 1
         state.player.trigger_boss_reward_selection()
         
         # 보상 구슬 생성
         for _ in range(20):
-            state.exp_orbs.append(ExpOrb(boss.world_x + random.randint(-50,50), boss.world_y + random.randint(-50,50)))
-            
-    state.boss_slimes[:] = [b for b in state.boss_slimes if b not in bosses_to_remove]
\ No newline at end of file
+            state.exp_orbs.append(exp_orb_pool.acquire(boss.world_x + random.randint(-50,50), boss.world_y + random.randint(-50,50)))
\ No newline at end of file
@@ -0,0 +1,36 @@
+# core/memory.py
+# 엔티티 종류별 메모리 사용량 리포트 (디버그용: 게임 중 F9 또는 print_memory_report(state))
+import sys
+
+SAMPLE_SIZE = 100 # 종류별로 크기를 재 볼 엔티티 수 (평균값 사용)
+
+def instance_bytes(obj):
+    """객체 본체 + (있다면) __dict__ 크기. 이미지/설정 튜플처럼 여러 객체가 공유하는 값은 세지 않습니다."""
+    size = sys.getsizeof(obj)
+    d = getattr(obj, '__dict__', None)
+    if d is not None: size += sys.getsizeof(d)
+    return size
+
+def memory_report(state):
+    """[(이름, 살아 있는 수, 엔티티당 바이트, 합계 바이트, 풀에 보관 중인 수), ...]를 반환합니다."""
+    rows = []
+    for name, pool in state.get_entities_dict().items():
+        sample = []
+        for obj in pool:
+            sample.append(instance_bytes(obj))
+            if len(sample) >= SAMPLE_SIZE: break
+        per_entity = sum(sample) // len(sample) if sample else 0
+        free = len(pool.recycler._free) if pool.recycler is not None else 0
+        rows.append((name, len(pool), per_entity, per_entity * len(pool), free))
+    return rows
+
+def print_memory_report(state):
+    rows = memory_report(state)
+    print("=== 엔티티 메모리 리포트 ===")
+    print(f"{'종류':<18}{'개수':>8}{'B/개':>8}{'합계(KB)':>12}{'풀 보관':>8}")
+    for name, count, per_entity, total, free in rows:
+        print(f"{name:<18}{count:>8}{per_entity:>8}{total / 1024:>12.1f}{free:>8}")
+    print(f"{'합계':<18}{sum(r[1] for r in rows):>8}{'':>8}{sum(r[3] for r in rows) / 1024:>12.1f}")
+    import core.sprites as sprites
+    print(f"폭풍 회전 아틀라스 (공유): {sprites.atlas_bytes() / 1024:.1f}KB")
+    return rows
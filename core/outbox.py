@@ -0,0 +1,152 @@
+# core/outbox.py
+# 점수 전송 대기열(outbox): 게임이 끝나면 점수를 먼저 로컬 저장소(데스크톱은 파일, 웹은 localStorage)에 적고,
+# 백그라운드에서 모아서 한 번의 POST로 보냅니다. 실패하면 지수적으로 간격을 늘려 다시 시도하고,
+# 보낼 때까지는 게임을 껐다 켜도 남아 있습니다. (연결이 불안정해도 게임 오버 화면이 멈추거나 기록이 사라지지 않음)
+# 행마다 중복 방지 키(config.SCORE_DEDUP_COLUMN)를 붙여, 같은 점수를 다시 보내도 서버에 한 번만 들어갑니다.
+#   서버 테이블에 있어야 함: alter table rankings add column submission_id text unique;
+#   없으면(서버가 4xx로 거절) 이번 실행 동안은 키 없이 예전처럼 넣습니다.
+# 다시 보내는 건 네트워크 오류/5xx 등뿐이고, 서버가 행 자체를 거절(4xx)하면 그 행만 따로 떼어 버립니다.
+import asyncio
+import json
+import os
+import random
+import time
+import uuid
+import config
+import utils
+
+LOCAL_STORAGE_KEY = 'vampire_score_outbox'
+
+class ScoreOutbox:
+    def __init__(self, path=config.SCORE_OUTBOX_PATH):
+        self.path = path
+        self.rows = None     # 보낼 행 목록 (오래된 것부터). 처음 쓸 때 저장소에서 읽음
+        self.failures = 0    # 연속 실패 횟수 (재시도 간격 계산용)
+        self.next_attempt = 0.0 # 이 시각(time.monotonic) 전에는 보내지 않음
+        self.sending = False
+        self.dedup = True    # 서버가 중복 방지 키를 받는지 (거절당하면 이번 실행 동안 끔)
+        self.on_sent = None  # 한 묶음을 보낼 때마다 부름 (랭킹 캐시 비우기 등)
+        self._rng = random.Random() # 재시도 간격 흔들기용 (게임 로직의 random 흐름을 건드리지 않게)
+
+    # --- 로컬 저장소 ---
+    def _read_storage(self):
+        if utils.IS_WEB and utils.js:
+            raw = utils.js.window.localStorage.getItem(LOCAL_STORAGE_KEY)
+            return None if raw is None or str(raw) in ('null', 'undefined') else str(raw)
+        if not os.path.exists(self.path): return None
+        with open(self.path, encoding='utf-8') as f:
+            return f.read()
+
+    def _write_storage(self, text):
+        if utils.IS_WEB and utils.js:
+            utils.js.window.localStorage.setItem(LOCAL_STORAGE_KEY, text)
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp, self.path) # 쓰는 도중에 꺼져도 이전 내용은 남음
+
+    def load(self):
+        if self.rows is not None: return self.rows
+        self.rows = []
+        try:
+            text = self._read_storage()
+            seen = set()
+            for row in (json.loads(text) if text else []):
+                key = row.get(config.SCORE_DEDUP_COLUMN)
+                if key and key not in seen:
+                    seen.add(key)
+                    self.rows.append(row)
+        except Exception as e:
+            utils.browser_debug(f"점수 대기열 읽기 실패: {e}", True)
+        if self.rows: utils.browser_debug(f"📮 보내지 못한 점수 {len(self.rows)}개")
+        return self.rows
+
+    def save(self):
+        try:
+            self._write_storage(json.dumps(self.rows, ensure_ascii=False))
+        except Exception as e:
+            utils.browser_debug(f"점수 대기열 저장 실패: {e}", True)
+
+    # --- 대기열 ---
+    def enqueue(self, name, score_data):
+        """점수를 대기열에 넣고 바로 저장합니다. (네트워크는 기다리지 않음) 중복 방지 키를 반환합니다."""
+        rows = self.load()
+        row = utils.build_ranking_row(name, score_data)
+        row[config.SCORE_DEDUP_COLUMN] = uuid.uuid4().hex
+        rows.append(row)
+        if len(rows) > config.SCORE_OUTBOX_MAX_ROWS:
+            dropped = len(rows) - config.SCORE_OUTBOX_MAX_ROWS
+            del rows[:dropped] # 한도를 넘으면 가장 오래된 것부터 버림
+            utils.browser_debug(f"점수 대기열이 가득 차 오래된 기록 {dropped}개를 버림", True)
+        self.save()
+        self.next_attempt = 0.0 # 새 점수는 재시도 대기 중이어도 바로 한 번 보내 봄
+        return row[config.SCORE_DEDUP_COLUMN]
+
+    def pending(self):
+        return len(self.load())
+
+    def _retry_delay(self):
+        delay = min(config.SCORE_OUTBOX_RETRY_MAX_SECONDS, config.SCORE_OUTBOX_RETRY_SECONDS * 2 ** (self.failures - 1))
+        return delay * self._rng.uniform(0.5, 1.0) # 여러 클라이언트가 동시에 몰리지 않게 흔듦
+
+    async def _send(self, batch):
+        """'sent' / 'retry' (다시 보내면 될 수도 있음) / 'rejected' (서버가 이 묶음을 받지 않음)"""
+        status = await utils.save_rankings_online(batch, self.dedup)
+        if utils.is_success_status(status): return 'sent'
+        if utils.is_retryable_status(status): return 'retry'
+        if self.dedup:
+            # 테이블에 중복 방지 키 컬럼/제약이 없어도 4xx -> 키 없이 한 번 더 넣어 봄
+            status = await utils.save_rankings_online(batch, False)
+            if utils.is_success_status(status):
+                self.dedup = False
+                utils.browser_debug(f"서버가 중복 방지 키({config.SCORE_DEDUP_COLUMN})를 받지 않아 키 없이 보냄", True)
+                return 'sent'
+            if utils.is_retryable_status(status): return 'retry'
+        return 'rejected'
+
+    async def flush(self):
+        """보낼 때가 된 행을 SCORE_OUTBOX_BATCH개씩 보냅니다. 보낸 행 수를 반환합니다."""
+        if self.sending or time.monotonic() < self.next_attempt: return 0
+        rows = self.load()
+        sent = 0
+        batch_size = config.SCORE_OUTBOX_BATCH
+        self.sending = True
+        try:
+            while rows:
+                batch = rows[:batch_size]
+                result = await self._send(batch)
+                if result == 'retry':
+                    self.failures += 1
+                    delay = self._retry_delay()
+                    self.next_attempt = time.monotonic() + delay
+                    utils.browser_debug(f"점수 전송 실패 {self.failures}회 - {delay:.0f}초 뒤 다시 시도 (대기 {len(rows)}개)", True)
+                    break
+                if result == 'rejected' and len(batch) > 1:
+                    batch_size = 1 # 어느 행이 문제인지 모르니 남은 행은 하나씩 따로 보내 봄
+                    continue
+                if result == 'rejected':
+                    utils.browser_debug(f"서버가 거절한 점수를 버림: {batch[0]}", True)
+                # 보내는 동안 새로 들어오거나 한도 때문에 빠진 행이 있을 수 있으니 키로 지움
+                done = {r[config.SCORE_DEDUP_COLUMN] for r in batch}
+                rows[:] = [r for r in rows if r[config.SCORE_DEDUP_COLUMN] not in done]
+                self.save()
+                self.failures = 0
+                if result == 'sent':
+                    sent += len(batch)
+                    if self.on_sent is not None: self.on_sent()
+        finally:
+            self.sending = False
+        return sent
+
+    async def run(self, interval=1.0):
+        """백그라운드 작업: 대기열에 남은 게 있으면 때가 될 때마다 보냅니다."""
+        while True:
+            try:
+                if self.load(): await self.flush()
+            except Exception as e:
+                utils.browser_debug(f"점수 전송 중 오류: {e}", True)
+            await asyncio.sleep(interval)
+
+score_outbox = ScoreOutbox()
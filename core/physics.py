@@ -1,60 +1,97 @@
 import utils
 import config
-from core.grid import enemy_grid # 그리드 엔진 필수
+from core.grid import world_grid # 그리드 엔진 필수
+from entities.exp_orb import ExpOrb
 
-def handle_collisions(state):
-    """모든 엔티티 간의 충돌 및 업데이트를 처리합니다."""
+def handle_collisions(state, profiler=None):
+    """모든 엔티티 간의 충돌 및 업데이트를 처리합니다. (profiler가 있으면 구간별 시간 기록)"""
     entities = state.get_entities_dict()
     
     # --- 1. 단검 vs 적 (그리드 최적화) ---
-    d_hit = set()
+    d_hit = {} # 순서가 있는 집합처럼 사용 (set은 실행마다 순회 순서가 달라 리플레이가 어긋남)
     for d in state.daggers:
-        # 단검 주변 적들만 탐색
-        nearby = enemy_grid.get_nearby_enemies(d.world_x, d.world_y, 1)
-        for s in nearby:
+        # 단검에 실제로 닿는 적들만 탐색
+        for s in world_grid.iter_enemies_in_radius(d.world_x, d.world_y, d.size/2):
             if s.hp > 0:
-                dist_sq = utils.distance_sq_wrapped(d.world_x, d.world_y, s.world_x, s.world_y, config.MAP_WIDTH, config.MAP_HEIGHT)
-                if dist_sq < (d.size/2 + s.radius)**2:
-                    s.take_damage(d.damage)
-                    d_hit.add(d)
-                    break
-    state.daggers[:] = [d for d in state.daggers if d not in d_hit]
+                s.take_damage(d.damage)
+                d_hit[d] = None
+                break
+    for d in d_hit:
+        world_grid.remove('player_projectiles', d)
+        state.daggers.remove(d)
+    if profiler: profiler.lap('collisions')
 
     # --- 2. 폭풍 발사체 업데이트 ---
-    state.storm_projectiles[:] = [p for p in state.storm_projectiles if p.update(state.slimes + state.boss_slimes)]
+    for p in state.storm_projectiles:
+        if not p.update(): state.storm_projectiles.remove(p)
+    if profiler: profiler.lap('storm')
 
     # --- 3. 적 발사체 vs 플레이어 ---
-    sb_keep = []
+    sb_alive = []
     for sb in state.slime_bullets:
-        if sb.update():
-            dist_sq = utils.distance_sq_wrapped(state.player.world_x, state.player.world_y, sb.world_x, sb.world_y, config.MAP_WIDTH, config.MAP_HEIGHT)
-            if dist_sq < (config.PLAYER_SIZE/2 + sb.size/2)**2:
-                state.player.take_damage(config.SLIME_BULLET_DAMAGE)
-            else:
-                sb_keep.append(sb)
-    state.slime_bullets[:] = sb_keep
+        if sb.update(): sb_alive.append(sb)
+        else:
+            world_grid.remove('enemy_bullets', sb)
+            state.slime_bullets.remove(sb)
+    # 플레이어에 맞은 총알을 한 번에 판정
+    sb_hit = set(utils.indices_within_wrapped(
+        state.player.world_x, state.player.world_y,
+        [sb.world_x for sb in sb_alive], [sb.world_y for sb in sb_alive],
+        [config.PLAYER_SIZE/2 + sb.size/2 for sb in sb_alive], config.MAP_WIDTH, config.MAP_HEIGHT))
+    for i in sb_hit:
+        state.player.take_damage(config.SLIME_BULLET_DAMAGE)
+        world_grid.remove('enemy_bullets', sb_alive[i])
+        state.slime_bullets.remove(sb_alive[i])
+    if profiler: profiler.lap('bullets')
 
     # --- 4. 적 접촉 데미지 (그리드 최적화) ---
-    nearby_for_p = enemy_grid.get_nearby_enemies(state.player.world_x, state.player.world_y, 1)
-    for s in nearby_for_p:
+    hitbox_radius = (config.PLAYER_SIZE/2)*config.PLAYER_DAMAGE_HITBOX_MULTIPLIER
+    for s in world_grid.iter_enemies_in_radius(state.player.world_x, state.player.world_y, hitbox_radius):
         if s.hp > 0:
-            dist_sq = utils.distance_sq_wrapped(state.player.world_x, state.player.world_y, s.world_x, s.world_y, config.MAP_WIDTH, config.MAP_HEIGHT)
-            if dist_sq < ((config.PLAYER_SIZE/2)*config.PLAYER_DAMAGE_HITBOX_MULTIPLIER + s.radius)**2:
-                state.player.take_damage(s.damage_to_player)
+            state.player.take_damage(s.damage_to_player)
+    if profiler: profiler.lap('collisions')
 
     # --- 5. 🚩 경험치 획득 로직 (완전 복구!) ---
-    o_rem = []
-    for o in state.exp_orbs:
-        # 구슬이 플레이어에게 빨려오거나(update), 직접 닿았을 때
-        is_collected = o.update(state.player.world_x, state.player.world_y)
-        dist_sq_orb = utils.distance_sq_wrapped(o.world_x, o.world_y, state.player.world_x, state.player.world_y, config.MAP_WIDTH, config.MAP_HEIGHT)
-        
-        if is_collected or dist_sq_orb < (config.EXP_ORB_RADIUS + config.PLAYER_SIZE/2)**2:
-            state.player.gain_exp(o.value) # 플레이어 경험치 증가
+    # 구슬이 플레이어에게 빨려와 닿았을 때 (전체 구슬 일괄 이동)
+    o_rem = ExpOrb.update_all(state.exp_orbs, state.player.world_x, state.player.world_y)
+    o_rem_set = set(o_rem)
+    # 플레이어 몸에 직접 닿은 구슬만 그리드에서 찾기
+    for o in world_grid.iter_radius('pickups', state.player.world_x, state.player.world_y, config.PLAYER_SIZE/2):
+        if o not in o_rem_set:
             o_rem.append(o)
-    # 획득한 구슬 리스트에서 제거
-    state.exp_orbs[:] = [o for o in state.exp_orbs if o not in o_rem]
+            o_rem_set.add(o)
+    for o in o_rem:
+        state.player.gain_exp(o.value) # 플레이어 경험치 증가
+        world_grid.remove('pickups', o)
+        state.exp_orbs.remove(o) # 획득한 구슬 풀에서 제거
+    if profiler: profiler.lap('orbs')
     
     # --- 6. 🚩 박쥐 업데이트 (필살기: 리턴값에 따라 리스트 즉시 갱신) ---
     # b.update가 False를 리턴(1초 멈춤 자폭)하는 순간, 명단에서 가차없이 삭제됨!
-    state.bats[:] = [b for b in state.bats if b.update(enemy_grid.get_nearby_enemies(b.world_x, b.world_y, 2), entities)]
\ No newline at end of file
+    for b in state.bats:
+        if not b.update(state.slimes, entities):
+            world_grid.remove('player_projectiles', b)
+            state.bats.remove(b)
+    if profiler: profiler.lap('bats')
+
+    # --- 7. 단검 vs 적 발사체 (그리드 후보 + 일괄 판정) ---
+    # 단검은 이 뒤 engine.step에서 update되며, 총알에 맞은 단검은 그때 사라집니다.
+    # 후보는 단검 주변 청크의 총알만 모으고(중복 없이), 단검 × 후보 총알 전체를 한 번에 판정합니다.
+    cand_sb = {}
+    if state.slime_bullets:
+        for d in state.daggers:
+            for sb in world_grid.get_nearby('enemy_bullets', d.world_x, d.world_y, 1):
+                if not sb.is_hit_by_player_attack: cand_sb[sb] = None
+    if cand_sb:
+        daggers = list(state.daggers)
+        cand_sb = list(cand_sb)
+        hits = utils.pairs_within_wrapped(
+            [d.world_x for d in daggers], [d.world_y for d in daggers], [d.size/2 for d in daggers],
+            [sb.world_x for sb in cand_sb], [sb.world_y for sb in cand_sb], [sb.size/2 for sb in cand_sb],
+            config.MAP_WIDTH, config.MAP_HEIGHT)
+        for i, j in hits:
+            d, sb = daggers[i], cand_sb[j]
+            if d.is_hit_slime_bullet or sb.is_hit_by_player_attack: continue
+            sb.is_hit_by_player_attack = True
+            d.is_hit_slime_bullet = True
+    if profiler: profiler.lap('collisions')
\ No newline at end of file
@@ -0,0 +1,168 @@
+# core/pool.py
+# 엔티티 종류별 저장소. 리스트를 매 틱 새로 만들지 않고 O(1)로 지우며, 세대 번호가 붙은 핸들로 안전하게 참조합니다.
+
+class EntityPool:
+    """살아 있는 엔티티를 빽빽한 배열에 담는 풀. 엔티티에는 pool_slot(슬롯 번호)이 붙습니다.
+    - 삭제: 마지막 원소와 자리를 바꾸는 스왑 삭제 (O(1), 순서는 유지되지 않음)
+    - 슬롯: 프리 리스트로 재사용하고, 재사용될 때마다 세대 번호가 올라가 옛 핸들은 무효가 됩니다.
+    - 순회 도중 remove하면 그 자리를 구멍(None)으로 두고 건너뛰었다가, 순회가 끝날 때 한꺼번에 정리합니다.
+    - recycler(ObjectPool)를 주면 remove/clear된 엔티티를 그쪽으로 반납합니다."""
+    def __init__(self, name='', recycler=None):
+        self.name = name
+        self.recycler = recycler
+        self._items = []        # 빽빽한 배열 (순회 중 지워진 자리는 None)
+        self._item_slots = []   # _items 위치 -> 슬롯
+        self._slot_index = []   # 슬롯 -> _items 위치 (빈 슬롯은 None)
+        self._generations = []  # 슬롯 -> 세대 번호
+        self._free_slots = []   # 비어 있는 슬롯 (프리 리스트)
+        self._pending = []      # 순회 중 지워져 정리를 기다리는 위치
+        self._iter_depth = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        # 순회 중 append된 엔티티도 리스트처럼 이어서 돕니다.
+        self._iter_depth += 1
+        try:
+            for obj in self._items:
+                if obj is not None: yield obj
+        finally:
+            self._iter_depth -= 1
+            if self._iter_depth == 0 and self._pending: self._compact()
+
+    def __contains__(self, obj):
+        return self._index_of(obj) is not None
+
+    def _index_of(self, obj):
+        slot = getattr(obj, 'pool_slot', None)
+        if slot is None or slot >= len(self._slot_index): return None
+        idx = self._slot_index[slot]
+        if idx is None or self._items[idx] is not obj: return None
+        return idx
+
+    def append(self, obj):
+        """엔티티를 넣고 (풀, 슬롯, 세대) 핸들을 반환합니다."""
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            slot = len(self._generations)
+            self._generations.append(0)
+            self._slot_index.append(None)
+        self._slot_index[slot] = len(self._items)
+        self._items.append(obj)
+        self._item_slots.append(slot)
+        obj.pool_slot = slot
+        self._size += 1
+        return (self, slot, self._generations[slot])
+
+    def remove(self, obj):
+        """엔티티를 뺍니다. 이 풀에 없으면 False를 반환합니다."""
+        idx = self._index_of(obj)
+        if idx is None: return False
+        slot = obj.pool_slot
+        self._generations[slot] += 1 # 옛 핸들 무효화
+        self._slot_index[slot] = None
+        self._free_slots.append(slot)
+        obj.pool_slot = None
+        self._size -= 1
+        if self._iter_depth:
+            self._items[idx] = None
+            self._pending.append(idx)
+        else:
+            self._swap_remove(idx)
+        if self.recycler is not None: self.recycler.release(obj)
+        return True
+
+    def _swap_remove(self, idx):
+        last = len(self._items) - 1
+        if idx != last:
+            slot = self._item_slots[last]
+            self._items[idx] = self._items[last]
+            self._item_slots[idx] = slot
+            self._slot_index[slot] = idx
+        self._items.pop()
+        self._item_slots.pop()
+
+    def _compact(self):
+        # 뒤쪽 구멍부터 지워야 마지막 원소가 항상 살아 있는 엔티티입니다.
+        for idx in sorted(self._pending, reverse=True):
+            self._swap_remove(idx)
+        self._pending.clear()
+
+    def clear(self):
+        for obj in self._items:
+            if obj is None: continue
+            obj.pool_slot = None
+            if self.recycler is not None: self.recycler.release(obj)
+        for slot, idx in enumerate(self._slot_index):
+            if idx is not None: self._generations[slot] += 1
+        self._slot_index = [None] * len(self._generations)
+        self._free_slots = list(range(len(self._generations) - 1, -1, -1))
+        self._items.clear()
+        self._item_slots.clear()
+        self._pending.clear()
+        self._size = 0
+
+    # --- 핸들 ---
+    # 다른 엔티티를 가리킬 때(단검/박쥐의 목표 등) 객체 대신 핸들을 들고 있다가 매 틱 get/resolve로 꺼냅니다.
+    # 객체를 그대로 들고 있으면 풀에서 빠졌거나 재활용된 엔티티를 계속 쫓게 됩니다.
+    def handle_of(self, obj):
+        """엔티티의 (풀, 슬롯, 세대) 핸들. 풀에 없으면 None."""
+        if self._index_of(obj) is None: return None
+        return (self, obj.pool_slot, self._generations[obj.pool_slot])
+
+    def get(self, handle):
+        """핸들이 가리키던 엔티티가 아직 살아 있으면 반환하고, 지워졌거나 슬롯이 재사용됐으면 None."""
+        if handle is None: return None
+        pool, slot, generation = handle
+        if pool is not self or slot >= len(self._generations) or self._generations[slot] != generation: return None
+        idx = self._slot_index[slot]
+        return None if idx is None else self._items[idx]
+
+
+def find_handle(pools, obj):
+    """obj가 들어 있는 풀을 찾아 핸들을 반환합니다. (적은 slimes/boss_slimes 중 어디에 있을지 모름) 없으면 None"""
+    for pool in pools:
+        handle = pool.handle_of(obj)
+        if handle is not None: return handle
+    return None
+
+def resolve(handle):
+    """핸들이 가리키는 엔티티 (없어졌으면 None)"""
+    return None if handle is None else handle[0].get(handle)
+
+
+class ObjectPool:
+    """자주 생겼다 사라지는 엔티티 객체를 재활용하는 풀. 클래스에 reset(...)이 있어야 합니다.
+    acquire는 남는 객체가 있으면 reset해서 돌려주고(hit), 없으면 새로 만듭니다(miss).
+    release된 객체는 최대 max_free개까지만 보관합니다."""
+    def __init__(self, cls, max_free):
+        self.cls = cls
+        self.max_free = max_free
+        self._free = []
+        self.hits = 0
+        self.misses = 0
+        self.in_use = 0
+        self.high_water = 0 # 동시에 쓰인 객체 수의 최댓값
+
+    def acquire(self, *args, **kwargs):
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args, **kwargs)
+            self.hits += 1
+        else:
+            obj = self.cls(*args, **kwargs)
+            self.misses += 1
+        self.in_use += 1
+        if self.in_use > self.high_water: self.high_water = self.in_use
+        return obj
+
+    def release(self, obj):
+        self.in_use -= 1
+        if len(self._free) < self.max_free: self._free.append(obj)
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'high_water': self.high_water,
+                'in_use': self.in_use, 'free': len(self._free)}
@@ -0,0 +1,56 @@
+# core/profiler.py
+# 틱 안의 구간별 소요 시간 측정 (벤치마크/성능 오버레이용)
+import time
+from collections import deque
+
+def percentile(sorted_values, p):
+    """정렬된 리스트에서 p(0~100) 백분위 값 (선형 보간)"""
+    if not sorted_values: return 0.0
+    k = (len(sorted_values) - 1) * p / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+class TickProfiler:
+    """start() 후 구간이 끝날 때마다 lap(이름)을 부르고, 틱이 끝나면 end_tick()을 부릅니다.
+    같은 틱에서 같은 이름이 여러 번 나오면 합산합니다. 값은 ms 단위로 쌓입니다."""
+    def __init__(self, history=None):
+        self.history = history # None이면 전부 보관, 숫자면 최근 n틱만 보관
+        self.samples = {}      # 구간 이름 -> [틱별 ms, ...]
+        self._current = {}
+        self.last_tick = {} # 직전에 끝난 틱의 구간별 ms (오버레이가 프레임마다 읽음)
+        self._last = None
+        self._tick_start = None
+
+    def start(self):
+        self._last = self._tick_start = time.perf_counter()
+
+    def lap(self, name):
+        now = time.perf_counter()
+        self._current[name] = self._current.get(name, 0.0) + (now - self._last) * 1000.0
+        self._last = now
+
+    def end_tick(self):
+        self._current['total'] = (time.perf_counter() - self._tick_start) * 1000.0
+        for name, ms in self._current.items():
+            values = self.samples.get(name)
+            if values is None:
+                values = self.samples[name] = deque(maxlen=self.history) if self.history else []
+            values.append(ms)
+        self.last_tick = self._current
+        self._current = {}
+
+    def discard_tick(self):
+        """이번 틱 기록을 버립니다. (워밍업 등)"""
+        self._current = {}
+
+    def summary(self):
+        """구간 이름 -> {p50, p95, p99, mean, max} (ms)"""
+        result = {}
+        for name, values in self.samples.items():
+            s = sorted(values)
+            result[name] = {
+                'p50': percentile(s, 50), 'p95': percentile(s, 95), 'p99': percentile(s, 99),
+                'mean': sum(s) / len(s), 'max': s[-1], 'count': len(s),
+            }
+        return result
@@ -0,0 +1,151 @@
+# core/render.py
+# 월드(엔티티) 그리기. HUD/메뉴는 ui 패키지가 담당합니다.
+# 화면 영역(Viewport)은 프레임마다 한 번만 계산하고, 그리드에서 화면에 걸치는 청크의 엔티티만 골라
+# 각 엔티티의 스프라이트를 화면 좌표 하나와 함께 RenderQueue에 모읍니다. (그리기 비용이 전체 엔티티 수가 아니라 화면 안의 수에 비례)
+# 큐는 층(layer)마다 텍스처별로 묶어 Surface.blits 한 번씩으로 그립니다.
+import pygame
+import config
+import core.timestep as timestep
+from core.grid import world_grid
+from core.assets import assets
+from enemies.boss_slime import BossSlime
+
+CULL_PAD = 40 # 반지름 밖으로 더 그려지는 것(HP 바, 틱 사이 보간 이동) 여유 (px)
+
+def split_wrapped_rect(x, y, w, h, map_w=config.MAP_WIDTH, map_h=config.MAP_HEIGHT):
+    """맵 좌표 사각형을 맵 경계(이음매)에서 잘라 맵 안쪽 사각형 1~4개로 돌려줍니다."""
+    def split(start, length, size):
+        if length >= size: return [(0, size)]
+        start %= size
+        if start + length <= size: return [(start, length)]
+        return [(start, size - start), (0, start + length - size)]
+    return [(sx, sy, sw, sh) for sx, sw in split(x, w, map_w) for sy, sh in split(y, h, map_h)]
+
+class Viewport:
+    """한 프레임 동안 화면이 덮는 월드 영역"""
+    def __init__(self, camera_x, camera_y, width=config.SCREEN_WIDTH, height=config.SCREEN_HEIGHT):
+        self.left = camera_x % config.MAP_WIDTH
+        self.top = camera_y % config.MAP_HEIGHT
+        self.width, self.height = width, height
+        # 화면 중심에서 가장 가까운 복사본으로 보내기 위한 여유 ((맵 - 화면) / 2)
+        self._slack_x = (config.MAP_WIDTH - width) / 2
+        self._slack_y = (config.MAP_HEIGHT - height) / 2
+
+    def rects(self, margin=0):
+        """margin만큼 넓힌 화면 영역 (맵 경계에서 잘린 맵 좌표 사각형 목록)"""
+        return split_wrapped_rect(self.left - margin, self.top - margin, self.width + 2 * margin, self.height + 2 * margin)
+
+    def to_screen(self, world_x, world_y):
+        """월드 좌표 -> 화면 좌표 (맵 래핑 복사본 중 화면에 가장 가까운 것 하나)"""
+        sx = (world_x - self.left + self._slack_x) % config.MAP_WIDTH - self._slack_x
+        sy = (world_y - self.top + self._slack_y) % config.MAP_HEIGHT - self._slack_y
+        return sx, sy
+
+class TiledBackground:
+    """바닥 타일을 화면을 덮는 크기(타일 크기의 배수)로 미리 깔아 둔 서피스.
+    이 서피스도 그 크기를 주기로 이어지므로, 카메라 위치에 따라 잘라 붙이는 blit 최대 4번으로 화면을 채웁니다."""
+    def __init__(self, tile, width=config.SCREEN_WIDTH, height=config.SCREEN_HEIGHT):
+        tw, th = tile.get_size()
+        self.width = -(-width // tw) * tw
+        self.height = -(-height // th) * th
+        self.surface = pygame.Surface((self.width, self.height)).convert()
+        for y in range(0, self.height, th):
+            for x in range(0, self.width, tw):
+                self.surface.blit(tile, (x, y))
+        self.view_w, self.view_h = width, height
+
+    def draw(self, surface, camera_x, camera_y):
+        ox, oy = int(camera_x) % self.width, int(camera_y) % self.height
+        # 서피스 안의 (ox, oy)가 화면 (0, 0)에 오도록, 오른쪽/아래로 넘치는 부분은 처음으로 돌아가서 이어 붙임
+        w1, h1 = min(self.width - ox, self.view_w), min(self.height - oy, self.view_h)
+        blit = surface.blit
+        blit(self.surface, (0, 0), (ox, oy, w1, h1))
+        if w1 < self.view_w: blit(self.surface, (w1, 0), (0, oy, self.view_w - w1, h1))
+        if h1 < self.view_h: blit(self.surface, (0, h1), (ox, 0, w1, self.view_h - h1))
+        if w1 < self.view_w and h1 < self.view_h: blit(self.surface, (w1, h1), (0, 0, self.view_w - w1, self.view_h - h1))
+
+def load_background(path):
+    """배경 타일을 읽어 TiledBackground를 만듭니다. 실패하면 None (그리는 쪽이 단색으로 채움)"""
+    try:
+        return TiledBackground(assets.image(path, alpha=False))
+    except (pygame.error, FileNotFoundError):
+        print("배경 이미지 로드 실패 - 기본 배경 사용")
+        return None
+
+class RenderQueue:
+    """(텍스처, 좌상단 위치)를 모았다가 텍스처별로 Surface.blits 한 번에 그립니다.
+    flush() 사이가 한 층이라, 층 안에서는 텍스처 순서로 겹칩니다."""
+    def __init__(self):
+        self.groups = {} # 텍스처 -> [(텍스처, 위치), ...]
+        self.hp_bars = [] # 층을 그린 뒤 위에 덧그릴 (슬라임, 화면 x, 화면 y)
+        self.sprite_count = 0
+        self.batch_count = 0
+
+    def add(self, texture, pos):
+        group = self.groups.get(texture)
+        if group is None: group = self.groups[texture] = []
+        group.append((texture, pos))
+
+    def flush(self, surface):
+        blits = surface.blits
+        for group in self.groups.values():
+            blits(group, doreturn=False)
+            self.sprite_count += len(group)
+        self.batch_count += len(self.groups)
+        self.groups.clear()
+        for e, sx, sy in self.hp_bars:
+            e.draw_hp_bar(surface, sx, sy)
+        self.hp_bars.clear()
+
+    def reset_stats(self):
+        self.sprite_count = self.batch_count = 0
+
+render_queue = RenderQueue()
+
+def _queue_visible(queue, view, objs, t, extent_attr, skip_type=None, hp_bars=False):
+    # 엔티티 수만큼 도는 루프라 보간/좌표 변환(timestep.interpolated_position, Viewport.to_screen)을 풀어 씀
+    width, height = view.width, view.height
+    map_w, map_h = config.MAP_WIDTH, config.MAP_HEIGHT
+    half_w, half_h = map_w / 2, map_h / 2
+    ox, oy = view._slack_x - view.left, view._slack_y - view.top
+    slack_x, slack_y = view._slack_x, view._slack_y
+    add = queue.add
+    for e in objs:
+        if skip_type is not None and isinstance(e, skip_type): continue
+        x, y = e.world_x, e.world_y
+        if t > 0:
+            dx = x - e.prev_x
+            if dx > half_w: dx -= map_w
+            elif dx < -half_w: dx += map_w
+            dy = y - e.prev_y
+            if dy > half_h: dy -= map_h
+            elif dy < -half_h: dy += map_h
+            x -= dx * t
+            y -= dy * t
+        sx = (x + ox) % map_w - slack_x
+        sy = (y + oy) % map_h - slack_y
+        r = getattr(e, extent_attr) + CULL_PAD
+        if -r < sx < width + r and -r < sy < height + r:
+            sprite = e.get_sprite()
+            add(sprite, (int(sx) - sprite.get_width() // 2, int(sy) - sprite.get_height() // 2))
+            if hp_bars and 0 < e.hp < e.max_hp: queue.hp_bars.append((e, sx, sy))
+
+def _queue_layer(queue, view, layer_name, t, skip_type=None, hp_bars=False):
+    layer = world_grid.layers[layer_name]
+    objs = layer.iter_rects(view.rects(layer.max_extent + CULL_PAD))
+    _queue_visible(queue, view, objs, t, layer.extent_attr, skip_type, hp_bars)
+
+def draw_entities(surface, game_state, alpha, camera_x, camera_y, queue=render_queue):
+    """화면에 보이는 엔티티만 직전 틱과 현재 틱 사이(alpha)의 보간 위치에 그립니다."""
+    view = Viewport(camera_x, camera_y)
+    t = 1.0 - alpha
+    queue.reset_stats()
+    _queue_layer(queue, view, 'pickups', t)
+    _queue_layer(queue, view, 'player_projectiles', t) # 단검 + 박쥐
+    _queue_layer(queue, view, 'enemy_bullets', t)
+    _queue_visible(queue, view, game_state.storm_projectiles, t, 'radius') # 최대 몇 개뿐이라 그리드에 없음
+    queue.flush(surface)
+    _queue_layer(queue, view, 'enemies', t, skip_type=BossSlime, hp_bars=True)
+    queue.flush(surface)
+    _queue_visible(queue, view, game_state.boss_slimes, t, 'radius', hp_bars=True) # 보스는 항상 슬라임 위에
+    queue.flush(surface)
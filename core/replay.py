@@ -0,0 +1,149 @@
+# core/replay.py
+# 시드 + 틱별 입력을 기록해 두었다가 같은 판을 헤드리스로 틱 단위 그대로 다시 돌립니다. (성능 회귀 측정용)
+# 재생 예: python -m core.replay replays/last_run.json
+#          python -m benchmarks.run_benchmarks --replay replays/last_run.json  (구간별 시간까지)
+import gzip
+import json
+import os
+import random
+import time
+import config
+import core.state as state
+import core.engine as engine
+import core.horde as horde
+from core.input import ScriptedInput
+
+REPLAY_VERSION = 1
+
+def new_seed():
+    return random.SystemRandom().randrange(2**32)
+
+def state_digest(game_state):
+    """재생 결과가 기록과 같은지 비교할 요약값"""
+    p = game_state.player
+    return {
+        "x": round(p.world_x, 3), "y": round(p.world_y, 3), "hp": round(p.hp, 3),
+        "level": p.level, "kills": p.total_enemies_killed, "bosses": p.total_bosses_killed,
+        "slimes": len(game_state.slimes), "exp_orbs": len(game_state.exp_orbs),
+    }
+
+class ReplayRecorder:
+    """입력 소스를 감싸서 이동 방향이 바뀔 때만 [틱, dx, dy]를 남깁니다.
+    스킬/업그레이드/보스 보상/포기는 main.py가 record()로, 틱이 끝날 때마다 tick_done()으로 알려줍니다."""
+    def __init__(self, inner, seed):
+        self.inner = inner
+        self.seed = seed
+        self.tick = 0      # 끝난 틱 수 (= 다음에 실행될 틱 번호)
+        self.moves = []    # [[틱, dx, dy], ...]
+        self.events = []   # [[틱, 종류, 값], ...] 종류: skill / upgrade / reward / quit
+        self._last_move = None
+
+    # --- 입력 소스 인터페이스 (Player.update가 부름) ---
+    def get_move(self, player):
+        move = tuple(self.inner.get_move(player))
+        if move != self._last_move:
+            self.moves.append([self.tick, move[0], move[1]])
+            self._last_move = move
+        return move
+
+    def wants_skill(self, player): return self.inner.wants_skill(player)
+    def choose_upgrade(self, player, options): return self.inner.choose_upgrade(player, options)
+
+    # --- main.py가 부름 ---
+    def record(self, kind, value=None):
+        self.events.append([self.tick, kind, value])
+
+    def tick_done(self):
+        self.tick += 1
+
+    def to_dict(self, game_state):
+        return {
+            "version": REPLAY_VERSION, "seed": self.seed, "ticks": self.tick,
+            "fps": config.FPS, "numpy_horde": horde.slime_horde is not None,
+            "player_name": game_state.player.name, "recorded_at": time.strftime('%Y-%m-%dT%H:%M:%S'),
+            "moves": self.moves, "events": self.events, "final": state_digest(game_state),
+        }
+
+    def save(self, path, game_state):
+        save_replay(path, self.to_dict(game_state))
+
+
+def begin_recording(game_state, seed):
+    """reset_game_state() 직후에 부릅니다. (시드는 reset 전에 random.seed로 걸어둔 값)"""
+    recorder = ReplayRecorder(game_state.player.input_source, seed)
+    game_state.player.input_source = recorder
+    game_state.replay_recorder = recorder
+    return recorder
+
+def save_replay(path, data):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    raw = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    if path.endswith('.gz'): raw = gzip.compress(raw)
+    with open(path, 'wb') as f:
+        f.write(raw)
+
+def load_replay(path):
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if path.endswith('.gz'): raw = gzip.decompress(raw)
+    data = json.loads(raw.decode('utf-8'))
+    if data.get("version") != REPLAY_VERSION:
+        raise ValueError(f"지원하지 않는 리플레이 버전: {data.get('version')}")
+    return data
+
+# ----------------------------------------------------
+# 재생
+# ----------------------------------------------------
+def apply_event(game_state, kind, value):
+    player = game_state.player
+    if kind == 'skill':
+        if player.special_skill: player.special_skill.activate(game_state.get_entities_dict())
+    elif kind == 'upgrade':
+        engine.apply_upgrade_choice(game_state, value)
+    elif kind == 'reward':
+        player.apply_chosen_boss_reward(value)
+    elif kind == 'quit':
+        player.hp = 0
+
+def play(data, profiler=None, on_tick=None):
+    """기록된 판을 헤드리스로 다시 돌리고 통계 딕셔너리를 반환합니다.
+    profiler(TickProfiler)를 주면 틱마다 start/end_tick까지 불러줍니다."""
+    if data.get("fps", config.FPS) != config.FPS:
+        raise ValueError(f"FPS가 다른 리플레이입니다: {data['fps']} != {config.FPS}")
+    engine.start_headless_game(ScriptedInput(data["moves"]), data["seed"], data.get("player_name", "replay"))
+    events = {}
+    for tick, kind, value in data["events"]:
+        events.setdefault(tick, []).append((kind, value))
+
+    alive = True
+    ticks = 0
+    started = time.perf_counter()
+    for tick in range(data["ticks"]):
+        for kind, value in events.get(tick, ()):
+            apply_event(state, kind, value)
+        tick_started = time.perf_counter()
+        if profiler: profiler.start()
+        alive = engine.step(state, profiler)
+        if profiler: profiler.end_tick()
+        ticks += 1
+        if on_tick is not None: on_tick(ticks, time.perf_counter() - tick_started)
+        if not alive: break
+    wall = time.perf_counter() - started
+
+    final = state_digest(state)
+    return {
+        "ticks": ticks, "recorded_ticks": data["ticks"], "alive": alive,
+        "wall_seconds": wall, "ticks_per_second": ticks / wall if wall > 0 else 0.0,
+        "final": final, "matches_recording": final == data.get("final"),
+    }
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="기록된 판을 화면 없이 다시 돌립니다.")
+    parser.add_argument("path")
+    args = parser.parse_args()
+    data = load_replay(args.path)
+    result = play(data)
+    if data.get("numpy_horde") != (horde.slime_horde is not None):
+        print("⚠️ 기록할 때와 numpy 사용 여부가 달라 결과가 어긋날 수 있습니다.")
+    print(json.dumps(result, ensure_ascii=False, indent=2))
@@ -0,0 +1,104 @@
+# core/sprites.py
+# 도형(원, 단검 삼각형)을 미리 그려 둔 스프라이트 캐시.
+# 같은 (색, 크기)는 서피스 하나를 같이 써서 core.render.RenderQueue가 텍스처별로 묶어 한 번에 그릴 수 있습니다.
+import math
+from collections import OrderedDict
+import pygame
+import config
+
+DAGGER_ANGLE_STEPS = 64 # 단검 회전 스프라이트 개수 (360도를 이만큼 나눔)
+
+POLYGON_ATLAS_MAX = 2   # 폭풍 반지름은 업그레이드마다 바뀌므로 보통은 지금 크기와 (날아가는 중인) 직전 크기만 들고 있음
+                        # (아직 날아가는 크기는 이보다 많아도 버리지 않음)
+
+_circle_cache = {}
+_dagger_cache = {}
+_polygon_atlas = OrderedDict() # (색, 반지름, 변 수, 단계 수) -> (회전 프레임 목록, 바이트)
+
+def _finish(surf):
+    """디스플레이가 있으면 화면 포맷으로 변환 (blit이 빨라짐)"""
+    return surf.convert_alpha() if pygame.display.get_surface() is not None else surf
+
+def circle(color, radius):
+    """채운 원 스프라이트 (크기 2r+1, 중심 = (r, r))"""
+    key = (tuple(color), radius)
+    surf = _circle_cache.get(key)
+    if surf is None:
+        r = int(radius)
+        surf = pygame.Surface((r * 2 + 1, r * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.circle(surf, color, (r, r), r)
+        surf = _circle_cache[key] = _finish(surf)
+    return surf
+
+def dagger(color, size, angle):
+    """angle 방향을 향한 단검 삼각형 스프라이트 (DAGGER_ANGLE_STEPS 단계로 양자화)"""
+    step = round(angle * DAGGER_ANGLE_STEPS / (2 * math.pi)) % DAGGER_ANGLE_STEPS
+    key = (tuple(color), size, step)
+    surf = _dagger_cache.get(key)
+    if surf is None:
+        a = step * 2 * math.pi / DAGGER_ANGLE_STEPS
+        c = int(size)
+        tip_length = size * 0.7
+        base_width_half = size * 0.4 / 2
+        base_x = c + math.cos(a) * -size * 0.2
+        base_y = c + math.sin(a) * -size * 0.2
+        points = [(c + math.cos(a) * tip_length, c + math.sin(a) * tip_length),
+                  (base_x + math.cos(a - math.pi/2) * base_width_half, base_y + math.sin(a - math.pi/2) * base_width_half),
+                  (base_x + math.cos(a + math.pi/2) * base_width_half, base_y + math.sin(a + math.pi/2) * base_width_half)]
+        surf = pygame.Surface((c * 2 + 1, c * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.polygon(surf, color, points)
+        surf = _dagger_cache[key] = _finish(surf)
+    return surf
+
+def _bake_polygon_frames(color, radius, sides, steps):
+    """정다각형을 한 주기(360/변 수 도) 동안 steps 단계로 돌린 프레임들과 그 대략의 메모리(바이트).
+    프레임은 RLE로 인코딩해 두어서 투명한 부분은 메모리도 blit 시간도 거의 들지 않습니다. (SDL이 원본 픽셀을 버림)
+    서피스는 중심이 가운데에 오도록 다각형에 맞춰 좌우/상하 대칭으로만 잘라냅니다."""
+    period = 2 * math.pi / sides
+    frames = []
+    nbytes = 0
+    for step in range(steps):
+        base = step * period / steps
+        offsets = [(radius * math.cos(base + i * period), radius * math.sin(base + i * period)) for i in range(sides)]
+        half_w = math.ceil(max(abs(x) for x, _ in offsets)) + 1
+        half_h = math.ceil(max(abs(y) for _, y in offsets)) + 1
+        surf = pygame.Surface((half_w * 2 + 1, half_h * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.polygon(surf, color, [(half_w + x, half_h + y) for x, y in offsets])
+        nbytes += pygame.mask.from_surface(surf, 0).count() * surf.get_bytesize() # RLE 후 남는 건 칠해진 픽셀뿐
+        surf = _finish(surf)
+        surf.set_alpha(255, pygame.RLEACCEL) # 첫 blit 때 인코딩됨 (이후 get_at 등으로 잠그면 풀리니 읽지 말 것)
+        frames.append(surf)
+    return frames, nbytes
+
+def polygon_frames(color, radius, sides, steps=None):
+    """(색, 반지름)별 회전 프레임 목록. 없으면 여기서 굽습니다. (그리기 중에 불리므로 다른 아틀라스를 버리지는 않음)
+    굽는 데 수십 ms가 걸리므로 크기가 정해질 때 bake_polygon으로 미리 구워 두세요."""
+    if steps is None: steps = config.STORM_ROTATION_FRAMES
+    key = (tuple(color), radius, sides, steps)
+    entry = _polygon_atlas.get(key)
+    if entry is None:
+        entry = _polygon_atlas[key] = _bake_polygon_frames(color, radius, sides, steps)
+    else:
+        _polygon_atlas.move_to_end(key)
+    return entry[0]
+
+def bake_polygon(color, radius, sides, in_use=(), steps=None):
+    """이 반지름의 아틀라스를 미리 굽고(워밍업, 업그레이드 선택 때), 한도를 넘으면 오래된 것부터 버립니다.
+    in_use의 반지름(아직 화면에 있는 발사체)은 버리지 않습니다."""
+    if config.HEADLESS: return # 그리지 않으니 구울 필요 없음
+    if steps is None: steps = config.STORM_ROTATION_FRAMES
+    polygon_frames(color, radius, sides, steps)
+    keep = {(tuple(color), r, sides, steps) for r in in_use}
+    keep.add((tuple(color), radius, sides, steps))
+    for key in [k for k in _polygon_atlas if k not in keep][:max(0, len(_polygon_atlas) - POLYGON_ATLAS_MAX)]:
+        del _polygon_atlas[key]
+
+def rotating_polygon(color, radius, sides, angle, steps=None):
+    """angle만큼 돈 정다각형 스프라이트. 같은 (색, 반지름)은 모든 발사체가 한 아틀라스를 같이 씁니다."""
+    frames = polygon_frames(color, radius, sides, steps)
+    period = 2 * math.pi / sides
+    return frames[round((angle % period) / period * len(frames)) % len(frames)]
+
+def atlas_bytes():
+    """구워 둔 회전 아틀라스가 차지하는 대략의 픽셀 메모리 (메모리 리포트용)"""
+    return sum(nbytes for _, nbytes in _polygon_atlas.values())
@@ -0,0 +1,128 @@
+# core/startup.py
+# 시작 타임라인: 프로그램 시작부터 첫 화면(메뉴)까지 단계별 시각과, 이 저장소 모듈들의 import 시간을 기록합니다.
+# main.py가 맨 처음 import해야 시작 시각이 맞습니다. 리포트는 config.STARTUP_REPORT가 켜져 있으면 워밍업이 끝날 때 출력.
+# 메뉴가 뜬 뒤에 읽어도 되는 것들(게임 로직 모듈, 스프라이트, 안 쓰는 크기의 폰트)은 WarmupQueue로 프레임마다 조금씩 읽습니다.
+import importlib.machinery
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+class StartupTimeline:
+    def __init__(self):
+        self.t0 = time.perf_counter()
+        self._last = self.t0
+        self.marks = []   # [(시작 시각 ms, 걸린 ms, 이름), ...] 단계별 (메인 흐름)
+        self.modules = [] # [(시작 시각 ms, 본문 ms, 하위 import 포함 ms, 모듈 이름), ...]
+        self.tasks = []   # [(시작 시각 ms, 걸린 ms, 이름), ...] 메뉴 중 워밍업 작업
+        self.first_paint_ms = None
+
+    def now_ms(self):
+        return (time.perf_counter() - self.t0) * 1000.0
+
+    def mark(self, name):
+        """직전 mark 이후 지금까지를 name 단계로 기록합니다."""
+        now = time.perf_counter()
+        self.marks.append(((self._last - self.t0) * 1000.0, (now - self._last) * 1000.0, name))
+        self._last = now
+
+    def first_paint(self):
+        if self.first_paint_ms is None:
+            self.mark('first paint')
+            self.first_paint_ms = self.now_ms()
+
+    def install_import_timer(self):
+        if not any(isinstance(f, _ImportTimer) for f in sys.meta_path):
+            sys.meta_path.insert(0, _ImportTimer(self))
+
+    def uninstall_import_timer(self):
+        """워밍업이 끝나면 뺍니다. (그 뒤의 import는 잴 필요가 없고, finder 검사 비용만 듦)"""
+        sys.meta_path[:] = [f for f in sys.meta_path if not isinstance(f, _ImportTimer)]
+
+    def report(self, top=15):
+        lines = ["=== 시작 타임라인 ===", f"{'시각(ms)':>10}{'소요(ms)':>10}  단계"]
+        for start, ms, name in self.marks:
+            lines.append(f"{start:>10.1f}{ms:>10.1f}  {name}")
+        if self.tasks:
+            lines.append("--- 메뉴 중 워밍업 ---")
+            for start, ms, name in self.tasks:
+                lines.append(f"{start:>10.1f}{ms:>10.1f}  {name}")
+        if self.modules:
+            lines.append(f"--- 모듈 import (본문 실행 시간 상위 {top}개, 괄호는 하위 import 포함) ---")
+            for start, self_ms, total_ms, name in sorted(self.modules, key=lambda m: -m[1])[:top]:
+                lines.append(f"{start:>10.1f}{self_ms:>10.1f}  {name} ({total_ms:.1f})")
+            lines.append(f"{'':>10}{sum(m[1] for m in self.modules):>10.1f}  저장소 모듈 {len(self.modules)}개 합계")
+        return "\n".join(lines)
+
+def _repo_top_level_names():
+    """저장소 루트에 있는 최상위 모듈/패키지 이름 (main, config, core, ui, ...)"""
+    names = set()
+    for entry in os.listdir(ROOT):
+        full = os.path.join(ROOT, entry)
+        if entry.endswith('.py'): names.add(entry[:-3])
+        elif os.path.isfile(os.path.join(full, '__init__.py')): names.add(entry)
+    return names
+
+class _ImportTimer:
+    """sys.meta_path 맨 앞에서 이 저장소 안의 모듈만 찾아 모듈 본문 실행 시간을 잽니다. (나머지는 원래 finder에 넘김)"""
+    def __init__(self, timeline):
+        self.timeline = timeline
+        self.top_level = _repo_top_level_names()
+        self._stack = [] # 실행 중인 모듈별 하위 import에 쓴 시간
+
+    def find_spec(self, name, path=None, target=None):
+        if name.partition('.')[0] not in self.top_level: return None # 표준 라이브러리/설치된 패키지는 바로 넘김
+        spec = importlib.machinery.PathFinder.find_spec(name, path)
+        if spec is None or not spec.origin or not spec.origin.startswith(ROOT) or not hasattr(spec.loader, 'exec_module'):
+            return None
+        exec_module = spec.loader.exec_module
+        timeline, stack = self.timeline, self._stack
+        def timed_exec_module(module):
+            started = time.perf_counter()
+            stack.append(0.0)
+            try:
+                exec_module(module)
+            finally:
+                children = stack.pop()
+                total = time.perf_counter() - started
+                if stack: stack[-1] += total
+                timeline.modules.append(((started - timeline.t0) * 1000.0, (total - children) * 1000.0, total * 1000.0, name))
+        spec.loader.exec_module = timed_exec_module
+        return spec
+
+class WarmupQueue:
+    """메뉴 화면에서 프레임마다 budget_ms만큼씩 돌릴 작업 목록. finish()는 남은 작업을 한꺼번에 돌립니다. (게임 시작 직전)"""
+    def __init__(self, timeline):
+        self.timeline = timeline
+        self.tasks = [] # [(이름, 함수), ...]
+        self.on_done = None
+
+    def add(self, name, fn):
+        self.tasks.append((name, fn))
+
+    @property
+    def done(self):
+        return not self.tasks
+
+    def _run_one(self):
+        name, fn = self.tasks.pop(0)
+        started = self.timeline.now_ms()
+        fn()
+        self.timeline.tasks.append((started, self.timeline.now_ms() - started, name))
+        if not self.tasks:
+            self.timeline.uninstall_import_timer()
+            if self.on_done is not None: self.on_done()
+
+    def step(self, budget_ms):
+        """작업을 최소 하나, budget_ms를 넘기기 전까지 돌립니다. (작업 하나는 쪼개지 않음)"""
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        while self.tasks:
+            self._run_one()
+            if time.perf_counter() >= deadline: break
+
+    def finish(self):
+        while self.tasks:
+            self._run_one()
+
+timeline = StartupTimeline()
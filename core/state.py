@@ -1,6 +1,10 @@
 import config
 from player import Player
 from camera import Camera
+from core.grid import world_grid
+from core.pool import EntityPool
+import core.horde as horde
+# 엔티티 모듈(과 그 재활용 풀)은 여기서 import하지 않음: 메뉴가 뜨기 전에 읽히지 않게 reset_game_state에서 붙임
 
 # 게임 상태 상수
 GAME_STATE_MENU = "MENU"
@@ -9,16 +13,16 @@ GAME_STATE_RANKING = "RANKING"
 GAME_STATE_INVENTORY = "INVENTORY"
 GAME_STATE_CHARACTER_MENU = "CHARACTER_MENU" # 추가
 
-# 전역 엔티티 리스트
+# 전역 엔티티 풀 (리스트처럼 append/순회/len 가능, 삭제는 remove로 O(1))
 player = None
 camera_obj = None
-slimes = []
-daggers = []
-exp_orbs = []
-bats = []
-slime_bullets = []
-boss_slimes = []
-storm_projectiles = []
+slimes = EntityPool('slimes')
+daggers = EntityPool('daggers')
+exp_orbs = EntityPool('exp_orbs')
+bats = EntityPool('bats')
+slime_bullets = EntityPool('slime_bullets')
+boss_slimes = EntityPool('boss_slimes')
+storm_projectiles = EntityPool('storm_projectiles')
 is_quit_confirm_open = False # 추가
 
 # 게임 정보 및 타이머
@@ -30,14 +34,16 @@ boss_active = False
 is_game_over_for_menu = False
 is_name_entered = False
 input_box = None
+replay_recorder = None # 진행 중인 판의 입력 기록 (core.replay.ReplayRecorder)
 
 # 랭킹 관련
-online_rankings = None
+online_rankings = {}      # 카테고리 -> 서버가 정렬해 준 상위 N개 (None이면 받는 중)
+online_rankings_time = {} # 카테고리 -> 요청한 시각 (time.monotonic, 실패한 카테고리는 빠짐)
 current_rank_category_index = 0
 RANK_CATEGORIES = ["DifficultyScore", "Levels", "Kills", "Bosses", "SurvivalTime"]
 
 def get_entities_dict():
-    """모든 엔티티 리스트를 딕셔너리로 반환 (충돌 로직 등에 사용)"""
+    """모든 엔티티 풀을 딕셔너리로 반환 (충돌 로직 등에 사용)"""
     return {
         'slimes': slimes,
         'daggers': daggers,
@@ -48,6 +54,18 @@ def get_entities_dict():
         'storm_projectiles': storm_projectiles
     }
 
+def _attach_recyclers():
+    """재활용 풀(ObjectPool)을 엔티티 풀에 붙입니다. (처음 게임을 시작할 때 한 번)"""
+    if daggers.recycler is not None: return
+    from entities.dagger import dagger_pool
+    from entities.exp_orb import exp_orb_pool
+    from entities.slime_bullet import slime_bullet_pool
+    from entities.storm_projectile import storm_projectile_pool
+    daggers.recycler = dagger_pool
+    exp_orbs.recycler = exp_orb_pool
+    slime_bullets.recycler = slime_bullet_pool
+    storm_projectiles.recycler = storm_projectile_pool
+
 def reset_game_state():
     """게임 상태를 초기화합니다."""
     global player, camera_obj, slimes, daggers, exp_orbs, bats, slime_bullets, boss_slimes, storm_projectiles
@@ -61,9 +79,12 @@ def reset_game_state():
     player = Player(config.MAP_WIDTH/2, config.MAP_HEIGHT/2, player_name_to_use)
     camera_obj = Camera(config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
     
-    # 3. 리스트 비우기
+    # 3. 풀 비우기
+    _attach_recyclers()
     slimes.clear(); daggers.clear(); exp_orbs.clear(); bats.clear()
     slime_bullets.clear(); boss_slimes.clear(); storm_projectiles.clear()
+    world_grid.clear()
+    horde.clear()
     
     # 4. 값 초기화
     slime_spawn_timer = 0
@@ -77,4 +98,5 @@ def reset_game_state():
         input_box.text = ""
         is_name_entered = False
     
-    online_rankings = None
\ No newline at end of file
+    online_rankings.clear() # 이번 판 점수가 반영되게 다음 랭킹 화면에서 새로 받음
+    online_rankings_time.clear()
\ No newline at end of file
@@ -0,0 +1,48 @@
+# core/timestep.py
+# 고정 틱 시뮬레이션: 그리기 속도와 상관없이 게임 로직은 항상 config.FPS 틱/초로 돌아갑니다.
+import config
+import utils
+
+class FixedTimestep:
+    """실제 경과 시간을 누적해 이번 프레임에 돌릴 틱 수를 정합니다.
+    한 프레임에 max_steps보다 많이 밀리면 나머지는 버립니다(따라잡기 한도)."""
+    def __init__(self, tick_rate, max_steps):
+        self.tick_dt = 1.0 / tick_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.dropped_ticks = 0 # 따라잡기 한도 때문에 버린 틱 수 (통계용)
+
+    def advance(self, dt):
+        """경과 시간(초)을 더하고 이번 프레임에 실행할 틱 수를 반환합니다."""
+        self.accumulator += dt
+        steps = int(self.accumulator / self.tick_dt)
+        if steps > self.max_steps:
+            self.dropped_ticks += steps - self.max_steps
+            steps = self.max_steps
+            self.accumulator %= self.tick_dt
+        else:
+            self.accumulator -= steps * self.tick_dt
+        return steps
+
+    def reset(self):
+        """일시정지 등으로 시뮬레이션을 멈출 때 누적 시간을 버립니다."""
+        self.accumulator = 0.0
+
+    @property
+    def alpha(self):
+        """직전 틱과 현재 틱 사이 어디쯤을 그릴지 (0~1)"""
+        return min(self.accumulator / self.tick_dt, 1.0)
+
+
+def snapshot_positions(pools):
+    """틱을 돌리기 직전 위치를 prev_x/prev_y에 저장합니다. (그리기 보간용)"""
+    for pool in pools:
+        for e in pool:
+            e.prev_x = e.world_x
+            e.prev_y = e.world_y
+
+def interpolated_position(obj, t):
+    """현재 위치에서 이번 틱 이동량의 t(= 1 - alpha)만큼 되돌린 월드 좌표 (그리기 보간용)"""
+    dx = utils.get_wrapped_delta(obj.prev_x, obj.world_x, config.MAP_WIDTH)
+    dy = utils.get_wrapped_delta(obj.prev_y, obj.world_y, config.MAP_HEIGHT)
+    return obj.world_x - dx * t, obj.world_y - dy * t
@@ -2,6 +2,10 @@
 echo ==========================================
 echo [1/3] 게임 빌드 시작 (pygbag)
 echo ==========================================
+:: 🚩 스프라이트를 게임에서 쓰는 크기로 미리 스케일해 묶음 파일 하나로 (image/sprites.bundle)
+:: 묶음에 들어간 PNG 폴더는 pygbag.ini로 웹 패키지에서 뺌. 묶음 만들기가 실패하면 pygbag.ini가 없어 PNG를 그대로 넣음
+if exist pygbag.ini del pygbag.ini
+py -m core.bundle --pygbag-ini
 :: 🚩 파이썬 버전 3.12/3.13 대응을 위해 py -m 사용
 py -m pygbag --build --title vampire_v4 .
 
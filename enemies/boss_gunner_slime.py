@@ -5,6 +5,7 @@ from enemies.shooter_slime import ShooterSlime
 from enemies.boss_minion_slime import BossMinionSlime
 
 class BossGunnerSlime(ShooterSlime, BossMinionSlime):
+    __slots__ = () # BossMinionSlime 쪽 슬롯이 비어 있어야 다중 상속이 가능
     def __init__(self, world_x, world_y, current_total_max_hp):
         # 1. ShooterSlime 스펙 설정 (반지름 및 속도)
         radius = config.SLIME_RADIUS
@@ -3,6 +3,7 @@ import config
 from enemies.mint_slime import MintSlime # MintSlime 클래스 상속
 
 class BossMinionSlime(MintSlime):
+    __slots__ = ()
     # 보스 미니언 슬라임도 current_total_max_hp를 받아서 계산
     def __init__(self, world_x, world_y, current_total_max_hp):
         # MintSlime의 특성을 그대로 상속받되, 색상만 변경
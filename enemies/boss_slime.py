@@ -4,11 +4,15 @@ import pygame
 import config
 import utils
 from enemies.slime import Slime
-from entities.slime_bullet import SlimeBullet
+from entities.slime_bullet import slime_bullet_pool
 from enemies.boss_minion_slime import BossMinionSlime
 from enemies.boss_gunner_slime import BossGunnerSlime # 🚩 신규 거너 임포트
+from core.grid import world_grid
 
 class BossSlime(Slime):
+    __slots__ = ('boss_index', 'is_phase2', 'stop_timer', 'shoot_cooldown_timer', 'shooter_summon_timer',
+                 'big_bullet_timer', 'minion_spawn_timer', 'initial_spawn_hp_for_minions')
+    horde_compatible = False # 자체 update를 사용
     def __init__(self, world_x, world_y, current_total_max_hp, boss_index): 
         # 1. 보스 기본 스펙 설정
         radius = config.SLIME_RADIUS * config.BOSS_SLIME_RADIUS_MULTIPLIER
@@ -65,7 +69,7 @@ class BossSlime(Slime):
             dy = utils.get_wrapped_delta(self.world_y, target_player_world_y, config.MAP_HEIGHT)
             self.world_x = (self.world_x + (dx / dist) * self.speed) % config.MAP_WIDTH
             self.world_y = (self.world_y + (dy / dist) * self.speed) % config.MAP_HEIGHT
-        self.rect.center = (int(self.world_x), int(self.world_y))
+        world_grid.update_enemy(self)
 
         # --- 공격 패턴 1: 샷건 (상시) ---
         self.shoot_cooldown_timer -= 1
@@ -81,7 +85,7 @@ class BossSlime(Slime):
                 spread = math.radians(6)
                 for i in range(count):
                     bullet_angle = angle + (i - count // 2) * spread
-                    bullets.append(SlimeBullet(self.world_x, self.world_y, bullet_angle, color=config.BOSS_BULLET_COLOR))
+                    bullets.append(slime_bullet_pool.acquire(self.world_x, self.world_y, bullet_angle, color=config.BOSS_BULLET_COLOR))
 
         # --- 패턴 2: 정예 거너 소환 (각성 전용) ---
         # 🚩 ShooterSlime 대신 BossGunnerSlime을 소환하여 경험치/킬수 제외
@@ -112,7 +116,7 @@ class BossSlime(Slime):
                     b_angle = math.atan2(utils.get_wrapped_delta(by, target_player_world_y, config.MAP_HEIGHT),
                                          utils.get_wrapped_delta(bx, target_player_world_x, config.MAP_WIDTH))
                     
-                    big_b = SlimeBullet(bx, by, b_angle, color=config.RED)
+                    big_b = slime_bullet_pool.acquire(bx, by, b_angle, color=config.RED)
                     big_b.size = config.SLIME_BULLET_SIZE * 3
                     big_b.lifespan = config.FPS * 5
                     bullets.append(big_b)
@@ -5,6 +5,7 @@ import config
 from enemies.slime import Slime # Slime 클래스 상속
 
 class MintSlime(Slime):
+    __slots__ = ()
     # 민트 슬라임도 current_total_max_hp를 받아서 계산
     def __init__(self, world_x, world_y, current_total_max_hp):
         radius = config.SLIME_RADIUS * config.MINT_SLIME_RADIUS_FACTOR
@@ -5,9 +5,11 @@ import pygame
 import config
 import utils
 from enemies.slime import Slime
-from entities.slime_bullet import SlimeBullet # 슬라임 총알을 발사하기 위해
+from entities.slime_bullet import slime_bullet_pool # 슬라임 총알을 발사하기 위해
 
 class ShooterSlime(Slime):
+    __slots__ = ('shoot_cooldown_timer',)
+    has_behavior = True
     # 슈터 슬라임도 current_total_max_hp를 받아서 계산
     def __init__(self, world_x, world_y, current_total_max_hp):
         radius = config.SLIME_RADIUS
@@ -19,7 +21,11 @@ class ShooterSlime(Slime):
     def update(self, target_player_world_x, target_player_world_y, game_entities_lists):
         if not super().update(target_player_world_x, target_player_world_y, game_entities_lists):
             return False
+        self.update_behavior(target_player_world_x, target_player_world_y, game_entities_lists)
+        return True
 
+    def update_behavior(self, target_player_world_x, target_player_world_y, game_entities_lists):
+        """사격 쿨타임을 돌리고 플레이어를 향해 총알을 발사합니다."""
         self.shoot_cooldown_timer -= 1
         if self.shoot_cooldown_timer <= 0:
             self.shoot_cooldown_timer = config.SHOOTER_SLIME_SHOOT_COOLDOWN
@@ -33,5 +39,4 @@ class ShooterSlime(Slime):
                 bullet_spawn_x = self.world_x + math.cos(angle) * (self.radius + config.SLIME_BULLET_SIZE)
                 bullet_spawn_y = self.world_y + math.sin(angle) * (self.radius + config.SLIME_BULLET_SIZE)
 
-                slime_bullets_list_ref.append(SlimeBullet(bullet_spawn_x, bullet_spawn_y, angle))
-        return True
\ No newline at end of file
+                slime_bullets_list_ref.append(slime_bullet_pool.acquire(bullet_spawn_x, bullet_spawn_y, angle))
\ No newline at end of file
@@ -3,7 +3,9 @@ import math
 import random
 import config
 import utils
-from core.grid import enemy_grid
+from core.grid import world_grid
+import core.sprites as sprites
+from core.pool import find_handle, resolve
 
 class BatMinion:
     STATE_WANDERING = 0
@@ -11,11 +13,18 @@ class BatMinion:
     STATE_COOLDOWN = 2
     _id_counter = 1
 
+    __slots__ = ('controller', 'player', 'world_x', 'world_y', 'prev_x', 'prev_y', 'bat_id', 'last_sec_x', 'last_sec_y', 'log_timer',
+                 'lifespan', 'state', 'target_handle', 'attack_cooldown_timer', 'angle',
+                 'wander_target_x', 'wander_target_y', 'time_to_new_wander_target', 'grid_cell', 'pool_slot')
+    size = config.BAT_SIZE
+    color = config.BAT_COLOR
+
     def __init__(self, controller_ref, world_x, world_y):
         self.controller = controller_ref
         self.player = self.controller.player 
         self.world_x = float(world_x % config.MAP_WIDTH)
         self.world_y = float(world_y % config.MAP_HEIGHT)
+        self.prev_x, self.prev_y = self.world_x, self.world_y # 직전 틱 위치 (그리기 보간용)
         self.bat_id = BatMinion._id_counter
         BatMinion._id_counter += 1
         
@@ -24,15 +33,16 @@ class BatMinion:
         self.last_sec_y = self.world_y
         self.log_timer = 0
         
-        self.size = config.BAT_SIZE
-        self.color = config.BAT_COLOR
+        self.angle = 0.0
         self.lifespan = config.BAT_LIFESPAN_SECONDS * config.FPS
         self.state = BatMinion.STATE_WANDERING
-        self.target_slime = None
+        self.target_handle = None # 공격 중인 적의 풀 핸들 (core.pool)
         self.attack_cooldown_timer = 0
         self.wander_target_x = self.world_x
         self.wander_target_y = self.world_y
         self.time_to_new_wander_target = 0
+        self.grid_cell = None
+        self.pool_slot = None
 
     def update(self, slimes_list, game_entities_lists):
         # ----------------------------------------------------
@@ -65,12 +75,9 @@ class BatMinion:
         if self.lifespan <= 0: return False
 
         # --- 적 발사체 제거 로직 (생략 방지용 유지) ---
-        bullets = game_entities_lists.get('slime_bullets')
-        if bullets:
-            for sb in bullets:
-                if not getattr(sb, 'is_hit_by_player_attack', False):
-                    if utils.distance_sq_wrapped(self.world_x, self.world_y, sb.world_x, sb.world_y, config.MAP_WIDTH, config.MAP_HEIGHT) < (self.size + sb.size)**2:
-                        sb.is_hit_by_player_attack = True
+        for sb in world_grid.iter_radius('enemy_bullets', self.world_x, self.world_y, self.size):
+            if not getattr(sb, 'is_hit_by_player_attack', False):
+                sb.is_hit_by_player_attack = True
 
         # --- 상태 머신 및 이동 로직 ---
         if self.attack_cooldown_timer > 0:
@@ -79,19 +86,20 @@ class BatMinion:
                 self.state = BatMinion.STATE_WANDERING
 
         if self.state == BatMinion.STATE_ATTACKING:
-            if not self.target_slime or self.target_slime.hp <= 0:
-                self.target_slime = None
+            target = resolve(self.target_handle) # 풀에서 빠진 적이면 None
+            if not target or target.hp <= 0:
+                self.target_handle = None
                 self.state = BatMinion.STATE_WANDERING
             else:
-                dx = utils.get_wrapped_delta(self.world_x, self.target_slime.world_x, config.MAP_WIDTH)
-                dy = utils.get_wrapped_delta(self.world_y, self.target_slime.world_y, config.MAP_HEIGHT)
+                dx = utils.get_wrapped_delta(self.world_x, target.world_x, config.MAP_WIDTH)
+                dy = utils.get_wrapped_delta(self.world_y, target.world_y, config.MAP_HEIGHT)
                 dist = math.sqrt(dx*dx + dy*dy)
-                if dist < (self.size + self.target_slime.radius):
-                    self.target_slime.take_damage(self.controller.damage)
+                if dist < (self.size + target.radius):
+                    target.take_damage(self.controller.damage)
                     self.player.heal(self.controller.damage * self.controller.lifesteal_percentage)
                     self.state = BatMinion.STATE_COOLDOWN
                     self.attack_cooldown_timer = config.BAT_ATTACK_COOLDOWN
-                    self.target_slime = None
+                    self.target_handle = None
                 elif dist > 0:
                     self.angle = math.atan2(dy, dx)
                     self.world_x = (self.world_x + math.cos(self.angle) * config.BAT_ATTACK_SPEED) % config.MAP_WIDTH
@@ -99,14 +107,14 @@ class BatMinion:
         
         if self.state != BatMinion.STATE_ATTACKING:
             if self.state == BatMinion.STATE_WANDERING:
-                nearby = enemy_grid.get_nearby_enemies(self.world_x, self.world_y, 2)
-                for s in nearby:
-                    if s.hp > 0 and utils.distance_sq_wrapped(self.world_x, self.world_y, s.world_x, s.world_y, config.MAP_WIDTH, config.MAP_HEIGHT) < config.BAT_DETECTION_RADIUS**2:
-                        self.target_slime = s
+                for s in world_grid.iter_enemies_in_radius(self.world_x, self.world_y, config.BAT_DETECTION_RADIUS, use_extent=False):
+                    if s.hp > 0:
+                        self.target_handle = find_handle((game_entities_lists['slimes'], game_entities_lists['boss_slimes']), s)
                         self.state = BatMinion.STATE_ATTACKING
                         break
             self._wander()
 
+        world_grid.update('player_projectiles', self)
         return True
 
     def _wander(self):
@@ -129,10 +137,5 @@ class BatMinion:
         else:
             self.time_to_new_wander_target = 0
 
-    def draw(self, surface, camera_offset_x, camera_offset_y):
-        scr_x = (self.world_x - camera_offset_x) % config.MAP_WIDTH
-        if scr_x > config.MAP_WIDTH / 2: scr_x -= config.MAP_WIDTH
-        scr_y = (self.world_y - camera_offset_y) % config.MAP_HEIGHT
-        if scr_y > config.MAP_HEIGHT / 2: scr_y -= config.MAP_HEIGHT
-        if -self.size < scr_x < config.SCREEN_WIDTH + self.size and -self.size < scr_y < config.SCREEN_HEIGHT + self.size:
-            pygame.draw.circle(surface, self.color, (int(scr_x), int(scr_y)), self.size)
\ No newline at end of file
+    def get_sprite(self):
+        return sprites.circle(self.color, self.size)
\ No newline at end of file
@@ -1,44 +1,46 @@
 # entities/exp_orb.py
 import pygame
-import math
 import config
 import utils
+from core.grid import world_grid
+import core.sprites as sprites
+from core.pool import ObjectPool
 
 class ExpOrb:
+    __slots__ = ('world_x', 'world_y', 'prev_x', 'prev_y', 'grid_cell', 'pool_slot')
+    # 모든 구슬이 공유하는 불변 값
+    radius = config.EXP_ORB_RADIUS
+    color = config.EXP_ORB_COLOR
+    speed = config.EXP_ORB_SPEED
+    value = config.EXP_ORB_VALUE
+
     def __init__(self, world_x, world_y):
+        self.grid_cell = None
+        self.pool_slot = None
+        self.reset(world_x, world_y)
+
+    def reset(self, world_x, world_y):
+        """풀에서 다시 꺼낼 때 위치만 새로 잡습니다."""
         self.world_x = float(world_x % config.MAP_WIDTH)
         self.world_y = float(world_y % config.MAP_HEIGHT)
-        self.radius = config.EXP_ORB_RADIUS
-        self.color = config.EXP_ORB_COLOR
-        self.speed = config.EXP_ORB_SPEED
-        self.rect = pygame.Rect(0,0, self.radius*2, self.radius*2)
-        self.rect.center = (self.world_x, self.world_y)
-        self.value = config.EXP_ORB_VALUE
+        self.prev_x, self.prev_y = self.world_x, self.world_y # 직전 틱 위치 (그리기 보간용)
+
+    @staticmethod
+    def update_all(orbs, target_player_world_x, target_player_world_y):
+        """모든 구슬을 한 번에 플레이어 쪽으로 끌어당깁니다. 플레이어에게 도착한 구슬 리스트를 반환합니다."""
+        orbs = list(orbs)
+        if not orbs: return []
+        new_xs, new_ys, arrived = utils.move_towards_wrapped(
+            [o.world_x for o in orbs], [o.world_y for o in orbs],
+            target_player_world_x, target_player_world_y, config.EXP_ORB_SPEED, config.MAP_WIDTH, config.MAP_HEIGHT)
+        for o, x, y in zip(orbs, new_xs, new_ys):
+            o.world_x = x
+            o.world_y = y
+            world_grid.update('pickups', o)
+        return [orbs[i] for i in arrived]
 
-    def update(self, target_player_world_x, target_player_world_y):
-        dist_sq = utils.distance_sq_wrapped(self.world_x, self.world_y, target_player_world_x, target_player_world_y, config.MAP_WIDTH, config.MAP_HEIGHT)
-        dist = math.sqrt(dist_sq)
-        if dist < self.speed:
-            self.world_x = target_player_world_x
-            self.world_y = target_player_world_y
-            return True
-        elif dist > 0:
-            dx_move = utils.get_wrapped_delta(self.world_x, target_player_world_x, config.MAP_WIDTH)
-            dy_move = utils.get_wrapped_delta(self.world_y, target_player_world_y, config.MAP_HEIGHT)
-            self.world_x += (dx_move / dist) * self.speed
-            self.world_y += (dy_move / dist) * self.speed
-        self.world_x %= config.MAP_WIDTH
-        self.world_y %= config.MAP_HEIGHT
-        return False
+    def get_sprite(self):
+        return sprites.circle(self.color, self.radius)
 
-    def draw(self, surface, camera_offset_x, camera_offset_y):
-        for dx_offset in [-config.MAP_WIDTH, 0, config.MAP_WIDTH]:
-            for dy_offset in [-config.MAP_HEIGHT, 0, config.MAP_HEIGHT]:
-                obj_world_x = self.world_x + dx_offset
-                obj_world_y = self.world_y + dy_offset
-                screen_x = obj_world_x - camera_offset_x
-                screen_y = obj_world_y - camera_offset_y
-                if -self.radius < screen_x < config.SCREEN_WIDTH + self.radius and \
-                   -self.radius < screen_y < config.SCREEN_HEIGHT + self.radius:
-                    pygame.draw.circle(surface, self.color, (int(screen_x), int(screen_y)), self.radius)
-                    return
\ No newline at end of file
+# 전역 오브젝트 풀 (ExpOrb(...) 대신 exp_orb_pool.acquire(...)로 생성)
+exp_orb_pool = ObjectPool(ExpOrb, config.EXP_ORB_POOL_SIZE)
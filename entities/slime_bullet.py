@@ -3,13 +3,25 @@ import pygame
 import math
 import config
 import utils
+from core.grid import world_grid
+import core.sprites as sprites
+from core.pool import ObjectPool
 
 class SlimeBullet:
+    __slots__ = ('world_x', 'world_y', 'prev_x', 'prev_y', 'angle', 'size', 'color', 'lifespan', 'is_hit_by_player_attack', 'grid_cell', 'pool_slot')
+    speed = config.SLIME_BULLET_SPEED
+
     def __init__(self, world_x, world_y, angle_to_player, color=config.SLIME_BULLET_COLOR):
+        self.grid_cell = None
+        self.pool_slot = None
+        self.reset(world_x, world_y, angle_to_player, color)
+
+    def reset(self, world_x, world_y, angle_to_player, color=config.SLIME_BULLET_COLOR):
+        """풀에서 다시 꺼낼 때 새로 만든 것과 같은 상태로 되돌립니다."""
         self.world_x = float(world_x % config.MAP_WIDTH)
         self.world_y = float(world_y % config.MAP_HEIGHT)
+        self.prev_x, self.prev_y = self.world_x, self.world_y # 직전 틱 위치 (그리기 보간용)
         self.angle = angle_to_player
-        self.speed = config.SLIME_BULLET_SPEED
         self.size = config.SLIME_BULLET_SIZE
         self.color = color
         self.lifespan = config.SLIME_BULLET_LIFESPAN_SECONDS * config.FPS
@@ -22,19 +34,14 @@ class SlimeBullet:
 
         self.world_x = (self.world_x + math.cos(self.angle) * self.speed) % config.MAP_WIDTH
         self.world_y = (self.world_y + math.sin(self.angle) * self.speed) % config.MAP_HEIGHT
+        world_grid.update('enemy_bullets', self)
         return True
 
-    def draw(self, surface, camera_offset_x, camera_offset_y):
-        for dx_offset in [-config.MAP_WIDTH, 0, config.MAP_WIDTH]:
-            for dy_offset in [-config.MAP_HEIGHT, 0, config.MAP_HEIGHT]:
-                obj_world_x_render = self.world_x + dx_offset
-                obj_world_y_render = self.world_y + dy_offset
-                screen_x = obj_world_x_render - camera_offset_x
-                screen_y = obj_world_y_render - camera_offset_y
-                if -self.size < screen_x < config.SCREEN_WIDTH + self.size and \
-                   -self.size < screen_y < config.SCREEN_HEIGHT + self.size:
-                    pygame.draw.circle(surface, self.color, (int(screen_x), int(screen_y)), self.size)
-                    return
+    def get_sprite(self):
+        return sprites.circle(self.color, self.size)
 
     def get_world_rect_for_collision(self):
-        return pygame.Rect(self.world_x - self.size // 2, self.world_y - self.size // 2, self.size, self.size)
\ No newline at end of file
+        return pygame.Rect(self.world_x - self.size // 2, self.world_y - self.size // 2, self.size, self.size)
+
+# 전역 오브젝트 풀 (SlimeBullet(...) 대신 slime_bullet_pool.acquire(...)로 생성)
+slime_bullet_pool = ObjectPool(SlimeBullet, config.SLIME_BULLET_POOL_SIZE)
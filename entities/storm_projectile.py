@@ -2,39 +2,45 @@ import pygame
 import math
 import config
 import utils
-from core.grid import enemy_grid
+from core.grid import world_grid
+from core.pool import ObjectPool
+import core.sprites as sprites
 
 class StormProjectile:
+    __slots__ = ('world_x', 'world_y', 'prev_x', 'prev_y', 'move_angle', 'rotation_angle', 'damage', 'radius', 'lifespan', 'vx', 'vy',
+                 'hit_radius', 'enemy_hit_timers', 'pool_slot')
+    rotation_speed = 0.15
+    sides = 3 # 삼각형
+    speed = config.STORM_PROJECTILE_SPEED
+    color = config.STORM_COLOR
+    hit_interval = config.FPS // 4
+
     def __init__(self, world_x, world_y, move_angle, damage, radius):
+        self.enemy_hit_timers = {} 
+        self.pool_slot = None
+        self.reset(world_x, world_y, move_angle, damage, radius)
+
+    def reset(self, world_x, world_y, move_angle, damage, radius):
+        """풀에서 다시 꺼낼 때 상태를 되돌립니다."""
         # 1. 위치 및 각도 초기화
         self.world_x = float(world_x % config.MAP_WIDTH)
         self.world_y = float(world_y % config.MAP_HEIGHT)
+        self.prev_x, self.prev_y = self.world_x, self.world_y # 직전 틱 위치 (그리기 보간용)
         self.move_angle = move_angle
         self.rotation_angle = 0.0
-        self.rotation_speed = 0.15
         
         self.damage = damage 
         self.radius = radius
-        self.speed = config.STORM_PROJECTILE_SPEED
-        self.color = config.STORM_COLOR
         self.lifespan = config.STORM_PROJECTILE_LIFESPAN_SECONDS * config.FPS
         
         # 🚩 [최적화] 이동 벡터 및 충돌 범위 미리 계산
         self.vx = math.cos(self.move_angle) * self.speed
         self.vy = math.sin(self.move_angle) * self.speed
-        self.hit_radius_sq = (self.radius + 15)**2
+        self.hit_radius = self.radius + 15
         
-        self.enemy_hit_timers = {} 
-        self.hit_interval = config.FPS // 4 
-        self.search_cells = math.ceil(self.radius / 250) + 1
+        self.enemy_hit_timers.clear()
 
-        # 🚩 [최적화] 드로잉용 전용 서피스 생성 (회전 연산 대용)
-        # 반지름의 2배 크기보다 약간 크게 설정
-        self.surf_size = int(self.radius * 2) + 4
-        self.proj_surface = pygame.Surface((self.surf_size, self.surf_size), pygame.SRCALPHA)
-        self.center_pos = self.surf_size // 2
-
-    def update(self, all_slimes_list):
+    def update(self):
         self.lifespan -= 1
         if self.lifespan <= 0: return False
 
@@ -52,46 +58,21 @@ class StormProjectile:
                 if self.enemy_hit_timers[enemy] <= 0:
                     del self.enemy_hit_timers[enemy]
 
-        # 주변 적 탐색 및 데미지 처리
-        nearby_enemies = enemy_grid.get_nearby_enemies(self.world_x, self.world_y, self.search_cells)
-        
-        for slime in nearby_enemies:
+        # 범위 안의 적만 중복 없이 탐색 및 데미지 처리 (중심점 기준)
+        for slime in world_grid.iter_enemies_in_radius(self.world_x, self.world_y, self.hit_radius, use_extent=False):
             if slime.hp > 0 and slime not in self.enemy_hit_timers:
-                dist_sq = utils.distance_sq_wrapped(self.world_x, self.world_y, slime.world_x, slime.world_y, config.MAP_WIDTH, config.MAP_HEIGHT)
-                if dist_sq < self.hit_radius_sq:
-                    slime.take_damage(self.damage)
-                    self.enemy_hit_timers[slime] = self.hit_interval
+                slime.take_damage(self.damage)
+                self.enemy_hit_timers[slime] = self.hit_interval
         return True
 
-    def draw(self, surface, camera_offset_x, camera_offset_y):
-        # 🚩 [최적화] rotate 함수 대신 직접 폴리곤 좌표 계산하여 그리기
-        self.proj_surface.fill((0, 0, 0, 0)) # 서피스 초기화
-        
-        points = []
-        for i in range(3):
-            # 현재 회전각(self.rotation_angle)을 적용하여 3개의 점 계산
-            angle = self.rotation_angle + (i * (2 * math.pi / 3))
-            px = self.center_pos + self.radius * math.cos(angle)
-            py = self.center_pos + self.radius * math.sin(angle)
-            points.append((px, py))
-        
-        # 작은 전용 서피스에 삼각형 그리기
-        pygame.draw.polygon(self.proj_surface, self.color, points)
+    @classmethod
+    def bake_sprites(cls, radius, live=()):
+        """이 반지름의 회전 프레임을 미리 구움 (첫 그리기에서 끊기지 않게). live: 아직 날아가는 발사체들 (그 크기는 남겨 둠)"""
+        sprites.bake_polygon(cls.color, radius, cls.sides, {p.radius for p in live})
 
-        # 9방향 그리기 로직 (최적화된 이미지 사용)
-        for dx_offset in [-config.MAP_WIDTH, 0, config.MAP_WIDTH]:
-            for dy_offset in [-config.MAP_HEIGHT, 0, config.MAP_HEIGHT]:
-                screen_x = (self.world_x + dx_offset) - camera_offset_x
-                screen_y = (self.world_y + dy_offset) - camera_offset_y
+    def get_sprite(self):
+        # 회전 프레임은 (색, 반지름)별로 한 번만 구워서 모든 폭풍이 같이 씀
+        return sprites.rotating_polygon(self.color, self.radius, self.sides, self.rotation_angle)
 
-                # 화면 범위 체크
-                if -self.radius < screen_x < config.SCREEN_WIDTH + self.radius and \
-                   -self.radius < screen_y < config.SCREEN_HEIGHT + self.radius:
-                    
-                    # 미리 그려둔 서피스를 화면에 blit
-                    surface.blit(self.proj_surface, (screen_x - self.center_pos, screen_y - self.center_pos))
-                    
-                    # 화면 중앙에 그려졌다면 나머지 8방향 체크 생략하고 리턴
-                    if (self.radius < screen_x < config.SCREEN_WIDTH - self.radius and 
-                        self.radius < screen_y < config.SCREEN_HEIGHT - self.radius):
-                        return
\ No newline at end of file
+# 전역 오브젝트 풀 (StormProjectile(...) 대신 storm_projectile_pool.acquire(...)로 생성)
+storm_projectile_pool = ObjectPool(StormProjectile, config.STORM_PROJECTILE_POOL_SIZE)
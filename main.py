@@ -1,65 +1,166 @@
+import core.startup as startup # 가장 먼저: 시작 시각 기록 + 저장소 모듈 import 시간 측정
+startup.timeline.install_import_timer()
 import pygame
 import asyncio
 import random
+import time
+startup.timeline.mark('import pygame')
 import config
 import utils
 import ui.ui as ui
 import core.state as state
-import core.physics as physics
-import core.logic as logic
-from core.grid import enemy_grid 
-from enemies.boss_minion_slime import BossMinionSlime
-from entities.exp_orb import ExpOrb
-from entities.bat_minion import BatMinion
+import core.timestep as timestep
+from core.outbox import score_outbox
+startup.timeline.mark('import menu modules')
+
+# 게임을 진행할 때만 필요한 모듈/에셋은 메뉴가 뜬 뒤 워밍업에서 읽습니다. (load_game_modules 등)
+engine = memory = render = replay = None
+background = None
+
+shake_rng = random.Random() # 화면 흔들림 전용 (게임 로직의 random 흐름을 건드리지 않게)
+background_tasks = set() # 실행 중인 백그라운드 작업 (이벤트 루프는 약한 참조만 들고 있어서 여기 안 두면 도중에 GC될 수 있음)
+
+def start_background_task(coro):
+    task = asyncio.create_task(coro)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    return task
 
 # ----------------------------------------------------
 # 1. 비동기 통신 래퍼 함수
 # ----------------------------------------------------
-async def load_rankings_data():
-    """백그라운드에서 랭킹 데이터를 로드합니다."""
-    utils.browser_debug("서버 데이터 요청 중...")
-    state.online_rankings = None
+async def load_rankings_data(category):
+    """백그라운드에서 카테고리 하나의 상위 랭킹을 로드합니다."""
+    utils.browser_debug(f"서버 데이터 요청 중... ({category})")
     try:
-        data = await utils.load_rankings_online()
-        state.online_rankings = data if data is not None else []
-        utils.browser_debug(f"데이터 수신 성공: {len(state.online_rankings)}개")
+        data = await utils.load_rankings_online(category)
     except Exception as e:
         utils.browser_debug(f"데이터 로드 실패: {e}", True)
-        state.online_rankings = []
+        data = None
+    if data is None:
+        state.online_rankings_time.pop(category, None) # 실패는 캐시하지 않음 (다음에 다시 요청)
+    else:
+        utils.browser_debug(f"데이터 수신 성공: {len(data)}개")
+    state.online_rankings[category] = data if data is not None else []
+
+def request_rankings(category):
+    """받아 둔 게 없거나 오래됐을 때만 서버에 요청합니다. (받는 중이면 그대로 기다림)"""
+    requested = state.online_rankings_time.get(category)
+    if requested is not None and time.monotonic() - requested < config.RANKING_CACHE_SECONDS: return
+    state.online_rankings_time[category] = time.monotonic()
+    state.online_rankings[category] = None
+    start_background_task(load_rankings_data(category))
 
-async def save_ranking_task(name, score):
-    """백그라운드에서 점수를 저장합니다."""
+def save_ranking(name, score):
+    """점수를 전송 대기열에 넣습니다. 로컬에 저장만 하고 바로 돌아오며, 실제 전송은 score_outbox.run이 백그라운드에서 합니다."""
     try:
         utils.browser_debug(f"점수 저장 시작: {name}")
-        success = await utils.save_new_ranking_online(name, score)
-        if success:
-            utils.browser_debug("서버 저장 완료!")
+        score_outbox.enqueue(name, score)
+        start_background_task(score_outbox.flush()) # 다음 폴링을 기다리지 않고 바로 한 번 시도
     except Exception as e:
         utils.browser_debug(f"저장 중 오류 발생: {e}", True)
 
 # ----------------------------------------------------
-# 2. 메인 실행 함수
+# 2. 시뮬레이션 1틱 (고정 간격으로 호출됨)
+# ----------------------------------------------------
+def is_simulating():
+    """지금 게임 로직을 진행해야 하는지 (플레이 중이고 업그레이드 선택 중이 아닐 때만)"""
+    return (state.game_state == state.GAME_STATE_PLAYING and state.player is not None
+            and not (state.player.is_selecting_upgrade or state.player.is_selecting_boss_reward))
+
+def save_replay():
+    """진행 중이던 판의 리플레이를 저장합니다. (실패해도 게임은 계속)"""
+    recorder = state.replay_recorder
+    if recorder is None: return
+    state.replay_recorder = None
+    try:
+        recorder.save(config.REPLAY_PATH, state)
+        utils.browser_debug(f"리플레이 저장: {config.REPLAY_PATH} ({recorder.tick}틱)")
+    except Exception as e:
+        utils.browser_debug(f"리플레이 저장 실패: {e}", True)
+
+def simulate_tick(profiler=None):
+    alive = engine.step(state, profiler)
+    if state.replay_recorder: state.replay_recorder.tick_done()
+    if not alive:
+        save_replay()
+        # 사망 처리 (게임 중이거나 캐릭터 메뉴에서 Quit을 눌렀을 때 작동)
+        save_ranking(state.player.name, engine.build_score(state))
+        state.game_state = state.GAME_STATE_MENU
+        state.is_game_over_for_menu = True
+
+# ----------------------------------------------------
+# 3. 메뉴 중 워밍업 (첫 화면을 먼저 띄우고 나머지는 프레임마다 조금씩)
+# ----------------------------------------------------
+def load_game_modules():
+    """게임 로직/그리기 모듈 (적, 보스, 물리, 리플레이 포함)"""
+    global engine, memory, render, replay
+    import core.engine as engine
+    import core.memory as memory
+    import core.render as render
+    import core.replay as replay
+
+def load_weapon_modules():
+    import weapons.dagger_launcher, weapons.flail_weapon, weapons.whip_weapon, weapons.bat_controller
+    import skills.storm_skill
+
+def load_background():
+    global background
+    from core.assets import BACKGROUND_PATH
+    background = render.load_background(BACKGROUND_PATH)
+
+def build_warmup_queue():
+    import ui.fonts as fonts
+    from core.assets import assets, slime_sprite_sets
+    warmup = startup.WarmupQueue(startup.timeline)
+    warmup.add('import game modules', load_game_modules)
+    warmup.add('import weapons/skills', load_weapon_modules)
+    for f in fonts.ALL_FONTS:
+        warmup.add(f'font {f.size}', f.load)
+    warmup.add('asset bundle', assets.open_bundle)
+    warmup.add('background', load_background)
+    # 슬라임 스프라이트는 게임 중 처음 나올 때 끊기지 않게 게임 시작 전에 전부 읽어 둠
+    def preload_sprites(prefix, radius):
+        from enemies.slime import Slime
+        assets.preload_set(prefix, radius, Slime.flash_tint)
+    for prefix, radius in slime_sprite_sets():
+        warmup.add(f'sprites {prefix}@{int(radius * 2)}', lambda p=prefix, r=radius: preload_sprites(p, r))
+    warmup.add('sprites done', assets.end_preload)
+    def bake_storm():
+        from entities.storm_projectile import StormProjectile
+        StormProjectile.bake_sprites(config.STORM_PROJECTILE_RADIUS)
+    warmup.add('storm atlas', bake_storm)
+    def report():
+        print(f"첫 화면 {startup.timeline.first_paint_ms or 0:.0f}ms, 워밍업 끝 {startup.timeline.now_ms():.0f}ms, "
+              f"에셋 {assets.total_bytes() / 1024:.0f}KB")
+        if config.STARTUP_REPORT: print(startup.timeline.report())
+    warmup.on_done = report
+    return warmup
+
+# ----------------------------------------------------
+# 4. 메인 실행 함수
 # ----------------------------------------------------
 async def main():
     pygame.init()
     screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
     pygame.display.set_caption("뱀파이어 서바이벌 v.3 (Final Fix)")
     clock = pygame.time.Clock()
+    startup.timeline.mark('display init')
 
     # UI 및 입력창 초기화
     state.input_box = ui.InputBox((config.SCREEN_WIDTH // 2) - 150, (config.SCREEN_HEIGHT // 2) + 100, 300, 50)
     ui.setup_ranking_buttons()
 
     # 배경 이미지 로드
-    background_image = None
-    bg_w, bg_h = 0, 0
-    try:
-        background_image = pygame.image.load("image/background/background.png").convert()
-        bg_w, bg_h = background_image.get_size()
-    except:
-        print("배경 이미지 로드 실패 - 기본 배경 사용")
+    warmup = build_warmup_queue()
+
+    # 지난번에 못 보낸 점수가 있으면 백그라운드에서 보냄. 보내고 나면 랭킹을 새로 받게 캐시 시각을 지움
+    score_outbox.on_sent = state.online_rankings_time.clear
+    start_background_task(score_outbox.run())
 
     running = True
+    sim_clock = timestep.FixedTimestep(config.FPS, config.MAX_SIM_STEPS_PER_FRAME)
+    perf_overlay = ui.PerfOverlay() # F3
     
     # 메뉴 버튼 객체
     start_btn = pygame.Rect(0, 0, 200, 80)
@@ -67,13 +168,17 @@ async def main():
     exit_btn = pygame.Rect(config.SCREEN_WIDTH - 50, 10, 40, 40)
 
     while running:
-        dt = clock.tick(config.FPS) / 1000.0
+        dt = clock.tick(config.RENDER_FPS) / 1000.0
+        prof = perf_overlay.begin_frame() # 오버레이가 꺼져 있으면 None
         mouse_pos = pygame.mouse.get_pos()
 
         # --- 이벤트 처리 섹션 ---
         for event in pygame.event.get():
             if event.type == pygame.QUIT: 
                 running = False
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3: # 디버그: 성능 오버레이
+                perf_overlay.toggle()
+                prof = None # 켠 프레임은 기록하지 않음
             
             # [메뉴 상태]
             if state.game_state == state.GAME_STATE_MENU:
@@ -82,11 +187,15 @@ async def main():
                 
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     if start_btn.collidepoint(mouse_pos) and state.is_name_entered:
+                        warmup.finish() # 아직 못 읽은 게 있으면 여기서 마저 읽음
+                        seed = replay.new_seed()
+                        random.seed(seed)
                         state.reset_game_state()
+                        if config.REPLAY_RECORDING: replay.begin_recording(state, seed)
                         state.game_state = state.GAME_STATE_PLAYING
                     elif rank_btn.collidepoint(mouse_pos):
                         state.game_state = state.GAME_STATE_RANKING
-                        asyncio.create_task(load_rankings_data()) 
+                        request_rankings(state.RANK_CATEGORIES[state.current_rank_category_index])
             
             # [랭킹 상태]
             elif state.game_state == state.GAME_STATE_RANKING:
@@ -94,6 +203,7 @@ async def main():
                     for btn in ui.RANKING_BUTTONS:
                         if btn['rect'].collidepoint(mouse_pos):
                             state.current_rank_category_index = state.RANK_CATEGORIES.index(btn['key'])
+                            request_rankings(btn['key'])
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                     state.game_state = state.GAME_STATE_MENU
 
@@ -103,11 +213,17 @@ async def main():
                     if event.key == pygame.K_z:
                         if state.player and state.player.special_skill:
                             state.player.special_skill.activate(state.get_entities_dict())
+                            if state.replay_recorder: state.replay_recorder.record('skill')
                     
                     # 🚩 M키 누르면 캐릭터 창으로 이동
                     if event.key == pygame.K_m: 
                         state.game_state = state.GAME_STATE_CHARACTER_MENU
+                    elif event.key == pygame.K_F9: # 디버그: 엔티티 메모리 리포트 출력
+                        memory.print_memory_report(state)
+                        from core.assets import assets
+                        assets.print_report()
                     elif event.key == pygame.K_ESCAPE: 
+                        save_replay()
                         state.game_state = state.GAME_STATE_MENU
                     
                     elif state.player.is_selecting_boss_reward or state.player.is_selecting_upgrade:
@@ -117,12 +233,12 @@ async def main():
                         elif event.key == pygame.K_3: choice = 2
                         
                         if choice != -1:
+                            if state.replay_recorder:
+                                state.replay_recorder.record('reward' if state.player.is_selecting_boss_reward else 'upgrade', choice)
                             if state.player.is_selecting_boss_reward:
                                 state.player.apply_chosen_boss_reward(choice)
                             else:
-                                removed = state.player.apply_chosen_upgrade(choice)
-                                if removed:
-                                    state.bats[:] = [b for b in state.bats if not (isinstance(b, BatMinion) and b.controller == removed)]
+                                engine.apply_upgrade_choice(state, choice)
 
             # [🚩 캐릭터 메뉴 상태]
             elif state.game_state == state.GAME_STATE_CHARACTER_MENU:
@@ -140,6 +256,7 @@ async def main():
                     else:
                         if ui.CONFIRM_YES_BTN.collidepoint(mouse_pos):
                             state.player.hp = 0 # 사망 판정 유도
+                            if state.replay_recorder: state.replay_recorder.record('quit')
                             state.game_state = state.GAME_STATE_PLAYING
                             state.is_quit_confirm_open = False
                         elif ui.CONFIRM_NO_BTN.collidepoint(mouse_pos):
@@ -152,61 +269,37 @@ async def main():
                         # 🚩 인벤토리에서 나가면 캐릭터 메뉴로 복귀
                         state.game_state = state.GAME_STATE_CHARACTER_MENU
 
-        # --- 게임 업데이트 로직 ---
-        if state.game_state in [state.GAME_STATE_PLAYING, state.GAME_STATE_CHARACTER_MENU, state.GAME_STATE_INVENTORY] and state.player:
-            # 캐릭터 메뉴나 인벤토리 중에는 시간 정지 (PLAYING 상태일 때만 로직 수행)
-            if state.game_state == state.GAME_STATE_PLAYING and not (state.player.is_selecting_upgrade or state.player.is_selecting_boss_reward):
-                
-                enemy_grid.clear()
-                for s in state.slimes + state.boss_slimes:
-                    if s.hp > 0: enemy_grid.register_enemy(s)
+        if not warmup.done and state.game_state not in (state.GAME_STATE_MENU, state.GAME_STATE_RANKING):
+            warmup.finish() # 메뉴를 거치지 않고 게임 상태가 됐을 때도 로직 모듈이 있도록
+        if prof: prof.lap('events')
 
-                state.player.update(state.slimes, state.get_entities_dict())
-                
-                # 사망 처리 (게임 중이거나 캐릭터 메뉴에서 Quit을 눌렀을 때 작동)
-                if state.player.hp <= 0:
-                    score = {
-                        "levels": state.player.level, "kills": state.player.total_enemies_killed,
-                        "bosses": state.player.total_bosses_killed, 
-                        "difficulty_score": state.current_slime_max_hp / config.SLIME_INITIAL_BASE_HP,
-                        "survival_time": state.slime_hp_increase_timer / config.FPS
-                    }
-                    asyncio.create_task(save_ranking_task(state.player.name, score))
-                    state.game_state = state.GAME_STATE_MENU
-                    state.is_game_over_for_menu = True
-                
-                if state.game_state == state.GAME_STATE_PLAYING:
-                    state.camera_obj.update(state.player)
-                    logic.update_game_logic(state)
-                    logic.handle_boss_logic(state)
-                    
-                    slimes_to_rem = [s for s in state.slimes if not s.update(state.player.world_x, state.player.world_y, state.get_entities_dict())]
-                    for s in slimes_to_rem:
-                        if s.hp <= 0 and not isinstance(s, BossMinionSlime):
-                            state.player.total_enemies_killed += 1
-                            state.exp_orbs.append(ExpOrb(s.world_x, s.world_y))
-                    state.slimes[:] = [s for s in state.slimes if s not in slimes_to_rem]
-                    
-                    physics.handle_collisions(state)
-                    state.daggers[:] = [d for d in state.daggers if d.update(state.get_entities_dict())]
+        # --- 게임 업데이트 로직 (고정 틱) ---
+        # 캐릭터 메뉴/인벤토리/업그레이드 선택 중에는 시간 정지 (누적 시간도 버림)
+        for _ in range(sim_clock.advance(dt)):
+            if not is_simulating():
+                sim_clock.reset()
+                break
+            simulate_tick(prof)
+        alpha = sim_clock.alpha if (config.RENDER_INTERPOLATION and is_simulating()) else 1.0
 
         # --- 그리기 섹션 ---
         if state.game_state in [state.GAME_STATE_PLAYING, state.GAME_STATE_INVENTORY, state.GAME_STATE_CHARACTER_MENU] and state.player:
             off_x, off_y = 0, 0
             if state.game_state == state.GAME_STATE_PLAYING and state.player.shake_intensity > 0:
-                off_x = random.uniform(-state.player.shake_intensity, state.player.shake_intensity)
-                off_y = random.uniform(-state.player.shake_intensity, state.player.shake_intensity)
+                off_x = shake_rng.uniform(-state.player.shake_intensity, state.player.shake_intensity)
+                off_y = shake_rng.uniform(-state.player.shake_intensity, state.player.shake_intensity)
             
             shake_cam_x = state.camera_obj.world_x + off_x
             shake_cam_y = state.camera_obj.world_y + off_y
+            # 엔티티용 카메라: 플레이어(=카메라)도 직전 틱과 현재 틱 사이로 보간
+            t = 1.0 - alpha
+            lerp_cam_x = shake_cam_x - utils.get_wrapped_delta(state.player.prev_world_x, state.player.world_x, config.MAP_WIDTH) * t
+            lerp_cam_y = shake_cam_y - utils.get_wrapped_delta(state.player.prev_world_y, state.player.world_y, config.MAP_HEIGHT) * t
 
             # 1. 배경
-            if background_image:
-                sx, sy = -(shake_cam_x % bg_w), -(shake_cam_y % bg_h)
-                for y in range((config.SCREEN_HEIGHT // bg_h) + 2):
-                    for x in range((config.SCREEN_WIDTH // bg_w) + 2):
-                        screen.blit(background_image, (sx + x * bg_w, sy + y * bg_h))
+            if background: background.draw(screen, lerp_cam_x, lerp_cam_y)
             else: screen.fill(config.GREEN)
+            if prof: prof.lap('draw_bg')
 
             # 2. 엔티티 (플레이 중이거나 메뉴 중에도 배경으로 보임)
             for wpn in state.player.active_weapons: wpn.draw(screen, shake_cam_x, shake_cam_y)
@@ -215,8 +308,8 @@ async def main():
                 p_rect.x -= off_x; p_rect.y -= off_y
                 screen.blit(state.player.image, p_rect)
             
-            for e in state.exp_orbs + state.daggers + state.bats + state.slime_bullets + state.storm_projectiles + state.slimes + state.boss_slimes:
-                e.draw(screen, shake_cam_x, shake_cam_y)
+            render.draw_entities(screen, state, alpha, lerp_cam_x, lerp_cam_y)
+            if prof: prof.lap('draw_world')
             
             # 3. HUD
             ui.draw_game_ui(screen, state.player, state.get_entities_dict(), state.current_slime_max_hp, state.player.total_bosses_killed, state.player.total_enemies_killed, config.BOSS_SLIME_SPAWN_KILL_THRESHOLD)
@@ -238,11 +331,18 @@ async def main():
             
         elif state.game_state == state.GAME_STATE_RANKING:
             cat = state.RANK_CATEGORIES[state.current_rank_category_index]
-            filtered = [r for r in (state.online_rankings or []) if r.get('RankCategory') == cat]
-            filtered.sort(key=lambda x: x.get('RankValue', 0), reverse=True)
-            ui.draw_ranking_screen(screen, filtered, cat)
+            ui.draw_ranking_screen(screen, state.online_rankings.get(cat), cat) # 서버에서 이미 정렬/자른 목록
+
+        if prof: prof.lap('draw_hud')
 
+        perf_overlay.draw(screen, state)
+        if prof: prof.lap('overlay')
         pygame.display.flip()
+        startup.timeline.first_paint() # 첫 번째 flip만 기록됨
+        if not warmup.done: warmup.step(config.STARTUP_WARMUP_BUDGET_MS)
+        if prof:
+            prof.lap('flip')
+            perf_overlay.end_frame()
         await asyncio.sleep(0) 
 
 if __name__ == "__main__":
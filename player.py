@@ -4,12 +4,8 @@ import random
 import config
 import utils
 
-# 무기 및 스킬 임포트
-from weapons.dagger_launcher import DaggerLauncher
-from weapons.flail_weapon import FlailWeapon
-from weapons.whip_weapon import WhipWeapon
-from weapons.bat_controller import BatController
-from skills.storm_skill import StormSkill
+from core.input import KeyboardInput
+# 무기/스킬 모듈은 처음 쓸 때 import (메뉴가 뜨기 전에 읽지 않도록. main이 메뉴 중에 미리 읽어 둠)
 
 class Player(pygame.sprite.Sprite):
     def __init__(self, initial_world_x, initial_world_y, name="Player"):
@@ -22,6 +18,7 @@ class Player(pygame.sprite.Sprite):
         self.world_y = float(initial_world_y)
         self.prev_world_x = self.world_x
         self.prev_world_y = self.world_y
+        self.input_source = KeyboardInput() # 헤드리스 실행 시 스크립트/AI 입력으로 교체
         
         self.name = name
         self.max_hp = config.PLAYER_INITIAL_HP
@@ -37,6 +34,10 @@ class Player(pygame.sprite.Sprite):
         
         self.active_weapons = []
         self.shake_intensity = 0.0
+        from weapons.dagger_launcher import DaggerLauncher
+        from weapons.flail_weapon import FlailWeapon
+        from weapons.whip_weapon import WhipWeapon
+        from weapons.bat_controller import BatController
         self.available_new_weapons = [DaggerLauncher, FlailWeapon, WhipWeapon, BatController]
         self.acquire_new_weapon(DaggerLauncher)
         
@@ -80,12 +81,8 @@ class Player(pygame.sprite.Sprite):
             if self.shake_intensity < 0: self.shake_intensity = 0
 
         # 이동 처리
-        keys = pygame.key.get_pressed()
-        dx, dy = 0, 0
-        if keys[pygame.K_LEFT]: dx = -config.PLAYER_SPEED
-        if keys[pygame.K_RIGHT]: dx = config.PLAYER_SPEED
-        if keys[pygame.K_UP]: dy = -config.PLAYER_SPEED
-        if keys[pygame.K_DOWN]: dy = config.PLAYER_SPEED
+        move_x, move_y = self.input_source.get_move(self)
+        dx, dy = move_x * config.PLAYER_SPEED, move_y * config.PLAYER_SPEED
 
         if dx != 0 or dy != 0:
             self.facing_angle = math.atan2(dy, dx)
@@ -173,6 +170,7 @@ class Player(pygame.sprite.Sprite):
         utils.browser_debug(f"보스 처치! 현재 경험치 배수: {self.exp_multiplier:.2f}배")
         
         if not self.special_skill:
+             from skills.storm_skill import StormSkill
              self.special_skill = StormSkill(self)
              print("특수 스킬 '태풍' 획득! (Z키)")
         else:
@@ -1,7 +1,7 @@
 import math
 import config
 import utils
-from entities.storm_projectile import StormProjectile
+from entities.storm_projectile import StormProjectile, storm_projectile_pool
 
 class StormSkill:
     def __init__(self, player_ref):
@@ -15,6 +15,7 @@ class StormSkill:
         self.cooldown = config.STORM_SKILL_COOLDOWN_SECONDS * config.FPS
         self.cooldown_timer = self.cooldown
         self.num_projectiles = config.STORM_SKILL_INITIAL_NUM
+        self.projectiles = () # 발사한 폭풍이 들어가는 목록 (업그레이드 때 날아가는 크기를 알기 위해 activate에서 기억)
 
     def update(self):
         if self.cooldown_timer < self.cooldown:
@@ -25,6 +26,7 @@ class StormSkill:
             self.cooldown_timer = 0
             storm_list = game_entities_lists.get('storm_projectiles')
             if storm_list is None: return
+            self.projectiles = storm_list
 
             center_angle = self.player.facing_angle
             
@@ -39,7 +41,7 @@ class StormSkill:
 
             for angle in angles:
                 # 강화된 수치를 적용하여 투사체 생성
-                storm_list.append(StormProjectile(
+                storm_list.append(storm_projectile_pool.acquire(
                     self.player.world_x, self.player.world_y, 
                     angle, self.current_damage, self.current_radius
                 ))
@@ -89,6 +91,7 @@ class StormSkill:
             self.current_damage = upgrade_info["value"]
         elif upgrade_info["type"] == "range":
             self.current_radius = upgrade_info["value"]
+            StormProjectile.bake_sprites(self.current_radius, self.projectiles) # 선택 화면에 있는 동안 새 크기를 구워 둠
         elif upgrade_info["type"] == "cooldown":
             self.cooldown = upgrade_info["value"]
         self.level += 1
\ No newline at end of file
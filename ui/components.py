@@ -1,6 +1,7 @@
 import pygame
 import config
 from ui.fonts import medium_font
+from ui.text_cache import render_text
 
 class InputBox:
     def __init__(self, x, y, w, h, text=''):
@@ -31,5 +32,5 @@ class InputBox:
         pygame.draw.rect(screen, self.color, self.rect, 3, border_radius=5)
         if self.font:
             display_text = self.text if self.text else "닉네임을 입력하세요"
-            txt_s = self.font.render(display_text, True, config.WHITE)
+            txt_s = render_text(self.font, display_text, True, config.WHITE)
             screen.blit(txt_s, txt_s.get_rect(center=self.rect.center))
\ No newline at end of file
@@ -2,24 +2,42 @@ import pygame
 
 pygame.font.init()
 FONT_FILE_NAME = 'D2Coding.ttf'
+FALLBACK_FONTS = ["Malgun Gothic", "NanumGothic", "Arial"]
 
-font = None
-small_font = None
-large_font = None
-medium_font = None
-
-try:
-    font = pygame.font.Font(FONT_FILE_NAME, 30)
-    small_font = pygame.font.Font(FONT_FILE_NAME, 24)
-    large_font = pygame.font.Font(FONT_FILE_NAME, 74)
-    medium_font = pygame.font.Font(FONT_FILE_NAME, 36)
-except:
-    fallback = ["Malgun Gothic", "NanumGothic", "Arial"]
-    for f in fallback:
+_use_font_file = True # 폰트 파일이 없으면 한 번 실패한 뒤로는 바로 시스템 폰트로
+
+def _create_font(size):
+    global _use_font_file
+    if _use_font_file:
+        try:
+            return pygame.font.Font(FONT_FILE_NAME, size)
+        except Exception:
+            _use_font_file = False
+    for f in FALLBACK_FONTS:
         try:
-            font = pygame.font.SysFont(f, 30)
-            small_font = pygame.font.SysFont(f, 24)
-            large_font = pygame.font.SysFont(f, 74)
-            medium_font = pygame.font.SysFont(f, 36)
-            break
-        except: continue
\ No newline at end of file
+            return pygame.font.SysFont(f, size)
+        except Exception: continue
+    return pygame.font.Font(None, size)
+
+class LazyFont:
+    """처음 쓸 때 실제 폰트를 만듭니다. render/size/get_linesize 등은 실제 Font로 그대로 넘깁니다.
+    메뉴에 안 쓰는 크기는 첫 화면이 뜬 뒤에 읽히게 됩니다. (main의 워밍업 또는 처음 그릴 때)"""
+    __slots__ = ('size', '_font')
+    def __init__(self, size):
+        self.size = size
+        self._font = None
+
+    def load(self):
+        if self._font is None: self._font = _create_font(self.size)
+        return self._font
+
+    def __getattr__(self, name):
+        return getattr(self.load(), name)
+
+font = LazyFont(30)
+small_font = LazyFont(24)
+large_font = LazyFont(74)
+medium_font = LazyFont(36)
+tiny_font = LazyFont(15) # 성능 오버레이용
+
+ALL_FONTS = (font, small_font, large_font, medium_font, tiny_font)
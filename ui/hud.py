@@ -1,12 +1,14 @@
 import pygame
 import config
 from ui.fonts import font, small_font, medium_font, large_font
+from ui.text_cache import render_text
+from ui.panel import RetainedPanel
 
 def draw_game_ui(surface, player_obj, game_entities, current_slime_max_hp_val, boss_defeat_count_val, slime_kill_count_val, boss_spawn_threshold_val):
     """게임 플레이 중의 UI를 그립니다."""
     
     # 1. 닉네임 표시
-    name_text = font.render(f"ID: {player_obj.name}", True, config.WHITE)
+    name_text = render_text(font, f"ID: {player_obj.name}", True, config.WHITE)
     surface.blit(name_text, (config.SCREEN_WIDTH - name_text.get_width() - 10, 10))
 
     # 2. HP 게이지 바
@@ -15,11 +17,11 @@ def draw_game_ui(surface, player_obj, game_entities, current_slime_max_hp_val, b
     pygame.draw.rect(surface, config.DARK_RED, (hp_x, hp_y, hp_w, hp_h), border_radius=3) 
     if hp_ratio > 0:
         pygame.draw.rect(surface, config.HP_BAR_GREEN, (hp_x, hp_y, int(hp_w * hp_ratio), hp_h), border_radius=3)
-    hp_text = small_font.render(f"HP: {int(player_obj.hp)}/{int(player_obj.max_hp)}", True, config.WHITE)
+    hp_text = render_text(small_font, f"HP: {int(player_obj.hp)}/{int(player_obj.max_hp)}", True, config.WHITE)
     surface.blit(hp_text, hp_text.get_rect(center=(hp_x + hp_w//2, hp_y + hp_h//2)))
 
     # 3. 레벨 표시
-    level_text = font.render(f"레벨: {player_obj.level}", True, config.WHITE)
+    level_text = render_text(font, f"레벨: {player_obj.level}", True, config.WHITE)
     surface.blit(level_text, (hp_x, hp_y + hp_h + 5))
 
     # 4. 경험치 바
@@ -28,7 +30,7 @@ def draw_game_ui(surface, player_obj, game_entities, current_slime_max_hp_val, b
     pygame.draw.rect(surface, config.DARK_RED, (exp_x, exp_y, exp_w, hp_h-5), border_radius=3)
     if exp_ratio > 0:
         pygame.draw.rect(surface, config.EXP_BAR_COLOR, (exp_x, exp_y, int(exp_w * exp_ratio), exp_h), border_radius=3)
-    exp_text = small_font.render(f"EXP: {player_obj.exp}/{player_obj.exp_to_level_up}", True, config.WHITE)
+    exp_text = render_text(small_font, f"EXP: {player_obj.exp}/{player_obj.exp_to_level_up}", True, config.WHITE)
     surface.blit(exp_text, exp_text.get_rect(center=(exp_x + exp_w//2, exp_y + exp_h//2)))
 
     # 5. 태풍 스킬 쿨타임 표시
@@ -40,13 +42,13 @@ def draw_game_ui(surface, player_obj, game_entities, current_slime_max_hp_val, b
         color = config.STORM_COLOR[:3] if cooldown_ratio >= 1.0 else (100, 100, 100)
         pygame.draw.rect(surface, color, (skill_x, skill_y, int(skill_w * min(1.0, cooldown_ratio)), skill_h), border_radius=3)
         txt = "태풍 READY (Z)" if cooldown_ratio >= 1.0 else f"태풍 로딩... {int(cooldown_ratio*100)}%"
-        surface.blit(small_font.render(txt, True, config.WHITE), (skill_x, skill_y - 25))
+        surface.blit(render_text(small_font, txt, True, config.WHITE), (skill_x, skill_y - 25))
 
     # 6. 난이도 및 보스 처치 수
     info_y = config.SCREEN_HEIGHT - 90
     diff_val = current_slime_max_hp_val / config.SLIME_INITIAL_BASE_HP
-    surface.blit(font.render(f"난이도: {diff_val:.1f}x", True, config.WHITE), (10, info_y))
-    surface.blit(font.render(f"보스 처치: {boss_defeat_count_val}", True, config.YELLOW), (10, info_y + 30))
+    surface.blit(render_text(font, f"난이도: {diff_val:.1f}x", True, config.WHITE), (10, info_y))
+    surface.blit(render_text(font, f"보스 처치: {boss_defeat_count_val}", True, config.YELLOW), (10, info_y + 30))
 
     # 7. 보스 소환 게이지
     bg_w, bg_h = 400, 25
@@ -56,7 +58,7 @@ def draw_game_ui(surface, player_obj, game_entities, current_slime_max_hp_val, b
     pygame.draw.rect(surface, (100, 50, 0), (bg_x, bg_y, bg_w, bg_h), border_radius=5) 
     if bg_ratio > 0:
         pygame.draw.rect(surface, (255, 140, 0), (bg_x, bg_y, int(bg_w * bg_ratio), bg_h), border_radius=5)
-    surface.blit(medium_font.render(f"다음 보스: {progress}/{boss_spawn_threshold_val}", True, config.WHITE), (bg_x + 100, bg_y))
+    surface.blit(render_text(medium_font, f"다음 보스: {progress}/{boss_spawn_threshold_val}", True, config.WHITE), (bg_x + 100, bg_y))
 
     # 🚩 8. 업그레이드 오버레이 (버그 수정 핵심!)
     # 우선순위: 보스 보상 창이 레벨업 창보다 먼저 보이게 합니다.
@@ -65,21 +67,25 @@ def draw_game_ui(surface, player_obj, game_entities, current_slime_max_hp_val, b
     elif player_obj.is_selecting_upgrade:
         draw_upgrade_overlay(surface, player_obj.upgrade_options_to_display, "LEVEL UP!")
 
-def draw_upgrade_overlay(surface, options, title_text):
-    """업그레이드/보상 선택창을 실제로 그리는 함수 (이게 누락되면 멈춤!)"""
-    overlay = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 200))
-    surface.blit(overlay, (0, 0))
+def _build_upgrade_overlay(panel, title_text, option_texts):
+    panel.fill((0, 0, 0, 200))
     
-    title_s = large_font.render(title_text, True, config.YELLOW)
-    surface.blit(title_s, title_s.get_rect(center=(config.SCREEN_WIDTH//2, config.SCREEN_HEIGHT//4)))
+    title_s = render_text(large_font, title_text, True, config.YELLOW)
+    panel.blit(title_s, title_s.get_rect(center=(config.SCREEN_WIDTH//2, config.SCREEN_HEIGHT//4)))
     
     box_w, box_h, spacing = 600, 60, 20
     start_y = config.SCREEN_HEIGHT//2 - 50
-    for i, opt in enumerate(options):
+    for i, text in enumerate(option_texts):
         rect = pygame.Rect((config.SCREEN_WIDTH - box_w)//2, start_y + i*(box_h + spacing), box_w, box_h)
-        pygame.draw.rect(surface, config.UI_OPTION_BOX_BG_COLOR, rect, border_radius=15)
-        pygame.draw.rect(surface, config.UI_OPTION_BOX_BORDER_COLOR, rect, 3, border_radius=15)
+        pygame.draw.rect(panel, config.UI_OPTION_BOX_BG_COLOR, rect, border_radius=15)
+        pygame.draw.rect(panel, config.UI_OPTION_BOX_BORDER_COLOR, rect, 3, border_radius=15)
         
-        txt = medium_font.render(f"[{i+1}] {opt.get('text', '옵션 없음')}", True, config.WHITE)
-        surface.blit(txt, txt.get_rect(center=rect.center))
\ No newline at end of file
+        txt = render_text(medium_font, f"[{i+1}] {text}", True, config.WHITE)
+        panel.blit(txt, txt.get_rect(center=rect.center))
+
+upgrade_overlay_panel = RetainedPanel(_build_upgrade_overlay)
+
+def draw_upgrade_overlay(surface, options, title_text):
+    """업그레이드/보상 선택창을 실제로 그리는 함수 (이게 누락되면 멈춤!)
+    선택지가 그대로인 동안은 합성해 둔 패널을 blit 한 번으로 그립니다."""
+    upgrade_overlay_panel.draw(surface, (title_text, tuple(opt.get('text', '옵션 없음') for opt in options)))
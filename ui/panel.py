@@ -0,0 +1,39 @@
+# ui/panel.py
+# 유지형(retained) UI 패널: 오버레이/메뉴를 화면 크기 서피스 하나에 합성해 두고, 입력값이 바뀔 때만 다시 그립니다.
+# 나머지 프레임은 blit 한 번으로 끝납니다. (매 프레임 전체 화면 SRCALPHA 할당 + 사각형/글자 수십 번 그리기 대신)
+import pygame
+import config
+
+class RetainedPanel:
+    """build(panel_surface, *key)로 그린 결과를 key가 같으면 재사용합니다.
+    key는 그림에 영향을 주는 값만 담은 튜플 (옵션 목록, 스탯 스냅샷, 선택된 카테고리 등).
+    opaque=True면 화면 전체를 덮는 패널이라 알파 없는 서피스를 씁니다. (blit이 더 빠름)
+    area를 주면 그 사각형만 blit합니다. (작은 팝업: 좌표는 화면 기준 그대로 그리고 투명한 나머지는 건너뜀)"""
+    def __init__(self, build, opaque=False, area=None, size=(config.SCREEN_WIDTH, config.SCREEN_HEIGHT)):
+        self.build = build
+        self.opaque = opaque
+        self.area = pygame.Rect(area) if area is not None else None
+        self.size = size
+        self.surface = None
+        self.key = None
+        self.rebuilds = 0
+
+    def draw(self, surface, key):
+        if self.surface is None or key != self.key:
+            if self.surface is None:
+                self.surface = pygame.Surface(self.size) if self.opaque else pygame.Surface(self.size, pygame.SRCALPHA)
+            elif not self.opaque:
+                self.surface.fill((0, 0, 0, 0))
+            self.build(self.surface, *key)
+            self.key = key
+            self.rebuilds += 1
+        if self.area is None: surface.blit(self.surface, (0, 0))
+        else: surface.blit(self.surface, self.area.topleft, self.area)
+
+    def invalidate(self):
+        """다음 draw에서 무조건 다시 그리게 합니다. (key에 안 담긴 것이 바뀌었을 때)"""
+        self.key = None
+
+def rect_key(rect):
+    """Rect는 제자리에서 바뀌는 객체라 key에 그대로 넣으면 저장된 key도 같이 바뀜 -> 값으로 떼어 둠"""
+    return (rect.x, rect.y, rect.w, rect.h)
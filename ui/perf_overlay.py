@@ -0,0 +1,147 @@
+# ui/perf_overlay.py
+# F3으로 켜고 끄는 성능 오버레이: 구간별 프레임 시간 누적 그래프 + 엔티티 수 + 그리드 점유 통계
+# 꺼져 있을 때는 begin_frame()이 None을 돌려줘서 main/engine의 lap 호출이 전부 건너뛰어집니다.
+from collections import deque
+import pygame
+import config
+from core.profiler import TickProfiler
+from core.grid import world_grid
+from ui.fonts import tiny_font
+from ui.text_cache import render_text, text_cache
+
+# 구간 이름 -> 그래프 색 (쌓는 순서 = 프레임 안에서 실행되는 순서)
+PHASE_COLORS = {
+    'events':     (200, 200, 200),
+    'snapshot':   (170, 170, 170),
+    'weapons':    (255, 200, 60),
+    'spawn':      (180, 130, 255),
+    'boss':       (255, 90, 90),
+    'slimes':     (60, 200, 90),
+    'collisions': (255, 120, 40),
+    'storm':      (100, 180, 255),
+    'bullets':    (255, 80, 160),
+    'orbs':       (60, 200, 255),
+    'bats':       (200, 150, 100),
+    'daggers':    (230, 230, 120),
+    'draw_bg':    (150, 220, 150),
+    'draw_world': (60, 220, 200),
+    'draw_hud':   (140, 140, 255),
+    'overlay':    (130, 130, 130),
+    'flip':       (255, 255, 255),
+}
+OTHER_COLOR = (255, 0, 255)
+
+GRAPH_W, GRAPH_H = 240, 100   # 1px = 1프레임
+GRAPH_SCALE_MS = 33.3         # 그래프 높이 = 이 시간 (30FPS)
+TEXT_REFRESH_FRAMES = 15      # 글자/그리드 통계는 몇 프레임마다 다시 만듦
+AVERAGE_FRAMES = 60           # 범례의 평균 ms를 낼 최근 프레임 수
+PANEL_BG = (0, 0, 0, 170)
+
+class PerfOverlay:
+    def __init__(self, x=10, y=130):
+        self.visible = False
+        self.pos = (x, y)
+        self.profiler = TickProfiler(history=1) # 프레임 기록은 self.frames가 들고 있음
+        self.frames = deque(maxlen=AVERAGE_FRAMES)
+        self.graph = None
+        self.text_panel = None
+        self._frames_since_text = 0
+
+    def toggle(self):
+        self.visible = not self.visible
+        if self.visible:
+            # 다시 켤 때 예전 기록이 섞이지 않게 비움
+            self.frames.clear()
+            self.graph = pygame.Surface((GRAPH_W, GRAPH_H))
+            self.graph.fill((0, 0, 0))
+            self.text_panel = None
+            self._frames_since_text = TEXT_REFRESH_FRAMES
+        else:
+            self.graph = self.text_panel = None
+
+    def begin_frame(self):
+        """프레임 시작. 보일 때만 프로파일러를 돌려줍니다. (숨김 상태면 None -> lap 생략)"""
+        if not self.visible: return None
+        self.profiler.start()
+        return self.profiler
+
+    def end_frame(self):
+        if not self.visible: return
+        self.profiler.end_tick()
+        frame = self.profiler.last_tick
+        self.frames.append(frame)
+        self._push_column(frame)
+
+    def _push_column(self, frame):
+        """그래프를 1px 왼쪽으로 밀고 맨 오른쪽 열에 이번 프레임을 쌓아 그립니다. (전체 다시 그리기 X)"""
+        g = self.graph
+        g.scroll(-1, 0)
+        x = GRAPH_W - 1
+        g.fill((0, 0, 0), (x, 0, 1, GRAPH_H))
+        bottom = GRAPH_H
+        for name, ms in frame.items():
+            if name == 'total': continue
+            h = ms / GRAPH_SCALE_MS * GRAPH_H
+            if h < 0.5: continue
+            top = max(0, bottom - h)
+            g.fill(PHASE_COLORS.get(name, OTHER_COLOR), (x, int(top), 1, int(bottom) - int(top) or 1))
+            bottom = top
+            if bottom <= 0: break
+        # 60FPS 기준선
+        g.set_at((x, GRAPH_H - int(1000.0 / config.RENDER_FPS / GRAPH_SCALE_MS * GRAPH_H)), (255, 60, 60))
+
+    def _build_text_panel(self, game_state):
+        n = len(self.frames) or 1
+        totals = {}
+        for frame in self.frames:
+            for name, ms in frame.items():
+                totals[name] = totals.get(name, 0.0) + ms
+        frame_ms = totals.pop('total', 0.0) / n
+
+        lines = [(f"frame {frame_ms:5.2f} ms  ({1000.0 / frame_ms if frame_ms > 0 else 0:.0f} fps)", config.WHITE)]
+        for name, color in PHASE_COLORS.items():
+            if name in totals:
+                lines.append((f"{name:<11}{totals.pop(name) / n:6.2f}", color))
+        for name, total in totals.items(): # 색이 안 정해진 구간
+            lines.append((f"{name:<11}{total / n:6.2f}", OTHER_COLOR))
+
+        lines.append(("", config.WHITE))
+        for name, pool in game_state.get_entities_dict().items():
+            lines.append((f"{name:<15}{len(pool):6d}", config.WHITE))
+
+        from core.render import render_queue # 그리기 모듈은 메뉴가 뜬 뒤에 읽히므로 여기서
+        lines.append((f"{'sprites':<15}{render_queue.sprite_count:6d}", config.WHITE))
+        lines.append((f"{'blits calls':<15}{render_queue.batch_count:6d}", config.WHITE))
+        tc = text_cache.stats()
+        lines.append((f"text cache {tc['hit_rate'] * 100:5.1f}% {tc['entries']:4d} / {tc['bytes'] // 1024}KB", config.WHITE))
+
+        lines.append(("", config.WHITE))
+        lines.append(("grid       used/all  max", config.WHITE))
+        for name, layer in world_grid.layers.items():
+            cells = layer.grid
+            biggest = max(map(len, cells.values()), default=0)
+            total_cells = layer.grid_width_cells * layer.grid_height_cells
+            lines.append((f"{name[:10]:<10}{len(cells):5d}/{total_cells:<5d}{biggest:4d}", config.WHITE))
+
+        line_h = tiny_font.get_linesize()
+        rendered = [render_text(tiny_font, text, True, color) for text, color in lines if text]
+        width = max(GRAPH_W, max(s.get_width() for s in rendered)) + 10
+        panel = pygame.Surface((width, line_h * len(lines) + 10), pygame.SRCALPHA)
+        panel.fill(PANEL_BG)
+        y = 5
+        it = iter(rendered)
+        for text, _ in lines:
+            if text: panel.blit(next(it), (5, y))
+            y += line_h
+        return panel
+
+    def draw(self, surface, game_state):
+        if not self.visible: return
+        self._frames_since_text += 1
+        if self.text_panel is None or self._frames_since_text >= TEXT_REFRESH_FRAMES:
+            self.text_panel = self._build_text_panel(game_state)
+            self._frames_since_text = 0
+        x, y = self.pos
+        surface.blit(self.graph, (x, y))
+        pygame.draw.rect(surface, config.WHITE, (x, y, GRAPH_W, GRAPH_H), 1)
+        surface.blit(self.text_panel, (x, y + GRAPH_H + 4))
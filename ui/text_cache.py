@@ -0,0 +1,53 @@
+# ui/text_cache.py
+# 글자 렌더링 캐시: (폰트, 글자, 안티앨리어스, 색)이 같으면 font.render를 다시 하지 않고 서피스를 재사용합니다.
+# 한글 글리프 래스터화가 비싸서, 매 프레임 같은 문자열을 다시 그리는 HUD/랭킹/오버레이에 씁니다.
+# ⚠️ 돌려받은 서피스는 여럿이 공유하므로 blit만 하고 직접 수정하면 안 됩니다.
+from collections import OrderedDict
+import config
+
+class TextCache:
+    """LRU + 바이트 한도. 가장 오래 안 쓴 서피스부터 버립니다."""
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict() # 키 -> (서피스, 바이트)
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def render(self, font, text, antialias, color):
+        key = (font, text, antialias, tuple(color))
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        size = surf.get_width() * surf.get_height() * surf.get_bytesize()
+        self._entries[key] = (surf, size)
+        self.bytes += size
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, old_size) = self._entries.popitem(last=False)
+            self.bytes -= old_size
+            self.evictions += 1
+        return surf
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries), 'bytes': self.bytes, 'max_bytes': self.max_bytes,
+            'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+text_cache = TextCache(config.TEXT_CACHE_MAX_BYTES)
+
+def render_text(font, text, antialias, color):
+    """font.render(text, antialias, color)의 캐시 버전"""
+    return text_cache.render(font, text, antialias, color)
@@ -3,6 +3,7 @@
 from ui.fonts import font, small_font, medium_font, large_font
 from ui.components import InputBox
 from ui.hud import draw_game_ui
+from ui.perf_overlay import PerfOverlay
 from ui.screens import (
     draw_main_menu, 
     draw_ranking_screen, 
@@ -1,9 +1,15 @@
 import math
+import itertools
 import json
 import asyncio
 import sys
 import config
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # 1. 환경 감지 및 브릿지 준비
 IS_WEB = (sys.platform == "emscripten")
 js = None
@@ -13,8 +19,18 @@ if IS_WEB:
     except:
         pass
 
+_request_seq = itertools.count() # 웹 요청별 답장 칸 이름용
+
 # 🚩 Pylance 에러 방지 및 카테고리 정의
 RANK_CATEGORIES = ["Levels", "Kills", "Bosses", "DifficultyScore", "SurvivalTime"]
+# 카테고리 -> DB 컬럼명 (서버에서 이 컬럼으로 정렬)
+RANK_COLUMNS = {
+    "Levels": "levels",
+    "Kills": "kills",
+    "Bosses": "bosses",
+    "DifficultyScore": "difficulty_score",
+    "SurvivalTime": "survival_time",
+}
 
 def browser_debug(msg, is_error=False):
     full_msg = f"🚀 [Vampire-Bridge] {msg}"
@@ -28,7 +44,17 @@ def browser_debug(msg, is_error=False):
 # ----------------------------------------------------
 # 2. Supabase 통신 함수 (네 아이디어: 파이썬-JS-DB 중간다리)
 # ----------------------------------------------------
-async def _fetch_supabase(endpoint, method, data=None):
+def is_success_status(status):
+    return status is not None and 200 <= status < 300
+
+def is_retryable_status(status):
+    """다시 보내면 될 수도 있는 실패인지 (네트워크 오류/시간 초과(None), 5xx, 408, 429).
+    나머지 4xx는 서버가 요청 자체를 받지 않은 것이라 그대로 다시 보내도 소용없음"""
+    return status is None or status >= 500 or status in (408, 429)
+
+async def _fetch_supabase(endpoint, method, data=None, prefer="return=representation"):
+    """(HTTP 상태 코드, 응답 본문)을 반환합니다. 네트워크 오류나 시간 초과로 응답을 못 받으면 (None, None).
+    return=minimal이면 성공해도 본문이 빈 글자입니다."""
     # 200 OK가 검증된 주소 방식 (apikey 주소창 삽입)
     sep = "&" if "?" in endpoint else "?"
     url = f"{config.SUPABASE_URL}/rest/v1/{endpoint}{sep}apikey={config.SUPABASE_KEY}"
@@ -44,8 +70,9 @@ async def _fetch_supabase(endpoint, method, data=None):
             else:
                 js_body_part = "null"
 
-            # 게시판 초기화
-            js.window.js_to_py = "WAITING"
+            # 게시판 초기화 (요청마다 따로: 랭킹 조회와 점수 전송이 동시에 돌아도 답장이 섞이지 않게)
+            slot = f"js_to_py_{next(_request_seq)}"
+            setattr(js.window, slot, "WAITING")
             
             # 자바스크립트 실행 코드 (다리 역할)
             js_worker = f"""
@@ -56,82 +83,98 @@ async def _fetch_supabase(endpoint, method, data=None):
                         'apikey': '{config.SUPABASE_KEY}',
                         'Authorization': 'Bearer {config.SUPABASE_KEY}',
                         'Content-Type': 'application/json',
-                        'Prefer': 'return=representation'
+                        'Prefer': '{prefer}'
                     }},
                     body: {js_body_part}
                 }})
-                .then(r => r.text())
-                .then(txt => {{ window.js_to_py = txt; }})
-                .catch(e => {{ window.js_to_py = "ERROR:" + e.message; }});
+                .then(r => r.text().then(txt => {{ window.{slot} = r.status + "\\n" + txt; }}))
+                .catch(e => {{ window.{slot} = "ERROR:" + e.message; }});
             }})();
             """
             js.window.eval(js_worker)
             
             # 🚩 [타이밍 동기화] 답장이 올 때까지 0.01초씩 쉬면서 감시
             wait_count = 0
-            while str(js.window.js_to_py) == "WAITING":
+            while str(getattr(js.window, slot)) == "WAITING":
                 await asyncio.sleep(0.01) # 네가 말한 미세한 대기
                 wait_count += 1
-                if wait_count > 500: # 5초 타임아웃
-                    return None
+                if wait_count > config.NETWORK_TIMEOUT_SECONDS * 100: # 타임아웃
+                    browser_debug("⏱️ 응답 시간 초과", True)
+                    return None, None
             
-            res_text = str(js.window.js_to_py)
+            res_text = str(getattr(js.window, slot))
+            js.window.eval(f"delete window.{slot};")
             
             if res_text.startswith("ERROR:"):
                 browser_debug(f"❌ 전송 실패: {res_text}", True)
-                return None
-            
-            return res_text
+                return None, None
+
+            status, _, body = res_text.partition("\n") # 첫 줄은 상태 코드
+            status = int(status)
+            if not is_success_status(status):
+                browser_debug(f"❌ 전송 실패: HTTP {status} {body}", True)
+            return status, body
 
         except Exception as e:
             browser_debug(f"🔥 브릿지 치명적 오류: {str(e)}", True)
-            return None
+            return None, None
     else:
         # 로컬(VSC) 환경용 (urllib)
+        # urlopen은 응답이 올 때까지 막히므로 스레드에서 돌림 (게임 루프가 멈추지 않게)
         import urllib.request
-        try:
+        import urllib.error
+        def request():
             req_data = json.dumps(data).encode('utf-8') if data else None
             headers = {
                 "apikey": config.SUPABASE_KEY,
                 "Authorization": f"Bearer {config.SUPABASE_KEY}",
-                "Content-Type": "application/json"
+                "Content-Type": "application/json",
+                "Prefer": prefer
             }
             req = urllib.request.Request(url, data=req_data, headers=headers, method=method)
-            with urllib.request.urlopen(req) as res:
-                return res.read().decode('utf-8')
-        except:
-            return None
+            try:
+                with urllib.request.urlopen(req, timeout=config.NETWORK_TIMEOUT_SECONDS) as res:
+                    return res.status, res.read().decode('utf-8')
+            except urllib.error.HTTPError as e: # 서버가 응답은 함 (4xx/5xx)
+                return e.code, e.read().decode('utf-8', errors='replace')
+        try:
+            status, body = await asyncio.to_thread(request)
+        except Exception as e:
+            browser_debug(f"❌ 전송 실패: {e}", True)
+            return None, None
+        if not is_success_status(status):
+            browser_debug(f"❌ 전송 실패: HTTP {status} {body}", True)
+        return status, body
 
 # ----------------------------------------------------
 # 3. 데이터 로드/저장 로직 (이미 성공한 로직 유지)
 # ----------------------------------------------------
-async def load_rankings_online():
-    browser_debug("📊 서버에서 랭킹 데이터를 불러오는 중...")
-    data_str = await _fetch_supabase("rankings?select=*", 'GET')
-    
-    formatted_list = []
-    if data_str:
-        try:
-            raw_list = json.loads(data_str)
-            browser_debug(f"✅ 수신 성공: {len(raw_list)}명")
-            for row in raw_list:
-                for cat in RANK_CATEGORIES:
-                    # DB 컬럼명 매핑 (모두 소문자인지 꼭 확인!)
-                    db_col = cat.lower().replace("score", "_score").replace("time", "_time")
-                    formatted_list.append({
-                        "ID": row.get("name", "익명"),
-                        "RankCategory": cat,
-                        "RankValue": float(row.get(db_col, 0)),
-                        "Levels": row.get("levels", 0),
-                        "Kills": row.get("kills", 0)
-                    })
-        except Exception as e:
-            browser_debug(f"파싱 실패: {e}", True)
-    return formatted_list
+async def load_rankings_online(category, limit=config.RANKING_TOP_N, offset=0):
+    """카테고리 하나의 상위 limit개(offset부터)를 서버에서 정렬/자르기까지 해서 받아옵니다.
+    필요한 컬럼만 요청하므로 테이블이 커져도 받는 양은 그대로입니다. 실패하면 None"""
+    db_col = RANK_COLUMNS[category]
+    columns = ",".join(dict.fromkeys(("name", "levels", "kills", db_col))) # 같은 컬럼은 한 번만
+    browser_debug(f"📊 서버에서 랭킹 데이터를 불러오는 중... ({category} {offset + 1}~{offset + limit}위)")
+    status, data_str = await _fetch_supabase(
+        f"rankings?select={columns}&order={db_col}.desc.nullslast&limit={int(limit)}&offset={int(offset)}", 'GET')
+    if not is_success_status(status) or not data_str: return None
+    try:
+        raw_list = json.loads(data_str)
+        browser_debug(f"✅ 수신 성공: {len(raw_list)}명")
+        return [{
+            "ID": row.get("name") or "익명",
+            "RankCategory": category,
+            "RankValue": float(row.get(db_col) or 0),
+            "Levels": row.get("levels") or 0,
+            "Kills": row.get("kills") or 0,
+        } for row in raw_list]
+    except Exception as e:
+        browser_debug(f"파싱 실패: {e}", True)
+        return None
 
-async def save_new_ranking_online(name, score_data):
-    browser_debug(f"💾 서버에 점수 기록 중: {name}")
-    new_row = {
+def build_ranking_row(name, score_data):
+    """서버 rankings 테이블에 넣을 행 하나"""
+    return {
         "name": str(name),
         "levels": int(score_data.get('levels', 0)),
         "kills": int(score_data.get('kills', 0)),
@@ -139,12 +182,24 @@ async def save_new_ranking_online(name, score_data):
         "difficulty_score": float(score_data.get('difficulty_score', 0.0)),
         "survival_time": float(score_data.get('survival_time', 0.0))
     }
-    # 🚩 POST 요청 후 결과 받기
-    res = await _fetch_supabase("rankings", 'POST', data=new_row)
-    if res:
+
+async def save_rankings_online(rows, dedup=True):
+    """여러 행을 POST 한 번으로 올립니다. HTTP 상태 코드를 반환합니다. (응답을 못 받으면 None)
+    dedup이면 각 행의 중복 방지 키(config.SCORE_DEDUP_COLUMN)가 이미 서버에 있는 행은 건너뜁니다.
+    (시간 초과로 실패한 줄 알았던 요청이 사실 들어갔어도 다시 보낼 때 두 번 들어가지 않음)
+    dedup=False는 키를 빼고 그냥 넣습니다. (테이블에 키 컬럼/unique 제약이 없을 때)"""
+    browser_debug(f"💾 서버에 점수 {len(rows)}개 기록 중")
+    if dedup:
+        endpoint = f"rankings?on_conflict={config.SCORE_DEDUP_COLUMN}"
+        prefer = "resolution=ignore-duplicates,return=minimal"
+    else:
+        endpoint = "rankings"
+        prefer = "return=minimal"
+        rows = [{k: v for k, v in r.items() if k != config.SCORE_DEDUP_COLUMN} for r in rows]
+    status, _ = await _fetch_supabase(endpoint, 'POST', data=rows, prefer=prefer)
+    if is_success_status(status):
         browser_debug("🎉 서버 저장 성공!")
-        return True
-    return False
+    return status
 
 # ----------------------------------------------------
 # 4. 물리 계산 유틸리티 (수정 금지)
@@ -159,4 +214,102 @@ def get_wrapped_delta(val1, val2, map_dim):
 def distance_sq_wrapped(x1, y1, x2, y2, map_w, map_h):
     dx = get_wrapped_delta(x1, x2, map_w)
     dy = get_wrapped_delta(y1, y2, map_h)
-    return dx*dx + dy*dy
\ No newline at end of file
+    return dx*dx + dy*dy
+
+# ----------------------------------------------------
+# 5. 일괄(배치) 래핑 거리 계산
+#    numpy가 있으면 배열 연산, 없으면 위 함수들로 한 쌍씩 계산합니다.
+#    선택 결과(인덱스)는 항상 파이썬 리스트로 돌려줍니다.
+# ----------------------------------------------------
+def wrapped_deltas(x, y, xs, ys, map_w, map_h):
+    """한 점 (x, y)에서 여러 점 (xs, ys)까지의 래핑 델타 (dx 배열, dy 배열)"""
+    if np is None:
+        return [get_wrapped_delta(x, px, map_w) for px in xs], [get_wrapped_delta(y, py, map_h) for py in ys]
+    dx = np.asarray(xs, dtype=np.float64) - x
+    dx[dx > map_w / 2] -= map_w
+    dx[dx < -map_w / 2] += map_w
+    dy = np.asarray(ys, dtype=np.float64) - y
+    dy[dy > map_h / 2] -= map_h
+    dy[dy < -map_h / 2] += map_h
+    return dx, dy
+
+def distances_sq_wrapped(x, y, xs, ys, map_w, map_h):
+    """한 점에서 여러 점까지의 래핑 거리 제곱 배열"""
+    dx, dy = wrapped_deltas(x, y, xs, ys, map_w, map_h)
+    if np is None:
+        return [a*a + b*b for a, b in zip(dx, dy)]
+    return dx*dx + dy*dy
+
+def indices_within_wrapped(x, y, xs, ys, radii, map_w, map_h):
+    """한 점과의 거리가 반경보다 가까운 점들의 인덱스 리스트 (radii는 숫자 하나 또는 점마다 하나)"""
+    d_sq = distances_sq_wrapped(x, y, xs, ys, map_w, map_h)
+    if np is None:
+        if isinstance(radii, (int, float)):
+            return [i for i, d in enumerate(d_sq) if d < radii*radii]
+        return [i for i, (d, r) in enumerate(zip(d_sq, radii)) if d < r*r]
+    r = np.asarray(radii, dtype=np.float64)
+    return np.flatnonzero(d_sq < r*r).tolist()
+
+def nearest_k_wrapped(x, y, xs, ys, k, map_w, map_h):
+    """가까운 순서대로 최대 k개의 인덱스 리스트"""
+    d_sq = distances_sq_wrapped(x, y, xs, ys, map_w, map_h)
+    n = len(d_sq)
+    if k <= 0 or n == 0: return []
+    if np is None:
+        return sorted(range(n), key=d_sq.__getitem__)[:k]
+    if k >= n:
+        return np.argsort(d_sq, kind='stable').tolist()
+    idx = np.argpartition(d_sq, k - 1)[:k]
+    return idx[np.argsort(d_sq[idx], kind='stable')].tolist()
+
+def pairs_within_wrapped(ax, ay, a_radii, bx, by, b_radii, map_w, map_h):
+    """a 점들과 b 점들의 모든 쌍(N×M) 중 거리가 두 반경의 합보다 가까운 (i, j) 리스트 (i, j 순으로 정렬됨)
+    쌍 수만큼 메모리를 쓰므로 b는 그리드 등으로 a 근처 후보만 골라 넘기세요."""
+    if np is None:
+        return [(i, j) for i, (x, y, ra) in enumerate(zip(ax, ay, a_radii))
+                for j, (px, py, rb) in enumerate(zip(bx, by, b_radii))
+                if distance_sq_wrapped(x, y, px, py, map_w, map_h) < (ra + rb) * (ra + rb)]
+    if len(ax) == 0 or len(bx) == 0: return []
+    dx = np.asarray(bx, dtype=np.float64)[None, :] - np.asarray(ax, dtype=np.float64)[:, None]
+    dx[dx > map_w / 2] -= map_w
+    dx[dx < -map_w / 2] += map_w
+    dy = np.asarray(by, dtype=np.float64)[None, :] - np.asarray(ay, dtype=np.float64)[:, None]
+    dy[dy > map_h / 2] -= map_h
+    dy[dy < -map_h / 2] += map_h
+    r = np.asarray(a_radii, dtype=np.float64)[:, None] + np.asarray(b_radii, dtype=np.float64)[None, :]
+    i, j = np.nonzero(dx*dx + dy*dy < r*r)
+    return list(zip(i.tolist(), j.tolist()))
+
+def move_towards_wrapped(xs, ys, target_x, target_y, speed, map_w, map_h):
+    """여러 점을 목표 쪽으로 speed만큼 이동. 이번에 도착한(거리 < speed) 점은 목표 위치로 붙습니다.
+    (새 xs 리스트, 새 ys 리스트, 도착한 인덱스 리스트)를 반환합니다."""
+    if np is None:
+        new_xs, new_ys, arrived = [], [], []
+        for i, (x, y) in enumerate(zip(xs, ys)):
+            dist = math.sqrt(distance_sq_wrapped(x, y, target_x, target_y, map_w, map_h))
+            if dist < speed:
+                x, y = target_x, target_y
+                arrived.append(i)
+            elif dist > 0:
+                x += (get_wrapped_delta(x, target_x, map_w) / dist) * speed
+                y += (get_wrapped_delta(y, target_y, map_h) / dist) * speed
+            new_xs.append(x % map_w)
+            new_ys.append(y % map_h)
+        return new_xs, new_ys, arrived
+
+    x = np.asarray(xs, dtype=np.float64)
+    y = np.asarray(ys, dtype=np.float64)
+    dx = target_x - x
+    dx[dx > map_w / 2] -= map_w
+    dx[dx < -map_w / 2] += map_w
+    dy = target_y - y
+    dy[dy > map_h / 2] -= map_h
+    dy[dy < -map_h / 2] += map_h
+    dist = np.sqrt(dx*dx + dy*dy)
+    arrive = dist < speed
+    move = ~arrive & (dist > 0)
+    ux = np.divide(dx, dist, out=np.zeros(len(x)), where=move)
+    uy = np.divide(dy, dist, out=np.zeros(len(y)), where=move)
+    new_x = np.where(arrive, target_x, np.where(move, x + ux * speed, x)) % map_w
+    new_y = np.where(arrive, target_y, np.where(move, y + uy * speed, y)) % map_h
+    return new_x.tolist(), new_y.tolist(), np.flatnonzero(arrive).tolist()
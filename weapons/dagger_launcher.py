@@ -5,8 +5,9 @@ import pygame
 import config
 import utils
 from weapons.base_weapon import Weapon
-from entities.dagger import Dagger 
-from core.grid import enemy_grid # 🟢 그리드 엔진 임포트 추가
+from entities.dagger import dagger_pool
+from core.pool import find_handle
+from core.grid import world_grid # 🟢 그리드 엔진 임포트 추가
 
 class DaggerLauncher(Weapon):
     def __init__(self, player_ref):
@@ -16,8 +17,8 @@ class DaggerLauncher(Weapon):
         self.cooldown = config.PLAYER_ATTACK_COOLDOWN
         self.attack_timer = 0
         self.num_daggers_per_shot = 1
-        # 🟢 단검의 타겟팅 탐지 거리 (2칸 청크 정도면 충분)
-        self.target_search_radius_cells = 2
+        # 🟢 단검의 타겟팅 탐지 거리 (px, 청크 2칸 정도면 충분)
+        self.target_search_radius = 500
 
     def update(self, slimes_list, game_entities_lists):
         daggers_list_ref = game_entities_lists.get('daggers')
@@ -30,8 +31,8 @@ class DaggerLauncher(Weapon):
             player_wx,player_wy = self.player.world_x,self.player.world_y
             
             # 🟢 1. 그리드 엔진을 사용하여 플레이어 주변 적만 가져오기
-            # 전체 맵의 적이 아니라, 주변 2칸 청크의 적들만!
-            nearby_enemies = enemy_grid.get_nearby_enemies(player_wx, player_wy, self.target_search_radius_cells)
+            # 전체 맵의 적이 아니라, 탐지 반경 안에 걸치는 적들만!
+            nearby_enemies = world_grid.get_enemies_in_radius(player_wx, player_wy, self.target_search_radius)
             
             # 2. 살아있는 적들만 필터링
             living_slimes = [s for s in nearby_enemies if s.hp > 0]
@@ -43,14 +44,16 @@ class DaggerLauncher(Weapon):
                 # 3. 주변 적이 발사할 단검 수보다 적다면 모두 타겟으로 지정
                 targets_to_shoot.extend(living_slimes)
             else:
-                # 4. 주변 적들만 대상으로 거리를 계산하고, 가까운 순서대로 단검 수만큼 타겟 지정
-                sorted_slimes = sorted(living_slimes,key=lambda s:utils.distance_sq_wrapped(player_wx,player_wy,s.world_x,s.world_y,config.MAP_WIDTH,config.MAP_HEIGHT))
-                targets_to_shoot.extend(sorted_slimes[:self.num_daggers_per_shot])
+                # 4. 주변 적들만 대상으로 거리를 일괄 계산하고, 가까운 순서대로 단검 수만큼 타겟 지정
+                nearest = utils.nearest_k_wrapped(player_wx, player_wy, [s.world_x for s in living_slimes], [s.world_y for s in living_slimes],
+                                                  self.num_daggers_per_shot, config.MAP_WIDTH, config.MAP_HEIGHT)
+                targets_to_shoot.extend(living_slimes[i] for i in nearest)
                 
-            # 5. 타겟팅된 적들에게 단검 발사
+            # 5. 타겟팅된 적들에게 단검 발사 (목표는 객체 대신 적 풀의 핸들로 넘김)
+            enemy_pools = (game_entities_lists['slimes'], game_entities_lists['boss_slimes'])
             for target_slime_for_dagger in targets_to_shoot:
                 if target_slime_for_dagger:
-                    daggers_list_ref.append(Dagger(player_wx,player_wy,target_slime_for_dagger,self.damage))
+                    daggers_list_ref.append(dagger_pool.acquire(player_wx,player_wy,find_handle(enemy_pools, target_slime_for_dagger),self.damage))
 
     # ... (이하 get_level_up_options, apply_upgrade, draw 함수는 동일하므로 생략)
     def get_level_up_options(self):
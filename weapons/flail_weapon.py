@@ -5,6 +5,7 @@ import pygame
 import config
 import utils
 from weapons.base_weapon import Weapon
+from core.grid import world_grid
 
 class FlailWeapon(Weapon):
     def __init__(self, player_ref):
@@ -37,45 +38,29 @@ class FlailWeapon(Weapon):
         for s_rem in slimes_to_remove_from_cooldown:
             if s_rem in self.hit_cooldowns: del self.hit_cooldowns[s_rem]
 
-        all_slimes = slimes_list + game_entities_lists.get('boss_slimes', [])
-        for slime in all_slimes:
+        # 🚩 전체 슬라임 대신 철퇴 머리에 닿는 적만 검사
+        for slime in world_grid.iter_enemies_in_radius(self.head_world_x,self.head_world_y,self.head_radius):
             if slime.hp<=0:
                 if slime in self.hit_cooldowns: del self.hit_cooldowns[slime]
                 continue
             if slime in self.hit_cooldowns: continue
-            dist_sq=utils.distance_sq_wrapped(self.head_world_x,self.head_world_y,slime.world_x,slime.world_y,config.MAP_WIDTH,config.MAP_HEIGHT)
-            if dist_sq<(self.head_radius+slime.radius)**2:
-                if slime.take_damage(self.damage):
-                    if slime in self.hit_cooldowns: del self.hit_cooldowns[slime]
-                self.hit_cooldowns[slime]=config.FPS//3
-                impact_angle=math.atan2(utils.get_wrapped_delta(self.head_world_y,slime.world_y,config.MAP_HEIGHT),utils.get_wrapped_delta(self.head_world_x,slime.world_x,config.MAP_WIDTH))
-                self.angle=impact_angle+math.pi; self.current_rotation_speed*=-0.7; break
+            if slime.take_damage(self.damage):
+                if slime in self.hit_cooldowns: del self.hit_cooldowns[slime]
+            self.hit_cooldowns[slime]=config.FPS//3
+            impact_angle=math.atan2(utils.get_wrapped_delta(self.head_world_y,slime.world_y,config.MAP_HEIGHT),utils.get_wrapped_delta(self.head_world_x,slime.world_x,config.MAP_WIDTH))
+            self.angle=impact_angle+math.pi; self.current_rotation_speed*=-0.7; break
 
-        slime_bullets_list_ref = game_entities_lists.get('slime_bullets')
-        if slime_bullets_list_ref:
-            for sb in slime_bullets_list_ref:
-                if sb.is_hit_by_player_attack: continue
-                dist_sq_bullet = utils.distance_sq_wrapped(self.head_world_x, self.head_world_y, sb.world_x, sb.world_y, config.MAP_WIDTH, config.MAP_HEIGHT)
-                if dist_sq_bullet < (self.head_radius + sb.size)**2:
-                    sb.is_hit_by_player_attack = True
+        for sb in world_grid.iter_radius('enemy_bullets', self.head_world_x, self.head_world_y, self.head_radius):
+            if not sb.is_hit_by_player_attack:
+                sb.is_hit_by_player_attack = True
 
     def draw(self, surface, camera_offset_x, camera_offset_y):
         player_screen_x,player_screen_y=config.SCREEN_WIDTH//2,config.SCREEN_HEIGHT//2
-        min_dist_sq,closest_head_sx,closest_head_sy=float('inf'),0,0
-        for dx_off in [-config.MAP_WIDTH,0,config.MAP_WIDTH]:
-            for dy_off in [-config.MAP_HEIGHT,0,config.MAP_HEIGHT]:
-                h_wx_cand,h_wy_cand=self.head_world_x+dx_off,self.head_world_y+dy_off
-                h_sx_cand,h_sy_cand=h_wx_cand-camera_offset_x,h_wy_cand-camera_offset_y
-                cur_d_sq=(h_sx_cand-player_screen_x)**2+(h_sy_cand-player_screen_y)**2
-                if cur_d_sq<min_dist_sq: min_dist_sq=cur_d_sq; closest_head_sx,closest_head_sy=h_sx_cand,h_sy_cand
-        pygame.draw.line(surface,config.FLAIL_CHAIN_COLOR,(player_screen_x,player_screen_y),(int(closest_head_sx),int(closest_head_sy)),2)
-        for dx_off in [-config.MAP_WIDTH,0,config.MAP_WIDTH]:
-            for dy_off in [-config.MAP_HEIGHT,0,config.MAP_HEIGHT]:
-                obj_wx_render,obj_wy_render=self.head_world_x+dx_off,self.head_world_y+dy_off
-                sx_render,sy_render=obj_wx_render-camera_offset_x,obj_wy_render-camera_offset_y
-                if -self.head_radius*2<sx_render<config.SCREEN_WIDTH+self.head_radius*2 and \
-                   -self.head_radius*2<sy_render<config.SCREEN_HEIGHT+self.head_radius*2:
-                    pygame.draw.circle(surface,config.FLAIL_HEAD_COLOR,(int(sx_render),int(sy_render)),self.head_radius)
+        # 머리는 늘 플레이어 근처라 화면 중심에서 가장 가까운 래핑 위치 하나만 쓰면 됨
+        head_sx=player_screen_x+utils.get_wrapped_delta(camera_offset_x+player_screen_x,self.head_world_x,config.MAP_WIDTH)
+        head_sy=player_screen_y+utils.get_wrapped_delta(camera_offset_y+player_screen_y,self.head_world_y,config.MAP_HEIGHT)
+        pygame.draw.line(surface,config.FLAIL_CHAIN_COLOR,(player_screen_x,player_screen_y),(int(head_sx),int(head_sy)),2)
+        pygame.draw.circle(surface,config.FLAIL_HEAD_COLOR,(int(head_sx),int(head_sy)),self.head_radius)
     def get_level_up_options(self):
         options=[{"text":f"데미지 ({self.damage} -> {math.ceil(self.damage*config.FLAIL_DAMAGE_MULTIPLIER_PER_LEVEL)})","type":"damage","value":math.ceil(self.damage*config.FLAIL_DAMAGE_MULTIPLIER_PER_LEVEL)},
                  {"text":f"길이 ({self.chain_length} -> {self.chain_length+10})","type":"chain_length","value":self.chain_length+10},
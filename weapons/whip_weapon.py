@@ -4,7 +4,7 @@ import pygame
 import config
 import utils
 from weapons.base_weapon import Weapon
-from core.grid import enemy_grid
+from core.grid import world_grid
 
 class WhipWeapon(Weapon):
     def __init__(self, player_ref):
@@ -23,7 +23,7 @@ class WhipWeapon(Weapon):
         
         self.start_angle = 0 # 이번 공격의 시작 각도
         self.hit_slimes_this_attack = set() # 이번 휘두르기에 이미 맞은 적들 목록
-        self.target_search_radius_cells = 1 
+        self.target_search_radius = 250 # 조준용 적 탐색 반경 (px)
 
     def update(self, slimes_list, game_entities_lists):
         self.attack_timer += 1
@@ -31,14 +31,12 @@ class WhipWeapon(Weapon):
         # 1. 공격 시작 판단 (쿨타임 끝났을 때)
         if self.attack_timer >= self.cooldown and not self.is_attacking:
             player_wx, player_wy = self.player.world_x, self.player.world_y
-            nearby = enemy_grid.get_nearby_enemies(player_wx, player_wy, self.target_search_radius_cells)
+            nearby = world_grid.get_enemies_in_radius(player_wx, player_wy, self.target_search_radius)
             
             # 조준 로직: 가장 가까운 적 방향으로 휘두르기 시작
-            closest_s, min_d2 = None, float('inf')
-            for s in nearby:
-                if s.hp <= 0: continue
-                d2 = utils.distance_sq_wrapped(player_wx, player_wy, s.world_x, s.world_y, config.MAP_WIDTH, config.MAP_HEIGHT)
-                if d2 < min_d2: min_d2 = d2; closest_s = s
+            living = [s for s in nearby if s.hp > 0]
+            nearest = utils.nearest_k_wrapped(player_wx, player_wy, [s.world_x for s in living], [s.world_y for s in living], 1, config.MAP_WIDTH, config.MAP_HEIGHT)
+            closest_s = living[nearest[0]] if nearest else None
             
             if closest_s:
                 dx = utils.get_wrapped_delta(player_wx, closest_s.world_x, config.MAP_WIDTH)
@@ -74,7 +72,8 @@ class WhipWeapon(Weapon):
             current_line_angle = self.start_angle + (self.attack_angle_range * progress)
             
             player_wx, player_wy = self.player.world_x, self.player.world_y
-            nearby = enemy_grid.get_nearby_enemies(player_wx, player_wy, self.target_search_radius_cells)
+            # 넉백이 그리드를 바꾸므로 제너레이터 대신 리스트로 받음
+            nearby = world_grid.get_enemies_in_radius(player_wx, player_wy, self.attack_reach + 20, use_extent=False)
             
             # 현재 채찍 선의 방향 벡터 (길이 1인 단위 벡터)
             line_vec_x = math.cos(current_line_angle)
@@ -106,10 +105,10 @@ class WhipWeapon(Weapon):
                         # 넉백 처리
                         s.world_x = (s.world_x + line_vec_x * self.knockback_strength) % config.MAP_WIDTH
                         s.world_y = (s.world_y + line_vec_y * self.knockback_strength) % config.MAP_HEIGHT
+                        world_grid.update_enemy(s) # 넉백으로 청크가 바뀌었을 수 있음
 
             # 적 발사체도 선에 닿으면 지워버리기
-            bullets = game_entities_lists.get('slime_bullets', [])
-            for sb in bullets:
+            for sb in world_grid.iter_radius('enemy_bullets', player_wx, player_wy, self.attack_reach + 20, use_extent=False):
                 if sb.is_hit_by_player_attack: continue
                 bdx = utils.get_wrapped_delta(player_wx, sb.world_x, config.MAP_WIDTH)
                 bdy = utils.get_wrapped_delta(player_wy, sb.world_y, config.MAP_HEIGHT)